@@ -67,3 +67,13 @@ class AdminController(QObject):
         """Reject a pending user."""
         self.user_manager.reject_user(user_id)
         self.users_updated.emit()
+
+    def approve_users(self, user_ids: list):
+        """Approve several pending users with a single commit."""
+        self.user_manager.approve_users(user_ids)
+        self.users_updated.emit()
+
+    def reject_users(self, user_ids: list):
+        """Reject several pending users with a single commit."""
+        self.user_manager.reject_users(user_ids)
+        self.users_updated.emit()
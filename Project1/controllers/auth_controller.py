@@ -5,6 +5,7 @@ Authentication Controller: Login, Register, Session Management.
 """
 from PyQt6.QtCore import QObject, pyqtSignal
 from model.user_manager import UserManager
+from controllers.task_runner import TaskRunner
 
 class AuthController(QObject):
     """Handles authentication flows."""
@@ -14,11 +15,23 @@ class AuthController(QObject):
     login_failed = pyqtSignal(str)    # Emits error message
     register_success = pyqtSignal()
     register_failed = pyqtSignal(str)
+    login_busy = pyqtSignal(bool)     # Credentials are being checked
+    register_busy = pyqtSignal(bool)  # Registration is being submitted
     
     def __init__(self):
         super().__init__()
         self.user_manager = UserManager()
         self.current_user = None
+        
+        # bcrypt hashing runs off the GUI thread
+        self.task_runner = TaskRunner(self)
+        self.task_runner.running_changed.connect(self._on_running_changed)
+
+    def _on_running_changed(self, key: str, running: bool):
+        if key == 'login':
+            self.login_busy.emit(running)
+        elif key == 'register':
+            self.register_busy.emit(running)
 
     def login(self, username: str, password: str):
         """Attempt to login."""
@@ -26,8 +39,13 @@ class AuthController(QObject):
             self.login_failed.emit("Please enter username and password")
             return
         
-        user = self.user_manager.login(username, password)
-        
+        self.task_runner.submit(
+            'login', self.user_manager.login, username, password,
+            on_result=self._on_login_result,
+            on_error=self.login_failed.emit
+        )
+
+    def _on_login_result(self, user: dict):
         if user:
             if user['role'] == 'pending':
                 self.login_failed.emit("Your account is pending admin approval")
@@ -54,8 +72,14 @@ class AuthController(QObject):
             return
         
         # Attempt registration
-        result = self.user_manager.register(username, password, email, phone, address)
-        
+        self.task_runner.submit(
+            'register', self.user_manager.register,
+            username, password, email, phone, address,
+            on_result=self._on_register_result,
+            on_error=self.register_failed.emit
+        )
+
+    def _on_register_result(self, result: dict):
         if result:
             self.register_success.emit()
         else:
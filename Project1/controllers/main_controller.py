@@ -2,27 +2,31 @@
 # controllers/main_controller.py
 """
 Main Controller: Orchestrates the application flow.
+Views other than the login screen are imported and built the first
+time they are needed.
 """
+import time
 from PyQt6.QtWidgets import QMessageBox, QStackedWidget
-from PyQt6.QtCore import QObject
+from PyQt6.QtCore import QObject, pyqtSignal
 
-from model.item_manager import ItemManager
+from model.item_manager import ItemManager, DEFAULT_PAGE_SIZE
 from model.item_type_manager import ItemTypeManager
 from model.user_manager import UserManager
 
 from controllers.auth_controller import AuthController
 from controllers.admin_controller import AdminController
+from controllers.task_runner import TaskRunner
+from controllers.startup_timing import startup_timer
 
-from views.main_window import MainWindow
 from views.login_dialog import LoginDialog
-from views.register_dialog import RegisterDialog
-from views.admin_panel import AdminPanel
-from views.add_item_dialog import AddItemDialog
-from views.item_detail_dialog import ItemDetailDialog
 
 class MainController(QObject):
     """Main application controller."""
     
+    # Re-emit ItemManager events on the GUI thread (they fire on workers)
+    item_added = pyqtSignal(dict)
+    item_removed = pyqtSignal(int)
+    
     def __init__(self, stacked_widget: QStackedWidget):
         super().__init__()
         
@@ -33,37 +37,83 @@ class MainController(QObject):
         self.type_manager = ItemTypeManager()
         self.user_manager = UserManager()
         
+        # Listing currently shown in the main window: (type_id, keyword) and
+        # the keyset cursor of its last loaded page
+        self._list_query = None
+        self._list_cursor = None
+        # Items loaded so far for _list_query, and whether that is all of them;
+        # a complete listing lets a longer search keyword be answered in memory
+        self._loaded_items = []
+        self._loaded_complete = False
+        
         # Controllers
         self.auth_controller = AuthController()
         self.admin_controller = AdminController()
         
-        # Views
-        self.login_dialog = LoginDialog()
-        self.register_dialog = RegisterDialog()
-        self.main_window = MainWindow()
-        self.admin_panel = AdminPanel()
+        # Background workers for database calls
+        self.task_runner = TaskRunner(self)
         
-        # Add views to stack
-        self.stack.addWidget(self.login_dialog)
-        self.stack.addWidget(self.register_dialog)
-        self.stack.addWidget(self.main_window)
-        self.stack.addWidget(self.admin_panel)
+        # Views: only the login screen is built up front, the others on
+        # first use through the properties below
+        self.login_dialog = self._build_view("LoginDialog", LoginDialog)
+        self._register_dialog = None
+        self._main_window = None
+        self._admin_panel = None
         
         # Connect signals
         self._connect_auth_signals()
-        self._connect_main_signals()
-        self._connect_admin_signals()
+        self._connect_admin_controller_signals()
+        self.task_runner.running_changed.connect(self._on_task_running_changed)
+        ItemManager.item_added.connect(self.item_added.emit)
+        ItemManager.item_removed.connect(self.item_removed.emit)
+        self.item_added.connect(self._on_item_added)
+        self.item_removed.connect(self._on_item_removed)
+
+    def _build_view(self, name: str, factory):
+        """Construct a view, add it to the stack and record how long it took."""
+        started = time.perf_counter()
+        view = factory()
+        self.stack.addWidget(view)
+        startup_timer.record(f"construct {name}", time.perf_counter() - started)
+        return view
+
+    @property
+    def register_dialog(self):
+        if self._register_dialog is None:
+            from views.register_dialog import RegisterDialog
+            self._register_dialog = self._build_view("RegisterDialog", RegisterDialog)
+            self._connect_register_signals()
+        return self._register_dialog
+
+    @property
+    def main_window(self):
+        if self._main_window is None:
+            from views.main_window import MainWindow
+            self._main_window = self._build_view("MainWindow", MainWindow)
+            self._connect_main_signals()
+        return self._main_window
+
+    @property
+    def admin_panel(self):
+        if self._admin_panel is None:
+            from views.admin_panel import AdminPanel
+            self._admin_panel = self._build_view("AdminPanel", AdminPanel)
+            self._connect_admin_signals()
+        return self._admin_panel
 
     def _connect_auth_signals(self):
         self.login_dialog.login_requested.connect(self.auth_controller.login)
         self.login_dialog.register_requested.connect(self.show_register)
         self.auth_controller.login_success.connect(self.on_login_success)
         self.auth_controller.login_failed.connect(self.login_dialog.show_error)
-        
+        self.auth_controller.login_busy.connect(self.login_dialog.set_busy)
+
+    def _connect_register_signals(self):
         self.register_dialog.register_requested.connect(self.auth_controller.register)
         self.register_dialog.back_to_login.connect(self.show_login)
         self.auth_controller.register_success.connect(self.register_dialog.show_success)
         self.auth_controller.register_failed.connect(self.register_dialog.show_error)
+        self.auth_controller.register_busy.connect(self.register_dialog.set_busy)
 
     def _connect_main_signals(self):
         self.main_window.logout_requested.connect(self.on_logout)
@@ -73,6 +123,7 @@ class MainController(QObject):
         self.main_window.add_item_requested.connect(self.show_add_item_dialog)
         self.main_window.delete_item_requested.connect(self.handle_delete_item)
         self.main_window.item_detail_requested.connect(self.show_item_detail)
+        self.main_window.load_more_requested.connect(self.load_more_items)
 
     def _connect_admin_signals(self):
         self.admin_panel.back_requested.connect(self.show_main_window)
@@ -81,7 +132,10 @@ class MainController(QObject):
         self.admin_panel.type_deleted.connect(self.admin_controller.delete_type)
         self.admin_panel.user_approved.connect(self.admin_controller.approve_user)
         self.admin_panel.user_rejected.connect(self.admin_controller.reject_user)
-        
+        self.admin_panel.users_approved.connect(self.admin_controller.approve_users)
+        self.admin_panel.users_rejected.connect(self.admin_controller.reject_users)
+
+    def _connect_admin_controller_signals(self):
         self.admin_controller.types_updated.connect(self.refresh_admin_types)
         self.admin_controller.users_updated.connect(self.refresh_admin_users)
         self.admin_controller.error_occurred.connect(
@@ -93,6 +147,11 @@ class MainController(QObject):
         self.stack.setCurrentWidget(self.login_dialog)
         self.stack.show()
 
+    def wait_for_tasks(self):
+        """Block until every background task is done (on shutdown, before db.close)."""
+        self.task_runner.wait_for_done()
+        self.auth_controller.task_runner.wait_for_done()
+
     def on_login_success(self, user: dict):
         self.login_dialog.clear_inputs()
         self.main_window.set_current_user(user)
@@ -118,21 +177,140 @@ class MainController(QObject):
         self.main_window.set_item_types(types)
         self.stack.setCurrentWidget(self.main_window)
 
+    def _on_task_running_changed(self, key: str, running: bool):
+        if key == 'items':
+            self.main_window.set_loading(running)
+
+    def _show_task_error(self, message: str):
+        QMessageBox.warning(self.stack.currentWidget(), "Error", f"Database error: {message}")
+
+    def _on_items_error(self, message: str):
+        """A listing page failed to load; let the grid request pages again."""
+        self.main_window.load_more_failed()
+        self._show_task_error(message)
+
     def load_items_by_type(self, type_id: int):
-        items = self.item_manager.get_items_by_type(type_id)
-        self.main_window.update_view(items)
+        self._start_listing((type_id, None))
 
     def handle_search(self, type_id: int, keyword: str):
+        query = (type_id, keyword or None)
+        narrowed = self._narrow_loaded_items(query)
+        if narrowed is not None:
+            # Drop any superseded query still in flight
+            self.task_runner.cancel('items')
+            self._list_query = query
+            self._list_cursor = self.item_manager.next_cursor(narrowed)
+            self._loaded_items = narrowed
+            self.main_window.update_view(narrowed, has_more=False)
+            return
+        self._start_listing(query)
+
+    def _narrow_loaded_items(self, query: tuple):
+        """
+        Filter the loaded listing for a keyword that extends the current one.
+        Every match for the new keyword also matched the old one, so when
+        the old listing is fully loaded no query is needed.
+        Returns None when the database has to be asked.
+        """
+        if self._list_query is None or not self._loaded_complete:
+            return None
+        if self.task_runner.is_running('items'):
+            return None
+        type_id, keyword = query
+        loaded_type_id, loaded_keyword = self._list_query
+        if not keyword or type_id != loaded_type_id:
+            return None
+        if loaded_keyword and loaded_keyword.casefold() not in keyword.casefold():
+            return None
+        
+        needle = keyword.casefold()
+        return [
+            item for item in self._loaded_items
+            if needle in (item['name'] or '').casefold()
+            or needle in (item['description'] or '').casefold()
+        ]
+
+    def _start_listing(self, query: tuple):
+        """Load the first page of a listing; supersedes any in-flight load."""
+        self._list_query = query
+        self._list_cursor = None
+        self._loaded_items = []
+        self._loaded_complete = False
+        self.task_runner.submit(
+            'items', self._fetch_page, query, None,
+            on_result=self._on_first_page_loaded,
+            on_error=self._on_items_error
+        )
+
+    def _on_first_page_loaded(self, items: list):
+        self._list_cursor = self.item_manager.next_cursor(items)
+        self._loaded_items = list(items)
+        self._loaded_complete = len(items) < DEFAULT_PAGE_SIZE
+        self.main_window.update_view(items, has_more=len(items) == DEFAULT_PAGE_SIZE)
+
+    def load_more_items(self):
+        """Append the next page of the current listing."""
+        if self.task_runner.is_running('items'):
+            return  # The page in flight resets the grid's request when it lands
+        if self._list_query is None:
+            self.main_window.load_more_failed()
+            return
+        self.task_runner.submit(
+            'items', self._fetch_page, self._list_query, self._list_cursor,
+            on_result=self._on_next_page_loaded,
+            on_error=self._on_items_error
+        )
+
+    def _on_next_page_loaded(self, items: list):
+        has_more = len(items) == DEFAULT_PAGE_SIZE
+        if items:
+            self._list_cursor = self.item_manager.next_cursor(items)
+        # Ranked pages can overlap if scores shifted between loads
+        loaded = {item['id'] for item in self._loaded_items}
+        items = [item for item in items if item['id'] not in loaded]
+        self._loaded_items.extend(items)
+        self._loaded_complete = not has_more
+        self.main_window.append_items(items, has_more=has_more)
+
+    def _fetch_page(self, query: tuple, cursor):
+        """Runs on a worker thread."""
+        type_id, keyword = query
         if keyword:
-            items = self.item_manager.search_items(type_id, keyword)
-        else:
-            items = self.item_manager.get_items_by_type(type_id)
-        self.main_window.update_view(items)
+            return self.item_manager.search_items(
+                type_id, keyword, page_size=DEFAULT_PAGE_SIZE, cursor=cursor
+            )
+        return self.item_manager.get_items_by_type(
+            type_id, page_size=DEFAULT_PAGE_SIZE, cursor=cursor
+        )
+
+    def _on_item_added(self, item: dict):
+        """Show a new item in place when it belongs in the current listing."""
+        if self._main_window is None or self._list_query is None:
+            return
+        type_id, keyword = self._list_query
+        if item['type_id'] != type_id:
+            return
+        if keyword or self.task_runner.is_running('items'):
+            # Whether it matches the search (or the page in flight) is for
+            # the database to say
+            self._start_listing(self._list_query)
+            return
+        # Listings are newest first, so a new item goes on top; the keyset
+        # cursor still points after the last loaded item
+        self._loaded_items.insert(0, item)
+        self.main_window.insert_item(item)
+
+    def _on_item_removed(self, item_id: int):
+        if self._main_window is None:
+            return
+        self._loaded_items = [item for item in self._loaded_items if item['id'] != item_id]
+        self.main_window.remove_item(item_id)
 
     def show_item_detail(self, item_id: int):
         """Show item detail dialog."""
         item_data = self.main_window.get_item_data(item_id)
         if item_data:
+            from views.item_detail_dialog import ItemDetailDialog
             dialog = ItemDetailDialog(item_data, self.main_window)
             dialog.exec()
 
@@ -145,12 +323,16 @@ class MainController(QObject):
             )
             return
         
+        from views.add_item_dialog import AddItemDialog
         dialog = AddItemDialog(self.main_window, types)
         if dialog.exec():
             data = dialog.get_data()
             user = self.auth_controller.get_current_user()
             
-            self.item_manager.add_item(
+            # The grid is updated through the item_added event
+            self.task_runner.run(
+                self.item_manager.add_item,
+                on_error=self._show_task_error,
                 type_id=data['type_id'],
                 owner_id=user['id'],
                 name=data['name'],
@@ -161,9 +343,6 @@ class MainController(QObject):
                 custom_values=data['custom_values'],
                 image_path=data.get('image_path')
             )
-            
-            current_type_id = self.main_window.get_selected_type_id()
-            self.load_items_by_type(current_type_id)
 
     def handle_delete_item(self, item_id: int):
         item_name = self.main_window.get_selected_item_name() or "this item"
@@ -178,23 +357,36 @@ class MainController(QObject):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            if self.auth_controller.is_admin():
-                self.item_manager.delete_item(item_id)
-            else:
-                self.item_manager.delete_item(item_id, user['id'])
-            
-            current_type_id = self.main_window.get_selected_type_id()
-            self.load_items_by_type(current_type_id)
+            owner_id = None if self.auth_controller.is_admin() else user['id']
+            # The grid is updated through the item_removed event
+            self.task_runner.run(
+                self.item_manager.delete_item, item_id, owner_id,
+                on_result=self._on_item_deleted,
+                on_error=self._show_task_error
+            )
+
+    def _on_item_deleted(self, deleted: bool):
+        if not deleted:
+            QMessageBox.warning(
+                self.main_window, "Error",
+                "The item was not deleted: it no longer exists or you do not own it."
+            )
 
     def show_admin_panel(self):
+        self.stack.setCurrentWidget(self.admin_panel)
         self.refresh_admin_types()
         self.refresh_admin_users()
-        self.stack.setCurrentWidget(self.admin_panel)
 
     def refresh_admin_types(self):
-        types = self.admin_controller.get_all_types()
-        self.admin_panel.update_types(types)
+        self.task_runner.submit(
+            'admin_types', self.admin_controller.get_all_types,
+            on_result=self.admin_panel.update_types,
+            on_error=self._show_task_error
+        )
 
     def refresh_admin_users(self):
-        users = self.admin_controller.get_pending_users()
-        self.admin_panel.update_pending_users(users)
\ No newline at end of file
+        self.task_runner.submit(
+            'admin_users', self.admin_controller.get_pending_users,
+            on_result=self.admin_panel.update_pending_users,
+            on_error=self._show_task_error
+        )
\ No newline at end of file
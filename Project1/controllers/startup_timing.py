@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+# controllers/startup_timing.py
+"""
+Startup Timing: Records import time, per-view construction time and
+time to first frame so startup regressions are easy to spot.
+Import this module first in main.py; its import starts the clock.
+"""
+import time
+_T0 = time.perf_counter()
+
+from PyQt6.QtCore import QObject, QEvent
+
+
+class _FirstFrameFilter(QObject):
+    def __init__(self, timer, widget):
+        super().__init__(widget)
+        self._timer = timer
+        self._widget = widget
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint:
+            self._widget.removeEventFilter(self)
+            self._timer.mark("first frame")
+            self._timer.finish()
+        return False
+
+
+class StartupTimer:
+    """Collects startup phases as (name, milliseconds) entries."""
+
+    def __init__(self):
+        self.entries = []  # (name, ms, is_since_start)
+        self.print_report = False
+        self._finished = False
+
+    def mark(self, name: str):
+        """Record a milestone as time since process start."""
+        self.entries.append((name, (time.perf_counter() - _T0) * 1000, True))
+
+    def record(self, name: str, seconds: float):
+        """Record the duration of a single step."""
+        self.entries.append((name, seconds * 1000, False))
+
+    def watch_first_frame(self, widget):
+        """Mark 'first frame' when widget is painted for the first time."""
+        widget.installEventFilter(_FirstFrameFilter(self, widget))
+
+    def finish(self):
+        if self._finished:
+            return
+        self._finished = True
+        if self.print_report:
+            print(self.report())
+
+    def report(self) -> str:
+        lines = ["Startup timing:"]
+        for name, ms, since_start in self.entries:
+            prefix = "@" if since_start else "+"
+            lines.append(f"  {prefix}{ms:9.1f} ms  {name}")
+        return "\n".join(lines)
+
+
+# Global startup timer
+startup_timer = StartupTimer()
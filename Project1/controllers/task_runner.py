@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+# controllers/task_runner.py
+"""
+Task Runner: Runs model calls on a background thread pool and delivers
+results back on the GUI thread through signals.
+"""
+import traceback
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+# Background threads used for database work
+MAX_WORKER_THREADS = 2
+
+
+class _TaskSignals(QObject):
+    finished = pyqtSignal(object)  # result
+    failed = pyqtSignal(str)       # error message
+
+
+class _Task(QRunnable):
+    def __init__(self, fn, args, kwargs):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = _TaskSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            traceback.print_exc()
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+
+
+class TaskRunner(QObject):
+    """
+    Runs callables off the GUI thread.
+
+    Tasks are grouped by key (e.g. 'items'). Submitting a new task for a
+    key supersedes the previous one: if it has not started yet it is
+    removed from the queue, otherwise its result is discarded.
+    """
+
+    running_changed = pyqtSignal(str, bool)  # key, has a live task
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(MAX_WORKER_THREADS)
+        self._generations = {}  # key -> generation of the latest task
+        self._live = {}         # key -> latest task
+        self._tasks = set()     # Keep running tasks referenced
+        self._anonymous = 0     # Counter for run() task keys
+
+    def submit(self, key: str, fn, *args, on_result=None, on_error=None, **kwargs):
+        """Run fn(*args, **kwargs) in the background."""
+        previous = self._live.get(key)
+        if previous is not None and self._pool.tryTake(previous):
+            self._tasks.discard(previous)
+
+        generation = self._generations.get(key, 0) + 1
+        self._generations[key] = generation
+
+        task = _Task(fn, args, kwargs)
+        task.signals.finished.connect(
+            lambda result: self._on_done(key, generation, task, on_result, result)
+        )
+        task.signals.failed.connect(
+            lambda message: self._on_done(key, generation, task, on_error, message)
+        )
+        self._tasks.add(task)
+        self._live[key] = task
+        self.running_changed.emit(key, True)
+        self._pool.start(task)
+
+    def run(self, fn, *args, on_result=None, on_error=None, **kwargs):
+        """Run fn in the background without superseding anything (for writes)."""
+        self._anonymous += 1
+        self.submit(f"_task{self._anonymous}", fn, *args,
+                    on_result=on_result, on_error=on_error, **kwargs)
+
+    def cancel(self, key: str):
+        """Drop the pending result of key's latest task."""
+        if key not in self._live:
+            return
+        previous = self._live.pop(key)
+        if self._pool.tryTake(previous):
+            self._tasks.discard(previous)
+        self._generations[key] = self._generations.get(key, 0) + 1
+        self.running_changed.emit(key, False)
+
+    def is_running(self, key: str) -> bool:
+        return key in self._live
+
+    def wait_for_done(self, msecs: int = -1) -> bool:
+        """Block until all queued tasks finish (MainController.wait_for_tasks on shutdown)."""
+        return self._pool.waitForDone(msecs)
+
+    def _on_done(self, key, generation, task, callback, value):
+        self._tasks.discard(task)
+        if self._generations.get(key) != generation:
+            return  # Superseded by a newer request
+        del self._live[key]
+        if key.startswith("_task"):
+            self._generations.pop(key, None)
+        self.running_changed.emit(key, False)
+        if callback is not None:
+            callback(value)
@@ -10,10 +10,16 @@ import os
 # Add project root to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Imported first: starts the startup clock
+from controllers.startup_timing import startup_timer
+
 from PyQt6.QtWidgets import QApplication, QStackedWidget
 from PyQt6.QtCore import QFile, QTextStream
 
 from controllers.main_controller import MainController
+from model.database import db
+
+startup_timer.mark("imports done")
 
 def load_global_styles(app: QApplication):
     """Load global stylesheet."""
@@ -24,6 +30,9 @@ def load_global_styles(app: QApplication):
         app.setStyleSheet(stream.readAll())
 
 if __name__ == "__main__":
+    # Pass --startup-report to print startup timings after the first frame
+    startup_timer.print_report = "--startup-report" in sys.argv
+    
     # 1. Create QApplication instance
     app = QApplication(sys.argv)
     
@@ -37,7 +46,14 @@ if __name__ == "__main__":
     
     # 4. Create and run the main controller
     controller = MainController(stack)
+    startup_timer.mark("controller ready")
+    startup_timer.watch_first_frame(stack)
     controller.run()
     
+    # On exit let worker tasks finish (they hold pooled connections), then
+    # run PRAGMA optimize and close the pool; slots run in connection order
+    app.aboutToQuit.connect(controller.wait_for_tasks)
+    app.aboutToQuit.connect(db.close)
+    
     # 5. Start the event loop
     sys.exit(app.exec())
\ No newline at end of file
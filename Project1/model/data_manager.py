@@ -1,21 +1,232 @@
 # model/data_manager.py
 import csv
+import io
+import mmap
 import os
+import stat
+import threading
 import uuid
-from typing import List, Dict, Optional
-from config import ITEMS_CSV_PATH, CSV_HEADERS
+from array import array
+from collections.abc import Mapping
+from typing import List, Dict, Optional, Iterator, Set
+
+# items.csv 的路径与表头。项目中没有 config 模块时使用这里的默认值
+try:
+    from config import ITEMS_CSV_PATH, CSV_HEADERS
+except ImportError:
+    ITEMS_CSV_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'items.csv')
+    CSV_HEADERS = ['id', 'name', 'description', 'contact_info']
+
+# 日志模式下的删除记录 (墓碑行): id 列为该前缀 + 被删除物品的 id
+TOMBSTONE_PREFIX = "~"
+# 墓碑行不少于该数量且超过存活行数 * COMPACT_RATIO 时, 在后台压缩文件
+COMPACT_MIN_TOMBSTONES = 100
+COMPACT_RATIO = 0.5
+# 子串搜索倒排索引的 n-gram 长度; 更短的关键词退回线性扫描
+NGRAM_SIZE = 3
+
+class ItemRow(Mapping):
+    """
+    一行物品数据 (内部存储)。值保存在 tuple 中 (__slots__, 不为每行建 dict),
+    并预先计算小写的 name / description 供搜索使用。
+    可以像 dict 一样只读访问: item['name'], item.get(...), dict(item)。
+    公开方法返回的是 dict 副本, 调用方可以随意修改。
+    """
+    __slots__ = ('_fields', '_values', 'name_lower', 'description_lower')
+
+    def __init__(self, fields: Dict[str, int], values: tuple):
+        self._fields = fields  # 表头 -> 列下标, 同一文件的所有行共享
+        self._values = values
+        self.name_lower = self['name'].lower()
+        self.description_lower = self['description'].lower()
+
+    @classmethod
+    def from_dict(cls, fields: Dict[str, int], row: Dict[str, str]) -> "ItemRow":
+        return cls(fields, tuple(row.get(key) or '' for key in fields))
+
+    def __getitem__(self, key):
+        return self._values[self._fields[key]]
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __repr__(self):
+        return f"ItemRow({dict(self)!r})"
+
+class MappedRow(Mapping):
+    """
+    内存映射文件中一行的轻量视图: 只记录行号, 首次访问字段时才解码该行,
+    解码结果和小写字段随视图缓存。与 ItemRow 接口相同。
+    只在 CsvDataManager 内部使用 (公开方法返回 dict 副本)。
+    """
+    __slots__ = ('_source', '_position', '_values', '_name_lower', '_description_lower')
+
+    def __init__(self, source: "_MappedRows", position: int):
+        self._source = source
+        self._position = position
+        self._values = None
+        self._name_lower = None
+        self._description_lower = None
+
+    def _decoded(self) -> tuple:
+        if self._values is None:
+            self._values = self._source.decode_row(self._position)
+        return self._values
+
+    def __getitem__(self, key):
+        return self._decoded()[self._source.fields[key]]
+
+    def __iter__(self):
+        return iter(self._source.fields)
+
+    def __len__(self):
+        return len(self._source.fields)
+
+    @property
+    def name_lower(self) -> str:
+        if self._name_lower is None:
+            self._name_lower = self['name'].lower()
+        return self._name_lower
+
+    @property
+    def description_lower(self) -> str:
+        if self._description_lower is None:
+            self._description_lower = self['description'].lower()
+        return self._description_lower
+
+    def __repr__(self):
+        return f"MappedRow({dict(self)!r})"
+
+class _MappedRows:
+    """
+    mapped 模式下 CsvDataManager._rows 的实现。
+    只保存每行在映射文件中的起始字节偏移 (array, 每行 8 字节),
+    行视图在首次访问时创建并保留 (已解码的行不会被重复解码);
+    新增的行和删除标记另外保存。
+    支持 CsvDataManager 用到的列表操作: 下标读写、len、append、迭代。
+    """
+    def __init__(self, data: mmap.mmap, fields: Dict[str, int]):
+        self.fields = fields
+        self._map = data
+        self._offsets = array('Q')   # 每条数据行的起始偏移, 最后一个为结束偏移
+        self._views: Dict[int, MappedRow] = {}  # 已访问过的行
+        self._appended: List[ItemRow] = []
+        self._overrides: Dict[int, Optional[ItemRow]] = {}  # 位置 -> 删除 (None)
+        self.header: List[str] = []
+        self.tombstones: List[int] = []  # 墓碑行的位置
+        self._scan()
+
+    def _scan(self):
+        """找出每条记录的边界 (引号内的换行不算), 不解码任何字段。"""
+        data = self._map
+        size = len(data)
+        start = 0
+        position = 0
+        quoted = False
+        first = True
+        while position < size:
+            newline = data.find(b'\n', position)
+            line_end = size if newline < 0 else newline + 1
+            quote = data.find(b'"', position, line_end)
+            while quote >= 0:
+                quoted = not quoted
+                quote = data.find(b'"', quote + 1, line_end)
+            position = line_end
+            if quoted:
+                continue
+            if first:
+                self.header = self._parse(start, line_end)
+                first = False
+            elif line_end - start > 2 or data[start] not in b'\r\n':
+                # 空行并入上一条记录 (解析时会被忽略)
+                if data[start] == 0x7e or (
+                        data[start] == 0x22 and start + 1 < size and data[start + 1] == 0x7e):
+                    self.tombstones.append(len(self._offsets))
+                self._offsets.append(start)
+            start = line_end
+        self._offsets.append(size)
+
+    def _parse(self, start: int, end: int) -> List[str]:
+        text = self._map[start:end].decode('utf-8')
+        return next(csv.reader(io.StringIO(text, newline='')), [])
+
+    def decode_row(self, position: int) -> tuple:
+        values = self._parse(self._offsets[position], self._offsets[position + 1])
+        values += [''] * (len(self.fields) - len(values))
+        return tuple(values[:len(self.fields)])
+
+    def __len__(self):
+        return len(self._offsets) - 1 + len(self._appended)
+
+    def __getitem__(self, position: int):
+        if position in self._overrides:
+            return self._overrides[position]
+        mapped = len(self._offsets) - 1
+        if position >= mapped:
+            return self._appended[position - mapped]
+        view = self._views.get(position)
+        if view is None:
+            view = self._views[position] = MappedRow(self, position)
+        return view
+
+    def __setitem__(self, position: int, row: Optional[ItemRow]):
+        self._overrides[position] = row
+
+    def __iter__(self):
+        for position in range(len(self)):
+            yield self[position]
+
+    def append(self, row: ItemRow):
+        self._appended.append(row)
+
+    def unmap(self):
+        """解除映射 (文件被替换前); 之后访问未解码的行会失败, 直到 remap()。"""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def remap(self, path: str):
+        """重新映射同一个 (未被修改的) 文件, 行偏移保持有效。"""
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def close(self):
+        self.unmap()
 
 class CsvDataManager:
     """
     PRD 4.3: Model (数据模型层)
     负责处理 items.csv 的所有读写逻辑。
     完全独立于 UI (PyQt)。
+
+    journal=True 时为追加写 (日志) 模式: add_item / delete_item 立即追加到
+    文件末尾 (删除写为墓碑行), save_data 不再重写整个文件;
+    墓碑过多时在后台线程压缩。
+
+    内存中的行按位置存放 (删除留空位), 另有 id -> 位置的字典和按需建立的
+    n-gram 倒排索引, 因此删除为 O(1), 长关键词搜索只检查候选行。
+
+    mapped=True 时以内存映射方式打开文件: 加载只扫描行边界, 每行以
+    MappedRow 视图出现, 字段在访问时才解码, 常驻内存与访问过的行数成正比。
     """
-    def __init__(self):
+    def __init__(self, journal: bool = False, mapped: bool = False):
         self.data_file = ITEMS_CSV_PATH
         self.headers = CSV_HEADERS
-        # PRD 4.2.2: 内存中的数据列表 (List of Dictionaries)
-        self._items_cache: List[Dict[str, str]] = []
+        self.journal = journal
+        self.mapped = mapped
+        self._fields = {key: index for index, key in enumerate(self.headers)}
+        # PRD 4.2.2: 内存中的数据列表; 已删除的位置为 None
+        self._rows: List[Optional[ItemRow]] = []
+        self._positions: Optional[Dict[str, int]] = None  # id -> 在 _rows 中的位置 (首次删除时建立)
+        self._live = 0                              # 未删除的行数
+        self._ngrams: Optional[Dict[str, Set[int]]] = None  # n-gram -> 位置 (首次搜索时建立)
+        self._mapped_rows: Optional[_MappedRows] = None     # mapped 模式下当前映射
+        self._tombstones = 0                  # 文件中的墓碑行数
+        self._file_lock = threading.Lock()    # 追加写与压缩替换文件互斥
+        self._compactor: Optional[threading.Thread] = None
         
         self._initialize_data_file()
         self.load_data()
@@ -24,10 +235,8 @@ class CsvDataManager:
         """如果 items.csv 不存在，则创建它并写入表头。"""
         if not os.path.exists(self.data_file):
             try:
-                with open(self.data_file, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.writer(f)
-                    # PRD 4.2: 写入数据列 (Headers)
-                    writer.writerow(self.headers)
+                # PRD 4.2: 写入数据列 (Headers)
+                self._replace_file(self._write_temp([]))
             except IOError as e:
                 print(f"Error initializing data file {self.data_file}: {e}")
                 # 在实际应用中，这里应该向用户显示一个错误
@@ -35,23 +244,37 @@ class CsvDataManager:
     def load_data(self):
         """
         PRD 4.2.2: 读取 (Load)
-        程序启动时，一次性将 CSV 读入内存中的 _items_cache。
+        程序启动时，逐行将 CSV 读入内存中的 _rows。
+        墓碑行 (日志模式写入) 在读完后统一生效, 因此两种模式都能读取日志文件。
         """
-        self._items_cache = []
+        self._close_map()
+        self._set_rows([])
+        self._tombstones = 0
         try:
-            with open(self.data_file, 'r', newline='', encoding='utf-8') as f:
-                # PRD 4.2.2: 必须使用 csv.DictReader
-                reader = csv.DictReader(f)
-                
-                # 健全性检查：确保表头匹配
-                if reader.fieldnames != self.headers:
-                    print(f"Warning: CSV header mismatch. Re-initializing file.")
-                    # 如果表头损坏或不匹配，则重建文件
-                    self._initialize_data_file()
-                    return
-
-                for row in reader:
-                    self._items_cache.append(row)
+            if self.mapped:
+                self._load_mapped()
+                return
+            rows = []
+            deleted = set()
+            for row in self._read_rows():
+                if row['id'].startswith(TOMBSTONE_PREFIX):
+                    deleted.add(row['id'][len(TOMBSTONE_PREFIX):])
+                else:
+                    rows.append(ItemRow.from_dict(self._fields, row))
+            if deleted:
+                rows = [row for row in rows if row['id'] not in deleted]
+            self._set_rows(rows)
+            self._tombstones = len(deleted)
+        except UnicodeDecodeError as e:
+            # 编码错误 (UnicodeDecodeError 是 ValueError 的子类, 须先捕获):
+            # 文件不是 UTF-8, 不是表头问题, 保留原文件不动
+            print(f"Error loading data: {self.data_file} is not valid UTF-8: {e}")
+            self._set_rows([])
+        except ValueError:
+            # 健全性检查失败：表头损坏或不匹配，则重建文件
+            print(f"Warning: CSV header mismatch. Re-initializing file.")
+            self._set_rows([])
+            self._initialize_data_file()
         except FileNotFoundError:
             print("Data file not found. Creating a new one.")
             self._initialize_data_file()
@@ -59,24 +282,220 @@ class CsvDataManager:
             print(f"Error loading data: {e}")
             # 此处应有更健壮的错误处理
 
+    def _load_mapped(self):
+        """mapped 模式的 load_data: 映射文件并记录行偏移, 不解码字段。"""
+        with open(self.data_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise ValueError(f"CSV header missing in {self.data_file}")
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            rows = _MappedRows(data, self._fields)
+        except BaseException:
+            data.close()
+            raise
+        if rows.header != self.headers:
+            rows.close()
+            raise ValueError(f"CSV header mismatch in {self.data_file}")
+        self._mapped_rows = rows
+        self._set_rows(rows)
+
+        if rows.tombstones:
+            # 只有存在墓碑行时才需要解码全部 id
+            deleted = {rows[position]['id'][len(TOMBSTONE_PREFIX):] for position in rows.tombstones}
+            for position in rows.tombstones:
+                rows[position] = None
+            for position in range(len(rows)):
+                row = rows[position]
+                if row is not None and row['id'] in deleted:
+                    rows[position] = None
+            self._live = sum(1 for _ in self._live_rows())
+            self._tombstones = len(deleted)
+
+    def _close_map(self):
+        if self._mapped_rows is not None:
+            self._mapped_rows.close()
+            self._mapped_rows = None
+
+    def _set_rows(self, rows):
+        """替换内存中的全部行 (id 与 n-gram 索引在下次使用时重建)。"""
+        self._rows = rows
+        self._positions = None
+        self._live = len(rows)
+        self._ngrams = None
+
+    def _position_index(self) -> Dict[str, int]:
+        if self._positions is None:
+            self._positions = {
+                row['id']: position
+                for position, row in enumerate(self._rows) if row is not None
+            }
+        return self._positions
+
+    def _live_rows(self) -> Iterator[ItemRow]:
+        return (row for row in self._rows if row is not None)
+
+    def iter_items(self) -> Iterator[Dict[str, str]]:
+        """
+        流式读取 items.csv 中的有效物品 (生成器), 不把整个文件读入内存。
+        先扫描一遍收集被删除的 id, 只有该集合常驻内存。
+        """
+        deleted = self._scan_tombstones()
+        for row in self._read_rows():
+            if row['id'].startswith(TOMBSTONE_PREFIX) or row['id'] in deleted:
+                continue
+            yield row
+
+    def _read_rows(self, end: int = None) -> Iterator[Dict[str, str]]:
+        """
+        逐行解析 CSV (含墓碑行)。end 为字节偏移, 只读取其之前的行。
+        表头不匹配时抛出 ValueError。
+        """
+        with open(self.data_file, 'rb') as f:
+            # PRD 4.2.2: 必须使用 csv.DictReader
+            reader = csv.DictReader(self._decoded_lines(f, end))
+            if reader.fieldnames != self.headers:
+                raise ValueError(f"CSV header mismatch in {self.data_file}")
+            yield from reader
+
+    @staticmethod
+    def _decoded_lines(f, end: int = None) -> Iterator[str]:
+        position = 0
+        for line in f:
+            if end is not None and position >= end:
+                return
+            position += len(line)
+            yield line.decode('utf-8')
+
+    def _scan_tombstones(self, end: int = None) -> set:
+        """文件中被墓碑行标记删除的 id 集合。"""
+        return {
+            row['id'][len(TOMBSTONE_PREFIX):]
+            for row in self._read_rows(end)
+            if row['id'].startswith(TOMBSTONE_PREFIX)
+        }
+
     def save_data(self):
         """
         PRD 4.2.2: 写入 (Save)
-        将完整的内存列表 (_items_cache) 覆盖写回 (Overwrite) items.csv 文件。
+        将完整的内存列表 (_rows) 覆盖写回 items.csv 文件。
+        先写临时文件再原子替换, 写到一半失败不会损坏原文件。
+        日志模式下每次修改已追加写入, 无需重写。
         """
+        if self.journal:
+            return
         try:
-            with open(self.data_file, 'w', newline='', encoding='utf-8') as f:
-                # PRD 4.2.2: 必须使用 csv.DictWriter
-                writer = csv.DictWriter(f, fieldnames=self.headers)
-                writer.writeheader()
-                writer.writerows(self._items_cache)
+            temp_path = self._write_temp(self._live_rows())
+            if self._mapped_rows is None:
+                self._replace_file(temp_path)
+                self._tombstones = 0
+                return
+            # 被映射的文件 (Windows) 不能替换: 先解除映射。替换失败时原文件
+            # 未变, 重新映射它, 内存中的行 (含未保存的修改) 保持可用;
+            # 成功后才加载新文件
+            self._mapped_rows.unmap()
+            try:
+                self._replace_file(temp_path)
+            except BaseException:
+                self._mapped_rows.remap(self.data_file)
+                raise
+            self._tombstones = 0
+            self.load_data()
         except IOError as e:
             print(f"Error saving data: {e}")
             # 此处应向用户显示保存失败的错误
 
+    def _write_temp(self, rows) -> str:
+        """把表头和 rows 写入同目录下的临时文件, 返回其路径。"""
+        directory = os.path.dirname(os.path.abspath(self.data_file))
+        temp_path = os.path.join(directory, f"{uuid.uuid4().hex}.tmp")
+        # 与 open() 一样由 umask 决定权限 (mkstemp 固定为 0600)
+        fd = os.open(temp_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, 'O_BINARY', 0),
+                     0o666)
+        try:
+            with os.fdopen(fd, 'w', newline='', encoding='utf-8') as f:
+                # PRD 4.2.2: 必须使用 csv.DictWriter
+                writer = csv.DictWriter(f, fieldnames=self.headers)
+                writer.writeheader()
+                writer.writerows(rows)
+                f.flush()
+                os.fsync(f.fileno())
+            if os.path.exists(self.data_file):
+                # 替换后保留原文件的权限
+                os.chmod(temp_path, stat.S_IMODE(os.stat(self.data_file).st_mode))
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        return temp_path
+
+    def _replace_file(self, temp_path: str):
+        """用临时文件原子替换 items.csv。"""
+        try:
+            os.replace(temp_path, self.data_file)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def _append_rows(self, rows: List[Dict[str, str]]):
+        """日志模式: 将若干行一次性追加到文件末尾并落盘。"""
+        buffer = io.StringIO()
+        csv.DictWriter(buffer, fieldnames=self.headers).writerows(rows)
+        with self._file_lock:
+            with open(self.data_file, 'a', newline='', encoding='utf-8') as f:
+                # 整行一次写入, 避免留下半行
+                f.write(buffer.getvalue())
+                f.flush()
+                os.fsync(f.fileno())
+            self._tombstones += sum(row['id'].startswith(TOMBSTONE_PREFIX) for row in rows)
+
+    def compact(self):
+        """
+        日志模式: 重写文件, 去掉墓碑行和已删除的行。
+        可在后台线程运行: 先无锁地重写当前文件内容 (只追加, 不会变化),
+        再在锁内补上期间新追加的行并原子替换。
+        """
+        with self._file_lock:
+            end = os.path.getsize(self.data_file)
+            tombstones = self._tombstones
+        deleted = self._scan_tombstones(end)
+        live = (
+            row for row in self._read_rows(end)
+            if not row['id'].startswith(TOMBSTONE_PREFIX) and row['id'] not in deleted
+        )
+        temp_path = self._write_temp(live)
+        try:
+            with self._file_lock:
+                with open(self.data_file, 'rb') as src, open(temp_path, 'ab') as dst:
+                    src.seek(end)
+                    dst.write(src.read())
+                    dst.flush()
+                    os.fsync(dst.fileno())
+                self._replace_file(temp_path)
+                self._tombstones -= tombstones
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+    def _maybe_compact(self):
+        """墓碑行过多时启动后台压缩 (同一时间只有一个)。"""
+        if self._tombstones < COMPACT_MIN_TOMBSTONES:
+            return
+        if self._tombstones <= self._live * COMPACT_RATIO:
+            return
+        if self._compactor is not None and self._compactor.is_alive():
+            return
+        self._compactor = threading.Thread(target=self._compact_in_background, daemon=True)
+        self._compactor.start()
+
+    def _compact_in_background(self):
+        try:
+            self.compact()
+        except Exception as e:
+            print(f"Error compacting data file: {e}")
+
     def get_all_items(self) -> List[Dict[str, str]]:
-        """获取内存中的所有物品列表。"""
-        return self._items_cache
+        """获取内存中的所有物品列表 (dict 副本)。"""
+        return [dict(row) for row in self._live_rows()]
 
     def add_item(self, name: str, description: str, contact_info: str) -> Dict[str, str]:
         """
@@ -84,50 +503,113 @@ class CsvDataManager:
         PRD 4.2.1: ID的生成 (使用 UUID)
         """
         new_id = uuid.uuid4().hex
-        new_item = {
+        new_item = ItemRow.from_dict(self._fields, {
             'id': new_id,
             'name': name,
             'description': description,
             'contact_info': contact_info
-        }
-        # 1. 更新内存列表
-        self._items_cache.append(new_item)
-        # 2. Controller 将负责调用 save_data() 来持久化
-        return new_item
+        })
+        # 1. 更新内存列表和索引
+        position = len(self._rows)
+        self._rows.append(new_item)
+        if self._positions is not None:
+            self._positions[new_id] = position
+        self._live += 1
+        if self._ngrams is not None:
+            self._index_row(position, new_item)
+        # 2. 日志模式下立即追加到文件; 否则 Controller 将负责调用 save_data() 来持久化
+        if self.journal:
+            self._append_rows([new_item])
+        return dict(new_item)
 
     def delete_item(self, item_id: str) -> bool:
         """
         FR-003 & PRD 4.2.3: 删除操作
-        从内存列表中移除指定 id 的项。
+        通过 id -> 位置索引从内存列表中移除指定 id 的项 (O(1))。
         """
-        item_to_delete = None
-        for item in self._items_cache:
-            if item['id'] == item_id:
-                item_to_delete = item
-                break
-        
-        if item_to_delete:
-            # 1. 从内存列表中移除
-            self._items_cache.remove(item_to_delete)
-            # 2. Controller 将负责调用 save_data()
-            return True
-        
-        return False # 未找到该 ID
+        position = self._position_index().pop(item_id, None)
+        if position is None:
+            return False # 未找到该 ID
+
+        # 1. 从内存列表中移除 (留下空位, 空位过多时再整理)
+        item = self._rows[position]
+        self._rows[position] = None
+        self._live -= 1
+        if self._ngrams is not None:
+            self._unindex_row(position, item)
+        if len(self._rows) - self._live > max(self._live, 64):
+            self._set_rows(list(self._live_rows()))
+        # 2. 日志模式下追加墓碑行; 否则 Controller 将负责调用 save_data()
+        if self.journal:
+            tombstone = dict.fromkeys(self.headers, '')
+            tombstone['id'] = TOMBSTONE_PREFIX + item_id
+            self._append_rows([tombstone])
+            self._maybe_compact()
+        return True
 
     def search_items(self, keyword: str) -> List[Dict[str, str]]:
         """
         FR-004 & PRD 4.2.4: 搜索操作
         在内存中筛选 name 或 description 包含关键词的项。
+        关键词不短于 NGRAM_SIZE 时先用 n-gram 倒排索引取候选行, 再逐行确认。
         """
         if not keyword:
             return self.get_all_items()
         
         keyword_lower = keyword.lower()
+        if len(keyword_lower) >= NGRAM_SIZE:
+            candidates = self._candidates(keyword_lower)
+        else:
+            candidates = range(len(self._rows))
+
         results = []
-        for item in self._items_cache:
-            # PRD 4.0: 模糊匹配
-            name_match = keyword_lower in item['name'].lower()
-            desc_match = keyword_lower in item['description'].lower()
-            if name_match or desc_match:
-                results.append(item)
-        return results
\ No newline at end of file
+        for position in candidates:
+            item = self._rows[position]
+            if item is None:
+                continue
+            # PRD 4.0: 模糊匹配 (小写字段已预先计算)
+            if keyword_lower in item.name_lower or keyword_lower in item.description_lower:
+                results.append(dict(item))
+        return results
+
+    @staticmethod
+    def _ngrams_of(text: str) -> Set[str]:
+        return {text[i:i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+    def _row_ngrams(self, item: ItemRow) -> Set[str]:
+        # 分别取 name 和 description 的 n-gram, 不产生跨字段的组合
+        return self._ngrams_of(item.name_lower) | self._ngrams_of(item.description_lower)
+
+    def _index_row(self, position: int, item: ItemRow):
+        for gram in self._row_ngrams(item):
+            self._ngrams.setdefault(gram, set()).add(position)
+
+    def _unindex_row(self, position: int, item: ItemRow):
+        for gram in self._row_ngrams(item):
+            positions = self._ngrams.get(gram)
+            if positions is not None:
+                positions.discard(position)
+                if not positions:
+                    del self._ngrams[gram]
+
+    def _candidates(self, keyword_lower: str) -> List[int]:
+        """包含关键词全部 n-gram 的行位置 (按原顺序)。"""
+        if self._ngrams is None:
+            self._ngrams = {}
+            for position, item in enumerate(self._rows):
+                if item is not None:
+                    self._index_row(position, item)
+
+        postings = []
+        for gram in self._ngrams_of(keyword_lower):
+            positions = self._ngrams.get(gram)
+            if not positions:
+                return []
+            postings.append(positions)
+        postings.sort(key=len)
+        result = set(postings[0])
+        for positions in postings[1:]:
+            result &= positions
+            if not result:
+                break
+        return sorted(result)
@@ -5,12 +5,351 @@ SQLite Database Manager for local storage.
 """
 import os
 import sqlite3
+import threading
+import time
+from contextlib import contextmanager
 
 # Path to SQLite database
 SQLITE_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'campus_xianyu.db')
 
+# Connection pool settings
+POOL_MAX_SIZE = 5         # Maximum number of open connections
+POOL_TIMEOUT = 10.0       # Seconds to wait for a free connection
+
+# Full-text search settings. The trigram tokenizer matches arbitrary
+# substrings, which works for Chinese names that have no word boundaries.
+FTS_TOKENIZER = 'trigram'
+FTS_MIN_QUERY_LENGTH = 3  # Trigram cannot match shorter keywords
+
+# PRAGMAs applied to every new connection. WAL lets readers keep going
+# while another connection (or app instance) writes.
+PRAGMA_PROFILE = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'cache_size': -16000,         # Negative = KiB, i.e. ~16 MB page cache
+    'mmap_size': 64 * 1024 * 1024,
+    'temp_store': 'MEMORY',
+    'busy_timeout': 5000,         # ms to wait on a locked database
+}
+# Default admin credentials (hashed lazily, see _migrate_default_admin)
+DEFAULT_ADMIN_PASSWORD = "admin123"
+DEFAULT_PASSWORD_MARKER = "!default"
+
+CHECKPOINT_EVERY_WRITES = 200     # Passive WAL checkpoint after this many writes
+OPTIMIZE_INTERVAL = 3600.0        # Seconds between PRAGMA optimize runs
+
+
+class ConnectionPool:
+    """
+    Pool of reusable SQLite connections.
+
+    A thread keeps the connection it checked out until its outermost
+    release, so nested acquires on the same thread share one connection.
+    Idle connections are health-checked before being handed out again.
+    """
+
+    def __init__(self, factory, max_size: int = POOL_MAX_SIZE, timeout: float = POOL_TIMEOUT):
+        self._factory = factory
+        self.max_size = max_size
+        self.timeout = timeout
+        self._idle = []
+        self._size = 0
+        self._cond = threading.Condition()
+        self._local = threading.local()
+        self._stats = {'hits': 0, 'misses': 0, 'waits': 0, 'wait_time': 0.0, 'discarded': 0}
+
+    def acquire(self) -> sqlite3.Connection:
+        """Check out a connection for the current thread."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            self._local.depth += 1
+            with self._cond:
+                self._stats['hits'] += 1
+            return conn
+
+        conn = self._checkout()
+        self._local.conn = conn
+        self._local.depth = 1
+        return conn
+
+    def release(self, conn: sqlite3.Connection):
+        """Return a connection once the current thread's outermost use ends."""
+        if getattr(self._local, 'conn', None) is not conn:
+            raise RuntimeError("Connection was not acquired by this thread")
+        self._local.depth -= 1
+        if self._local.depth > 0:
+            return
+
+        self._local.conn = None
+        if conn.in_transaction:
+            conn.rollback()
+        with self._cond:
+            self._idle.append(conn)
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self):
+        """Context manager around acquire()/release()."""
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def _checkout(self) -> sqlite3.Connection:
+        with self._cond:
+            waited = None
+            while True:
+                while self._idle:
+                    conn = self._idle.pop()
+                    if self._is_healthy(conn):
+                        self._stats['hits'] += 1
+                        self._record_wait(waited)
+                        return conn
+                    self._discard(conn)
+
+                if self._size < self.max_size:
+                    self._size += 1
+                    self._stats['misses'] += 1
+                    self._record_wait(waited)
+                    break
+
+                if waited is None:
+                    waited = time.perf_counter()
+                remaining = self.timeout - (time.perf_counter() - waited)
+                if remaining <= 0:
+                    self._record_wait(waited)
+                    raise TimeoutError(
+                        f"No database connection available within {self.timeout}s"
+                    )
+                self._cond.wait(remaining)
+
+        # Open the new connection outside the lock
+        try:
+            return self._factory()
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+
+    def _is_healthy(self, conn: sqlite3.Connection) -> bool:
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _discard(self, conn: sqlite3.Connection):
+        """Drop a broken connection. Caller must hold the lock."""
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+        self._size -= 1
+        self._stats['discarded'] += 1
+
+    def _record_wait(self, started):
+        """Caller must hold the lock."""
+        if started is not None:
+            self._stats['waits'] += 1
+            self._stats['wait_time'] += time.perf_counter() - started
+
+    def resize(self, max_size: int):
+        """Change the maximum number of open connections."""
+        with self._cond:
+            self.max_size = max_size
+            while self._size > max_size and self._idle:
+                self._idle.pop().close()
+                self._size -= 1
+            self._cond.notify_all()
+
+    def stats(self) -> dict:
+        """Snapshot of pool counters."""
+        with self._cond:
+            stats = dict(self._stats)
+            stats.update(size=self._size, idle=len(self._idle), max_size=self.max_size)
+        return stats
+
+    def close_all(self):
+        """Close every idle connection."""
+        with self._cond:
+            while self._idle:
+                self._idle.pop().close()
+                self._size -= 1
+
+
+# --- Schema migrations ---
+# Each migration is idempotent and runs once, in order; schema_version
+# records the ones applied so an up-to-date database skips all DDL. A
+# migration that returns False could not be applied and is not recorded,
+# so it is retried at the next start.
+
+def _migrate_base_tables(cursor):
+    """Create the users, item_types and items tables."""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT UNIQUE NOT NULL,
+            password_hash TEXT NOT NULL,
+            email TEXT,
+            phone TEXT,
+            address TEXT,
+            role TEXT DEFAULT 'pending' CHECK(role IN ('admin', 'user', 'pending')),
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS item_types (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT UNIQUE NOT NULL,
+            custom_attributes TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS items (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            type_id INTEGER NOT NULL,
+            owner_id INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            description TEXT,
+            location TEXT,
+            contact_phone TEXT,
+            contact_email TEXT,
+            image_path TEXT,
+            custom_values TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (type_id) REFERENCES item_types(id) ON DELETE CASCADE,
+            FOREIGN KEY (owner_id) REFERENCES users(id) ON DELETE CASCADE
+        )
+    """)
+
+
+def _migrate_image_path(cursor):
+    """Add image_path column to databases created before it existed."""
+    cursor.execute("PRAGMA table_info(items)")
+    columns = [column[1] for column in cursor.fetchall()]
+    if 'image_path' not in columns:
+        cursor.execute("ALTER TABLE items ADD COLUMN image_path TEXT")
+
+
+def _migrate_fts_index(cursor):
+    """
+    Create the items_fts full-text index and the triggers that keep it
+    in sync with items. Returns False if SQLite lacks FTS5/trigram.
+    """
+    cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'items_fts'"
+    )
+    exists = cursor.fetchone() is not None
+    if not exists:
+        try:
+            cursor.execute(f"""
+                CREATE VIRTUAL TABLE items_fts USING fts5(
+                    name, description,
+                    content='items', content_rowid='id',
+                    tokenize='{FTS_TOKENIZER}'
+                )
+            """)
+        except sqlite3.OperationalError as e:
+            print(f"Full-text search unavailable, falling back to LIKE: {e}")
+            return False
+
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS items_fts_ai AFTER INSERT ON items BEGIN
+            INSERT INTO items_fts (rowid, name, description)
+            VALUES (new.id, new.name, new.description);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS items_fts_ad AFTER DELETE ON items BEGIN
+            INSERT INTO items_fts (items_fts, rowid, name, description)
+            VALUES ('delete', old.id, old.name, old.description);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS items_fts_au AFTER UPDATE OF name, description ON items BEGIN
+            INSERT INTO items_fts (items_fts, rowid, name, description)
+            VALUES ('delete', old.id, old.name, old.description);
+            INSERT INTO items_fts (rowid, name, description)
+            VALUES (new.id, new.name, new.description);
+        END
+    """)
+
+    if not exists:
+        # Index rows that existed before the FTS table was created
+        cursor.execute("INSERT INTO items_fts (items_fts) VALUES ('rebuild')")
+
+
+def _migrate_app_meta(cursor):
+    """
+    Change counters that other app instances can poll.
+    Triggers bump item_types_version on any write to item_types.
+    """
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS app_meta (
+            key TEXT PRIMARY KEY,
+            value INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    cursor.execute("INSERT OR IGNORE INTO app_meta (key, value) VALUES ('item_types_version', 0)")
+    for event in ('INSERT', 'UPDATE', 'DELETE'):
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS item_types_version_{event.lower()}
+            AFTER {event} ON item_types BEGIN
+                UPDATE app_meta SET value = value + 1 WHERE key = 'item_types_version';
+            END
+        """)
+
+
+def _migrate_indexes(cursor):
+    """Secondary indexes for the item listing, owner-scoped deletes and role lookups."""
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_items_type_created "
+        "ON items (type_id, created_at DESC, id DESC)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_items_created "
+        "ON items (created_at DESC, id DESC)"
+    )
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_items_owner ON items (owner_id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_role ON users (role)")
+
+
+def _migrate_default_admin(cursor):
+    """
+    Create the default admin account if there is none. Its password is
+    stored as DEFAULT_PASSWORD_MARKER and only bcrypt-hashed at the first
+    successful login (see UserManager.login), keeping hashing off startup.
+    """
+    cursor.execute("SELECT COUNT(*) FROM users WHERE role = 'admin'")
+    if cursor.fetchone()[0] == 0:
+        cursor.execute(
+            "INSERT INTO users (username, password_hash, email, role) VALUES (?, ?, ?, ?)",
+            ('admin', DEFAULT_PASSWORD_MARKER, 'admin@campus.edu', 'admin')
+        )
+
+
+MIGRATIONS = [
+    (1, _migrate_base_tables),
+    (2, _migrate_image_path),
+    (3, _migrate_fts_index),
+    (4, _migrate_app_meta),
+    (5, _migrate_indexes),
+    (6, _migrate_default_admin),
+]
+SCHEMA_VERSIONS = frozenset(version for version, _ in MIGRATIONS)
+
+
 class Database:
-    """Singleton database connection manager using SQLite."""
+    """
+    Singleton database connection manager using SQLite.
+    Construction is cheap: the schema is checked and migrated lazily when
+    the first connection is opened.
+    """
     _instance = None
 
     def __new__(cls):
@@ -23,82 +362,265 @@ class Database:
         """Initialize SQLite database."""
         # Ensure data directory exists
         os.makedirs(os.path.dirname(SQLITE_PATH), exist_ok=True)
-        self._create_tables()
+        self._fts_enabled = False
+        self._schema_ready = False
+        self._schema_lock = threading.Lock()
+        self.pragma_profile = dict(PRAGMA_PROFILE)
+        self._maintenance_lock = threading.Lock()
+        self._writes_since_checkpoint = 0
+        self._last_optimize = time.monotonic()
+        self._version_conn = None
+        self._version_lock = threading.Lock()
+        self._seen_data_version = None  # data_version after our last commit or poll
+        self._external_changes = 0
+        self._tx_local = threading.local()  # Per-thread transaction() depth
+        self.pool = ConnectionPool(self._connect)
 
-    def _create_tables(self):
-        """Create all required tables."""
-        conn = sqlite3.connect(SQLITE_PATH)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS users (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                username TEXT UNIQUE NOT NULL,
-                password_hash TEXT NOT NULL,
-                email TEXT,
-                phone TEXT,
-                address TEXT,
-                role TEXT DEFAULT 'pending' CHECK(role IN ('admin', 'user', 'pending')),
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS item_types (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT UNIQUE NOT NULL,
-                custom_attributes TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS items (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                type_id INTEGER NOT NULL,
-                owner_id INTEGER NOT NULL,
-                name TEXT NOT NULL,
-                description TEXT,
-                location TEXT,
-                contact_phone TEXT,
-                contact_email TEXT,
-                image_path TEXT,
-                custom_values TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (type_id) REFERENCES item_types(id) ON DELETE CASCADE,
-                FOREIGN KEY (owner_id) REFERENCES users(id) ON DELETE CASCADE
-            )
-        """)
-        
-        # Migration: Add image_path column if it doesn't exist
-        cursor.execute("PRAGMA table_info(items)")
-        columns = [column[1] for column in cursor.fetchall()]
-        if 'image_path' not in columns:
-            cursor.execute("ALTER TABLE items ADD COLUMN image_path TEXT")
-        
-        # Check if admin user exists
-        cursor.execute("SELECT COUNT(*) FROM users WHERE role = 'admin'")
-        admin_count = cursor.fetchone()[0]
-        if admin_count == 0:
-            import bcrypt
-            default_password = bcrypt.hashpw("admin123".encode(), bcrypt.gensalt()).decode()
-            cursor.execute(
-                "INSERT INTO users (username, password_hash, email, role) VALUES (?, ?, ?, ?)",
-                ('admin', default_password, 'admin@campus.edu', 'admin')
-            )
-        
+    @property
+    def fts_enabled(self) -> bool:
+        """Whether the items_fts full-text index is available."""
+        if not self._schema_ready:
+            with self.pool.connection():
+                pass
+        return self._fts_enabled
+
+    def _ensure_schema(self, conn):
+        """Bring the schema up to date once per process (fast path: one query)."""
+        with self._schema_lock:
+            if self._schema_ready:
+                return
+            if not SCHEMA_VERSIONS <= self._applied_versions(conn):
+                self._migrate(conn)
+            row = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'items_fts'"
+            ).fetchone()
+            self._fts_enabled = row is not None
+            self._schema_ready = True
+
+    @staticmethod
+    def _applied_versions(conn) -> set:
+        try:
+            rows = conn.execute("SELECT version FROM schema_version").fetchall()
+        except sqlite3.OperationalError:
+            return set()  # No schema_version table yet
+        return {row[0] for row in rows}
+
+    def _migrate(self, conn):
+        """Apply pending migrations, each in its own transaction."""
+        conn.execute("CREATE TABLE IF NOT EXISTS schema_version (version INTEGER PRIMARY KEY)")
         conn.commit()
-        conn.close()
+        for version, migration in MIGRATIONS:
+            # IMMEDIATE takes the write lock, so concurrent app instances
+            # cannot apply the same migration twice
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if version in self._applied_versions(conn):
+                    conn.rollback()
+                    continue
+                cursor = conn.cursor()
+                if migration(cursor) is not False:
+                    cursor.execute("INSERT INTO schema_version (version) VALUES (?)", (version,))
+                cursor.close()
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
 
-    def get_connection(self):
-        """Get a database connection."""
-        conn = sqlite3.connect(SQLITE_PATH)
+    def _connect(self):
+        """Open a new SQLite connection (used by the pool)."""
+        conn = sqlite3.connect(SQLITE_PATH, check_same_thread=False)
         conn.row_factory = sqlite3.Row
+        self._apply_pragmas(conn)
+        if not self._schema_ready:
+            self._ensure_schema(conn)
         return conn
 
+    def _apply_pragmas(self, conn):
+        # journal_mode must be set before the other settings take effect
+        for name in sorted(self.pragma_profile, key=lambda n: n != 'journal_mode'):
+            conn.execute(f"PRAGMA {name} = {self.pragma_profile[name]}")
+
+    def set_pragma_profile(self, **pragmas):
+        """
+        Override PRAGMA_PROFILE entries (e.g. cache_size=-64000).
+        Idle connections are closed so that new ones pick up the profile.
+        """
+        self.pragma_profile.update(pragmas)
+        self.pool.close_all()
+
+    def _after_write(self, conn):
+        """
+        Periodic WAL checkpoint and PRAGMA optimize, run after commits.
+        Best effort: the write has already committed, so a failure here
+        (e.g. SQLITE_BUSY) is logged instead of raised to the caller.
+        """
+        with self._maintenance_lock:
+            self._writes_since_checkpoint += 1
+            checkpoint = self._writes_since_checkpoint >= CHECKPOINT_EVERY_WRITES
+            if checkpoint:
+                self._writes_since_checkpoint = 0
+            optimize = time.monotonic() - self._last_optimize >= OPTIMIZE_INTERVAL
+            if optimize:
+                self._last_optimize = time.monotonic()
+        try:
+            if checkpoint:
+                self.checkpoint(conn)
+            if optimize:
+                conn.execute("PRAGMA optimize")
+        except sqlite3.Error as e:
+            print(f"Database maintenance after commit failed: {e}")
+
+    def data_version(self) -> int:
+        """
+        PRAGMA data_version of a dedicated read-only connection. The value
+        changes whenever any other connection (in this process or another
+        one) commits to the database.
+        """
+        with self._version_lock:
+            return self._read_data_version()
+
+    def _read_data_version(self) -> int:
+        """Caller must hold _version_lock."""
+        if self._version_conn is None:
+            self._version_conn = sqlite3.connect(SQLITE_PATH, check_same_thread=False)
+        return self._version_conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def _poll_external(self):
+        """Count a data_version change we did not cause. Caller must hold _version_lock."""
+        version = self._read_data_version()
+        if self._seen_data_version is not None and version != self._seen_data_version:
+            self._external_changes += 1
+        self._seen_data_version = version
+
+    def external_changes(self) -> int:
+        """
+        Number of times a commit by another process (or a connection not
+        managed by this Database) has been detected. Commits made through
+        execute_query/execute_many/transaction() are not counted, so caches
+        can compare this value to know when to drop everything.
+        """
+        with self._version_lock:
+            self._poll_external()
+            return self._external_changes
+
+    def _commit(self, conn):
+        """
+        Commit conn and record the resulting data_version as our own.
+        The pending write holds the database write lock, so no other
+        connection can commit between the poll and the commit.
+        """
+        with self._version_lock:
+            self._poll_external()
+            conn.commit()
+            self._seen_data_version = self._read_data_version()
+
+    def checkpoint(self, conn=None):
+        """Copy WAL content back into the database without blocking readers."""
+        if conn is None:
+            with self.pool.connection() as conn:
+                conn.execute("PRAGMA wal_checkpoint(PASSIVE)").fetchone()
+        else:
+            conn.execute("PRAGMA wal_checkpoint(PASSIVE)").fetchone()
+
+    @contextmanager
+    def get_connection(self):
+        """
+        Borrow a pooled database connection for the duration of a with
+        block; it goes back to the pool (uncommitted work rolled back) on
+        exit:
+
+            with db.get_connection() as conn:
+                conn.execute(...)
+        """
+        with self.pool.connection() as conn:
+            yield conn
+
+    def set_pool_size(self, max_size: int):
+        """Configure the maximum number of pooled connections."""
+        self.pool.resize(max_size)
+
+    def pool_stats(self) -> dict:
+        """Get connection pool counters (hits, misses, waits, wait_time...)."""
+        return self.pool.stats()
+
+    def close(self):
+        """Run PRAGMA optimize, then close all idle pooled connections."""
+        try:
+            with self.pool.connection() as conn:
+                conn.execute("PRAGMA optimize")
+        except sqlite3.Error as e:
+            print(f"Error optimizing database: {e}")
+        self.pool.close_all()
+        with self._version_lock:
+            if self._version_conn is not None:
+                self._version_conn.close()
+                self._version_conn = None
+                self._seen_data_version = None
+
+    def _in_transaction(self) -> bool:
+        return getattr(self._tx_local, 'depth', 0) > 0
+
+    @contextmanager
+    def transaction(self):
+        """
+        Run several statements atomically with a single commit:
+
+            with db.transaction():
+                db.execute_query(...)
+                db.execute_many(...)
+
+        execute_query/execute_many calls on the same thread join the
+        transaction instead of committing on their own. Commits when the
+        outermost block exits, rolls back if it raises. Yields the
+        connection for direct use.
+        """
+        conn = self.pool.acquire()
+        depth = getattr(self._tx_local, 'depth', 0)
+        try:
+            if depth == 0:
+                # IMMEDIATE takes the write lock up front, so the block
+                # cannot fail half-way on a lock upgrade
+                conn.execute("BEGIN IMMEDIATE")
+            self._tx_local.depth = depth + 1
+            try:
+                yield conn
+            finally:
+                self._tx_local.depth = depth
+            if depth == 0:
+                self._commit(conn)
+                self._after_write(conn)
+        except BaseException:
+            if depth == 0 and conn.in_transaction:
+                conn.rollback()
+            raise
+        finally:
+            self.pool.release(conn)
+
+    def execute_many(self, query, seq_of_params) -> int:
+        """
+        Run one statement for every parameter tuple with executemany and a
+        single commit (or as part of the enclosing transaction()).
+        Returns the number of affected rows.
+        """
+        conn = self.pool.acquire()
+        query = query.replace('%s', '?')
+        cursor = conn.cursor()
+        try:
+            cursor.executemany(query, seq_of_params)
+            if not self._in_transaction():
+                self._commit(conn)
+                self._after_write(conn)
+            return cursor.rowcount
+        finally:
+            cursor.close()
+            self.pool.release(conn)
+
     def execute_query(self, query, params=None, fetch=False, fetchone=False):
-        """Execute a query and optionally fetch results."""
-        conn = self.get_connection()
+        """
+        Execute a query and optionally fetch results.
+        Writes commit immediately unless called inside transaction().
+        """
+        conn = self.pool.acquire()
         # Convert MySQL placeholders to SQLite
         query = query.replace('%s', '?')
         cursor = conn.cursor()
@@ -113,12 +635,14 @@ class Database:
                 if result:
                     result = dict(result)
             else:
-                conn.commit()
                 result = cursor.lastrowid
+                if not self._in_transaction():
+                    self._commit(conn)
+                    self._after_write(conn)
             return result
         finally:
             cursor.close()
-            conn.close()
+            self.pool.release(conn)
 
 
 # Global database instance
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+# model/item_export.py
+"""
+Streaming item export to CSV, JSONL or Parquet.
+
+Items come from ItemManager.iter_items(), a cursor iterator, and are
+written as they are read, so memory use does not grow with the catalog.
+Output goes to a temporary file that replaces the target only when the
+export is complete. Parquet needs the optional pyarrow package.
+Run from the project root:
+
+    python -m model.item_export items.jsonl
+    python -m model.item_export books.csv --type Books
+
+The CSV/JSONL output can be read back with model.item_import.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+import uuid
+from model.item_manager import ItemManager, EXPORT_FIELDS, EXPORT_BATCH_SIZE
+
+EXPORT_FORMATS = ('csv', 'jsonl', 'parquet')
+
+
+def _create_temp(directory: str) -> tuple:
+    """
+    Create a new temporary file in directory and return (fd, path). Unlike
+    mkstemp (always 0600), the kernel applies the umask as for open().
+    """
+    path = os.path.join(directory, f"{uuid.uuid4().hex}.tmp")
+    flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, 'O_BINARY', 0)
+    return os.open(path, flags, 0o666), path
+
+
+def _write_csv(items, f) -> int:
+    writer = csv.DictWriter(f, fieldnames=EXPORT_FIELDS)
+    writer.writeheader()
+    count = 0
+    for item in items:
+        item['custom_values'] = json.dumps(item['custom_values'], ensure_ascii=False)
+        writer.writerow(item)
+        count += 1
+    return count
+
+
+def _write_jsonl(items, f) -> int:
+    count = 0
+    for item in items:
+        f.write(json.dumps(item, ensure_ascii=False))
+        f.write('\n')
+        count += 1
+    return count
+
+
+def _write_parquet(items, path: str, batch_size: int) -> int:
+    """Write one Parquet row group per batch; custom_values is a JSON column."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("Parquet export needs pyarrow (pip install pyarrow)")
+
+    schema = pa.schema([
+        ('id', pa.int64()), ('type_name', pa.string()), ('owner_name', pa.string()),
+        ('name', pa.string()), ('description', pa.string()), ('location', pa.string()),
+        ('contact_phone', pa.string()), ('contact_email', pa.string()),
+        ('image_path', pa.string()), ('custom_values', pa.string()),
+        ('created_at', pa.string()),
+    ])
+    count = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        batch = []
+        for item in items:
+            item['custom_values'] = json.dumps(item['custom_values'], ensure_ascii=False)
+            batch.append(item)
+            if len(batch) >= batch_size:
+                writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                count += len(batch)
+                batch = []
+        if batch:
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+            count += len(batch)
+    return count
+
+
+def export_items(path: str, fmt: str = None, type_id: int = None,
+                 batch_size: int = EXPORT_BATCH_SIZE) -> dict:
+    """
+    Export items (optionally of one type) to path. fmt is one of
+    EXPORT_FORMATS; by default it follows the file extension.
+    Returns {'rows', 'seconds', 'rows_per_sec'}.
+    """
+    fmt = fmt or os.path.splitext(path)[1].lower().lstrip('.')
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format {fmt!r}, expected one of {', '.join(EXPORT_FORMATS)}")
+
+    started = time.perf_counter()
+    items = ItemManager().iter_items(type_id, batch_size)
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = _create_temp(directory)
+    try:
+        if fmt == 'parquet':
+            os.close(fd)
+            rows = _write_parquet(items, temp_path, batch_size)
+        else:
+            with os.fdopen(fd, 'w', newline='', encoding='utf-8') as f:
+                rows = _write_csv(items, f) if fmt == 'csv' else _write_jsonl(items, f)
+        os.replace(temp_path, path)
+    except BaseException:
+        items.close()
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+    seconds = time.perf_counter() - started
+    return {'rows': rows, 'seconds': seconds, 'rows_per_sec': rows / seconds if seconds else 0.0}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export items to CSV, JSONL or Parquet.")
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, help="default: from the file extension")
+    parser.add_argument("--type", help="only export items of this type (id or name)")
+    parser.add_argument("--batch-size", type=int, default=EXPORT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    type_id = None
+    if args.type:
+        from model.item_type_manager import ItemTypeManager
+        matches = [t['id'] for t in ItemTypeManager().get_all_types()
+                   if str(t['id']) == args.type or t['name'] == args.type]
+        if not matches:
+            print(f"Error: unknown type {args.type!r}")
+            sys.exit(2)
+        type_id = matches[0]
+
+    try:
+        report = export_items(args.path, args.format, type_id, args.batch_size)
+    except (ValueError, RuntimeError) as e:
+        print(f"Error: {e}")
+        sys.exit(2)
+    print(f"Exported {report['rows']} rows to {args.path} "
+          f"in {report['seconds']:.2f}s ({report['rows_per_sec']:.0f} rows/sec)")
@@ -0,0 +1,344 @@
+# -*- coding: utf-8 -*-
+# model/item_import.py
+"""
+Bulk item import from CSV or JSONL into SQLite.
+
+Rows are streamed from the input, validated against their type's
+custom_attributes and inserted with executemany, one transaction per
+batch, so the write lock is only held for a batch at a time and the
+running app keeps writing in between. If a batch fails, the batches
+before it stay committed and ImportInterrupted names the input line to
+resume from (--start-line). Indexes and FTS triggers are deliberately
+left in place rather than dropped and rebuilt around the import: a
+crash part way would otherwise leave the database without them. Run
+from the project root:
+
+    python -m model.item_import catalog.jsonl
+    python -m model.item_import items.csv --type Books --owner admin
+    python -m model.item_import catalog.jsonl --start-line 120001
+
+Columns / keys: name (required), description, location, contact_phone
+(or contact_info, as in the legacy items.csv), contact_email, image_path,
+created_at (ISO date or date/time, stored as UTC 'YYYY-MM-DD HH:MM:SS'),
+type_id (an id) or type / type_name (a name), owner_id (an id) or
+owner / owner_name (a username), and custom_values (a JSON object). In
+CSV files, columns named after a custom attribute are also accepted as
+its value.
+"""
+import argparse
+import csv
+import json
+import os
+import sqlite3
+import sys
+import time
+from datetime import date, datetime, timezone
+from model.database import db
+
+# Rows passed to each executemany call
+IMPORT_BATCH_SIZE = 1000
+# Rejected rows kept in the report (the count is always exact)
+MAX_REJECTS_KEPT = 1000
+
+ITEM_FIELDS = ('name', 'description', 'location', 'contact_phone',
+               'contact_email', 'image_path', 'created_at')
+
+_INSERT = """
+    INSERT INTO items (type_id, owner_id, name, description, location,
+                       contact_phone, contact_email, image_path, custom_values,
+                       created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP))
+"""
+
+
+class RowRejected(ValueError):
+    """A row that cannot be imported; the message is the reason."""
+
+
+class ImportInterrupted(RuntimeError):
+    """
+    A batch failed to commit. Earlier batches are committed; report is
+    the report so far and resume_line the first input line to import
+    again (pass it as start_line).
+    """
+
+    def __init__(self, error: Exception, report: dict, resume_line: int):
+        super().__init__(f"{error}; {report['imported']} rows were committed, "
+                         f"resume from line {resume_line}")
+        self.error = error
+        self.report = report
+        self.resume_line = resume_line
+
+
+def read_rows(path: str, fmt: str = None):
+    """
+    Yield (line number, row dict) from a CSV or JSONL file, one at a time.
+    fmt is 'csv' or 'jsonl'; by default it follows the file extension.
+    """
+    fmt = fmt or ('jsonl' if os.path.splitext(path)[1].lower() in ('.jsonl', '.json') else 'csv')
+    with open(path, 'r', newline='', encoding='utf-8-sig') as f:
+        if fmt == 'csv':
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, row
+            return
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                yield line_no, e
+                continue
+            yield line_no, row
+
+
+class ItemImporter:
+    """
+    Validates rows and writes them in batches.
+
+    default_type / default_owner are used for rows that do not name their
+    own, e.g. the legacy CsvDataManager items.csv. An int is an id, a
+    str is a type name / username (names made of digits are still names).
+    """
+
+    def __init__(self, default_type=None, default_owner=None,
+                 batch_size: int = IMPORT_BATCH_SIZE):
+        self.batch_size = batch_size
+        self._types_by_id = {}
+        self._types_by_name = {}
+        self._owners_by_id = {}
+        self._owners_by_name = {}
+        self._load_lookups()
+        self.default_type = None
+        if default_type is not None:
+            self.default_type = (self._type_by_id(default_type) if isinstance(default_type, int)
+                                 else self._type_by_name(default_type))
+        self.default_owner = None
+        if default_owner is not None:
+            self.default_owner = (self._owner_by_id(default_owner) if isinstance(default_owner, int)
+                                  else self._owner_by_name(default_owner))
+
+    def _load_lookups(self):
+        from model.item_type_manager import ItemTypeManager
+        for item_type in ItemTypeManager().get_all_types():
+            self._types_by_id[item_type['id']] = item_type
+            self._types_by_name[item_type['name']] = item_type
+        for user in db.execute_query("SELECT id, username FROM users", fetch=True):
+            self._owners_by_id[user['id']] = user['id']
+            self._owners_by_name[user['username']] = user['id']
+
+    @staticmethod
+    def _id(field: str, value) -> int:
+        if isinstance(value, bool):
+            raise RowRejected(f"{field} {value!r} is not an integer id")
+        try:
+            return int(str(value).strip())
+        except ValueError:
+            raise RowRejected(f"{field} {value!r} is not an integer id")
+
+    def _type_by_id(self, value) -> dict:
+        item_type = self._types_by_id.get(self._id('type_id', value))
+        if item_type is None:
+            raise RowRejected(f"unknown type_id {value!r}")
+        return item_type
+
+    def _type_by_name(self, value) -> dict:
+        item_type = self._types_by_name.get(str(value))
+        if item_type is None:
+            raise RowRejected(f"unknown type {value!r}")
+        return item_type
+
+    def _owner_by_id(self, value) -> int:
+        owner_id = self._owners_by_id.get(self._id('owner_id', value))
+        if owner_id is None:
+            raise RowRejected(f"unknown owner_id {value!r}")
+        return owner_id
+
+    def _owner_by_name(self, value) -> int:
+        owner_id = self._owners_by_name.get(str(value))
+        if owner_id is None:
+            raise RowRejected(f"unknown owner {value!r}")
+        return owner_id
+
+    @staticmethod
+    def _given(row: dict, key: str) -> bool:
+        return row.get(key) not in (None, '')
+
+    def validate(self, row: dict) -> tuple:
+        """Turn an input row into INSERT parameters, or raise RowRejected."""
+        if not isinstance(row, dict):
+            raise RowRejected("not an object")
+
+        if self._given(row, 'type_id'):
+            item_type = self._type_by_id(row['type_id'])
+        elif self._given(row, 'type') or self._given(row, 'type_name'):
+            item_type = self._type_by_name(row.get('type') or row.get('type_name'))
+        else:
+            item_type = self.default_type
+        if item_type is None:
+            raise RowRejected("missing type")
+        if self._given(row, 'owner_id'):
+            owner_id = self._owner_by_id(row['owner_id'])
+        elif self._given(row, 'owner') or self._given(row, 'owner_name'):
+            owner_id = self._owner_by_name(row.get('owner') or row.get('owner_name'))
+        else:
+            owner_id = self.default_owner
+        if owner_id is None:
+            raise RowRejected("missing owner")
+
+        values = {field: row.get(field) for field in ITEM_FIELDS}
+        if values['contact_phone'] is None:
+            values['contact_phone'] = row.get('contact_info')
+        values = {k: (str(v).strip() if v is not None else None) for k, v in values.items()}
+        if not values['name']:
+            raise RowRejected("missing name")
+
+        custom_values = self._custom_values(row, item_type)
+        return (item_type['id'], owner_id, values['name'], values['description'] or '',
+                values['location'] or '', values['contact_phone'] or '',
+                values['contact_email'] or '', values['image_path'] or None,
+                json.dumps(custom_values), self._created_at(values['created_at']))
+
+    @staticmethod
+    def _created_at(value: str):
+        """
+        Normalize created_at to the 'YYYY-MM-DD HH:MM:SS' UTC text that
+        CURRENT_TIMESTAMP produces; listings page by (created_at, id), so a
+        differently formatted value would sort out of place.
+        """
+        if not value:
+            return None
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            raise RowRejected(f"created_at: {value!r} is not an ISO date or date/time")
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+        return parsed.isoformat(sep=' ', timespec='seconds')
+
+    @staticmethod
+    def _custom_values(row: dict, item_type: dict) -> dict:
+        """Check custom values against the type's custom_attributes."""
+        attributes = {attr['name']: attr.get('type', 'text')
+                      for attr in item_type.get('custom_attributes') or []}
+        given = row.get('custom_values') or {}
+        if isinstance(given, str):
+            try:
+                given = json.loads(given)
+            except ValueError:
+                raise RowRejected("custom_values is not valid JSON")
+        if not isinstance(given, dict):
+            raise RowRejected("custom_values must be an object")
+        unknown = set(given) - set(attributes)
+        if unknown:
+            raise RowRejected(f"unknown attributes for {item_type['name']}: {', '.join(sorted(unknown))}")
+
+        custom_values = {}
+        for name, attr_type in attributes.items():
+            value = given.get(name, row.get(name))
+            value = '' if value is None else str(value).strip()
+            if value and attr_type == 'number':
+                try:
+                    float(value)
+                except ValueError:
+                    raise RowRejected(f"{name}: {value!r} is not a number")
+            elif value and attr_type == 'date':
+                try:
+                    date.fromisoformat(value)
+                except ValueError:
+                    raise RowRejected(f"{name}: {value!r} is not a yyyy-mm-dd date")
+            custom_values[name] = value
+        return custom_values
+
+    def run(self, rows, start_line: int = 1) -> dict:
+        """
+        Import (line number, row) pairs as produced by read_rows(),
+        skipping lines before start_line. Returns a report: imported,
+        rejected, rejects [(line, reason)], seconds, rows_per_sec.
+        Each batch is committed on its own; a failing batch raises
+        ImportInterrupted.
+        """
+        started = time.perf_counter()
+        report = {'imported': 0, 'rejected': 0, 'rejects': []}
+        resume_line = start_line
+
+        try:
+            batch = []
+            for line_no, row in rows:
+                if line_no < start_line:
+                    continue
+                try:
+                    if isinstance(row, Exception):
+                        raise RowRejected(f"invalid JSON: {row}")
+                    batch.append(self.validate(row))
+                except RowRejected as e:
+                    report['rejected'] += 1
+                    if len(report['rejects']) < MAX_REJECTS_KEPT:
+                        report['rejects'].append((line_no, str(e)))
+                    continue
+                if len(batch) >= self.batch_size:
+                    resume_line = self._commit_batch(batch, report, resume_line, line_no)
+                    batch = []
+            if batch:
+                self._commit_batch(batch, report, resume_line, line_no)
+        finally:
+            from model.item_manager import ItemManager
+            ItemManager.clear_cache()
+
+        report['seconds'] = time.perf_counter() - started
+        report['rows_per_sec'] = report['imported'] / report['seconds'] if report['seconds'] else 0.0
+        return report
+
+    @staticmethod
+    def _commit_batch(batch: list, report: dict, resume_line: int, last_line: int) -> int:
+        """Insert and commit one batch; returns the line to resume after it."""
+        try:
+            report['imported'] += db.execute_many(_INSERT, batch)
+        except sqlite3.Error as e:
+            raise ImportInterrupted(e, report, resume_line) from e
+        return last_line + 1
+
+
+def import_items(path: str, fmt: str = None, start_line: int = 1, **options) -> dict:
+    """Import a CSV/JSONL file; options are passed to ItemImporter."""
+    return ItemImporter(**options).run(read_rows(path, fmt), start_line)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk import items from CSV or JSONL.")
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=("csv", "jsonl"), help="default: from the file extension")
+    type_group = parser.add_mutually_exclusive_group()
+    type_group.add_argument("--type", help="type name for rows without one")
+    type_group.add_argument("--type-id", type=int, help="type id for rows without one")
+    owner_group = parser.add_mutually_exclusive_group()
+    owner_group.add_argument("--owner", help="owner username for rows without one")
+    owner_group.add_argument("--owner-id", type=int, help="owner id for rows without one")
+    parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE)
+    parser.add_argument("--start-line", type=int, default=1,
+                        help="skip input lines before this one (to resume an interrupted import)")
+    args = parser.parse_args()
+
+    try:
+        importer = ItemImporter(
+            default_type=args.type if args.type_id is None else args.type_id,
+            default_owner=args.owner if args.owner_id is None else args.owner_id,
+            batch_size=args.batch_size
+        )
+        report = importer.run(read_rows(args.path, args.format), args.start_line)
+    except RowRejected as e:
+        print(f"Error: {e}")
+        sys.exit(2)
+    except ImportInterrupted as e:
+        print(f"Error: {e}")
+        print(f"Resume with: --start-line {e.resume_line}")
+        sys.exit(1)
+
+    for line_no, reason in report['rejects']:
+        print(f"REJECTED line {line_no}: {reason}")
+    if report['rejected'] > len(report['rejects']):
+        print(f"... {report['rejected'] - len(report['rejects'])} more rejected rows")
+    print(f"Imported {report['imported']} rows, rejected {report['rejected']} "
+          f"in {report['seconds']:.2f}s ({report['rows_per_sec']:.0f} rows/sec)")
+    sys.exit(1 if report['rejected'] else 0)
@@ -3,11 +3,156 @@
 """
 Item Management: CRUD operations for items with category support.
 """
+import copy
 import json
-from model.database import db
+import threading
+import time
+from collections import OrderedDict
+from model.database import db, FTS_MIN_QUERY_LENGTH
+
+# Number of items fetched per page by the item grid
+DEFAULT_PAGE_SIZE = 40
+
+# Rows fetched per cursor round trip by iter_items()
+EXPORT_BATCH_SIZE = 500
+
+# Columns yielded by iter_items(), in export order
+EXPORT_FIELDS = ('id', 'type_name', 'owner_name', 'name', 'description', 'location',
+                 'contact_phone', 'contact_email', 'image_path', 'custom_values',
+                 'created_at')
+
+# Ids looked up per IN (...) query by delete_items()
+DELETE_CHUNK_SIZE = 500
+
+# Listing result cache settings
+LISTING_CACHE_SIZE = 256     # Maximum number of cached pages
+LISTING_CACHE_TTL = 30.0     # Seconds before a cached page is refetched
+
+
+class _ListingCache:
+    """
+    Process-wide LRU cache of listing pages keyed by
+    (type_id, keyword, page_size, cursor). type_id None means all types.
+
+    ItemManager writes invalidate only the affected type; other writes in
+    this process that change listings (type renames and deletes, imports)
+    clear the cache explicitly. Commits by other processes are detected
+    through db.external_changes() and clear everything; the TTL bounds
+    staleness in any remaining window. Pages are deep-copied in and out,
+    so callers may modify what they get back.
+    """
+
+    def __init__(self, max_entries: int = LISTING_CACHE_SIZE, ttl: float = LISTING_CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (stored_at, items)
+        self._generation = 0           # Bumped on every invalidation
+        self._external_changes = None  # db.external_changes() last seen
+        self._stats = {'hits': 0, 'misses': 0, 'expired': 0, 'evictions': 0,
+                       'invalidations': 0, 'external_invalidations': 0}
+
+    def get(self, key):
+        """Return (items or None, generation to pass to put())."""
+        external_changes = db.external_changes()
+        with self._lock:
+            if external_changes != self._external_changes:
+                if self._external_changes is not None and self._entries:
+                    self._stats['external_invalidations'] += 1
+                self._clear_locked()
+                self._external_changes = external_changes
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] > self.ttl:
+                del self._entries[key]
+                self._stats['expired'] += 1
+                entry = None
+            if entry is None:
+                self._stats['misses'] += 1
+                return None, self._generation
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            return copy.deepcopy(entry[1]), self._generation
+
+    def put(self, key, items: list, generation: int):
+        """Store a page unless an invalidation happened since get()."""
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = (time.monotonic(), copy.deepcopy(items))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+
+    def invalidate_type(self, type_id):
+        """Drop pages that may contain items of type_id (and all-type pages)."""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] in (type_id, None)]:
+                del self._entries[key]
+            self._generation += 1
+            self._stats['invalidations'] += 1
+
+    def clear(self):
+        with self._lock:
+            self._clear_locked()
+
+    def _clear_locked(self):
+        self._entries.clear()
+        self._generation += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+            lookups = stats['hits'] + stats['misses']
+            stats.update(entries=len(self._entries), max_entries=self.max_entries,
+                         ttl=self.ttl, hit_rate=stats['hits'] / lookups if lookups else 0.0)
+        return stats
+
+
+_listing_cache = _ListingCache()
+
+
+class ItemEvent:
+    """
+    A list of callbacks, connected like a Qt signal (the model layer does
+    not depend on Qt). Callbacks run on the thread that made the change.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._callbacks = []
+
+    def connect(self, callback):
+        with self._lock:
+            self._callbacks.append(callback)
+
+    def disconnect(self, callback):
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def emit(self, *args):
+        with self._lock:
+            callbacks = list(self._callbacks)
+        for callback in callbacks:
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"Item event callback error: {e}")
+
 
 class ItemManager:
-    """Handles item database operations."""
+    """
+    Handles item database operations.
+
+    item_added(item) and item_removed(item_id) fire after a successful
+    add_item/delete_item, so views can update one item in place instead
+    of reloading the listing.
+    """
+
+    # Shared by all ItemManager instances
+    item_added = ItemEvent()
+    item_removed = ItemEvent()
 
     def add_item(self, type_id: int, owner_id: int, name: str, description: str,
                  location: str, contact_phone: str, contact_email: str,
@@ -22,41 +167,139 @@ class ItemManager:
             (type_id, owner_id, name, description, location, 
              contact_phone, contact_email, image_path, json.dumps(custom_values))
         )
+        _listing_cache.invalidate_type(type_id)
+        # Full row (owner/type names, created_at) as listings return it
+        item = self.get_item_by_id(item_id)
+        if item:
+            self.item_added.emit(item)
         return {'id': item_id, 'name': name}
 
-    def get_items_by_type(self, type_id: int) -> list:
-        """Get all items of a specific type."""
-        items = db.execute_query(
-            """
-            SELECT i.*, u.username as owner_name, t.name as type_name
-            FROM items i
-            JOIN users u ON i.owner_id = u.id
-            JOIN item_types t ON i.type_id = t.id
-            WHERE i.type_id = ?
-            ORDER BY i.created_at DESC
-            """,
-            (type_id,),
-            fetch=True
+    def get_items_by_type(self, type_id: int, page_size: int = None, cursor: tuple = None) -> list:
+        """
+        Get items of a specific type, newest first.
+        Pass page_size to fetch one page; pass the cursor returned by
+        next_cursor() to continue after the previous page.
+        """
+        return self._cached(
+            (type_id, None, page_size, cursor),
+            lambda: self._fetch_items("i.type_id = ?", (type_id,), page_size, cursor)
         )
-        for item in items:
-            if isinstance(item['custom_values'], str):
-                item['custom_values'] = json.loads(item['custom_values'])
-            elif item['custom_values'] is None:
-                item['custom_values'] = {}
+
+    def get_all_items(self, page_size: int = None, cursor: tuple = None) -> list:
+        """Get all items, newest first (optionally one page at a time)."""
+        return self._cached(
+            (None, None, page_size, cursor),
+            lambda: self._fetch_items(None, (), page_size, cursor)
+        )
+
+    def search_items(self, type_id: int, keyword: str,
+                     page_size: int = None, cursor: tuple = None) -> list:
+        """
+        Search items by type and keyword.
+        Uses the items_fts index when available and ranks matches by bm25
+        (best first). Each ranked item gets its bm25 'search_score', and
+        ranked pages use the keyset (search_score, id), so rows added or
+        deleted between page loads do not shift the following pages.
+        Keywords too short for the trigram tokenizer fall back to a LIKE
+        scan, newest first with the usual (created_at, id) cursor.
+        """
+        return self._cached(
+            (type_id, keyword, page_size, cursor),
+            lambda: self._search_items(type_id, keyword, page_size, cursor)
+        )
+
+    def _search_items(self, type_id: int, keyword: str, page_size: int, cursor: tuple) -> list:
+        if db.fts_enabled and len(keyword) >= FTS_MIN_QUERY_LENGTH:
+            # Quote as an FTS5 string so the keyword is matched literally
+            match_query = '"' + keyword.replace('"', '""') + '"'
+            where = "i.type_id = ? AND items_fts MATCH ?"
+            params = (type_id, match_query)
+            if cursor is not None:
+                # Lower bm25 is better; equal scores continue by id, descending
+                score, item_id = cursor
+                where += (" AND (bm25(items_fts) > ?"
+                          " OR (bm25(items_fts) = ? AND i.id < ?))")
+                params += (score, score, item_id)
+            return self._fetch_items(
+                where, params, page_size, join_fts=True,
+                columns="bm25(items_fts) AS search_score",
+                order_by="search_score, i.id DESC"
+            )
+
+        keyword_pattern = f"%{keyword}%"
+        return self._fetch_items(
+            "i.type_id = ? AND (i.name LIKE ? OR i.description LIKE ?)",
+            (type_id, keyword_pattern, keyword_pattern), page_size, cursor
+        )
+
+    def _cached(self, key: tuple, load) -> list:
+        """Serve a listing from the result cache, loading it on a miss."""
+        items, generation = _listing_cache.get(key)
+        if items is None:
+            items = load()
+            _listing_cache.put(key, items, generation)
         return items
 
-    def get_all_items(self) -> list:
-        """Get all items."""
-        items = db.execute_query(
-            """
+    @staticmethod
+    def cache_stats() -> dict:
+        """Listing cache counters (hits, misses, evictions, invalidations...)."""
+        return _listing_cache.stats()
+
+    @staticmethod
+    def clear_cache():
+        """Drop every cached listing page."""
+        _listing_cache.clear()
+
+    @staticmethod
+    def next_cursor(items: list) -> tuple:
+        """
+        Cursor pointing after the last item of a page: the keyset
+        (created_at, id), or (search_score, id) for ranked search results.
+        """
+        if not items:
+            return None
+        last = items[-1]
+        if 'search_score' in last:
+            return (last['search_score'], last['id'])
+        return (last['created_at'], last['id'])
+
+    def _fetch_items(self, where: str, params: tuple, page_size: int = None,
+                     cursor: tuple = None, join_fts: bool = False,
+                     order_by: str = "i.created_at DESC, i.id DESC",
+                     columns: str = None) -> list:
+        """
+        Run the shared item listing query.
+        Pagination uses keyset on (created_at, id) instead of OFFSET, so
+        fetching a later page costs the same as fetching the first one.
+        columns adds select expressions (ranked search pages by its own
+        keyset in where and passes no cursor).
+        """
+        conditions = [where] if where else []
+        params = list(params)
+        if cursor is not None:
+            conditions.append("(i.created_at, i.id) < (?, ?)")
+            params.extend(cursor)
+
+        query = """
             SELECT i.*, u.username as owner_name, t.name as type_name
+        """
+        if columns:
+            query += f", {columns}"
+        query += """
             FROM items i
             JOIN users u ON i.owner_id = u.id
             JOIN item_types t ON i.type_id = t.id
-            ORDER BY i.created_at DESC
-            """,
-            fetch=True
-        )
+        """
+        if join_fts:
+            query += " JOIN items_fts ON items_fts.rowid = i.id"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += f" ORDER BY {order_by}"
+        if page_size is not None:
+            query += " LIMIT ?"
+            params.append(page_size)
+
+        items = db.execute_query(query, tuple(params), fetch=True)
         for item in items:
             if isinstance(item['custom_values'], str):
                 item['custom_values'] = json.loads(item['custom_values'])
@@ -64,41 +307,90 @@ class ItemManager:
                 item['custom_values'] = {}
         return items
 
-    def search_items(self, type_id: int, keyword: str) -> list:
-        """Search items by type and keyword."""
-        keyword_pattern = f"%{keyword}%"
-        items = db.execute_query(
-            """
-            SELECT i.*, u.username as owner_name, t.name as type_name
+    @staticmethod
+    def _export_query(type_id: int = None) -> tuple:
+        """(query, params) behind iter_items(); also checked by query_plan_check."""
+        query = """
+            SELECT i.id, t.name AS type_name, u.username AS owner_name, i.name,
+                   i.description, i.location, i.contact_phone, i.contact_email,
+                   i.image_path, i.custom_values, i.created_at
             FROM items i
             JOIN users u ON i.owner_id = u.id
             JOIN item_types t ON i.type_id = t.id
-            WHERE i.type_id = ? AND (i.name LIKE ? OR i.description LIKE ?)
-            ORDER BY i.created_at DESC
-            """,
-            (type_id, keyword_pattern, keyword_pattern),
-            fetch=True
-        )
-        for item in items:
-            if isinstance(item['custom_values'], str):
-                item['custom_values'] = json.loads(item['custom_values'])
-            elif item['custom_values'] is None:
-                item['custom_values'] = {}
-        return items
+        """
+        params = ()
+        if type_id is not None:
+            query += " WHERE i.type_id = ?"
+            params = (type_id,)
+        # Matches idx_items_type_created / idx_items_created, so SQLite
+        # streams rows in index order without a sort
+        query += " ORDER BY i.created_at DESC, i.id DESC"
+        return query, params
+
+    def iter_items(self, type_id: int = None, batch_size: int = EXPORT_BATCH_SIZE):
+        """
+        Yield every item (or every item of one type) as a dict with
+        EXPORT_FIELDS, newest first, reading the cursor batch_size rows at a
+        time. Unlike get_all_items() nothing is materialized, so memory
+        stays constant; the read runs on its own pooled connection and sees
+        one WAL snapshot, so the app can keep writing meanwhile.
+        The generator holds a pooled connection until it is exhausted or
+        closed, and the pool is per thread: consume or close() it on the
+        thread that created it, never hand it to another thread.
+        """
+        query, params = self._export_query(type_id)
+        with db.pool.connection() as conn:
+            cursor = conn.execute(query, params)
+            try:
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    for row in rows:
+                        item = dict(row)
+                        item['custom_values'] = json.loads(item['custom_values'] or '{}')
+                        yield item
+            finally:
+                cursor.close()
 
     def delete_item(self, item_id: int, owner_id: int = None) -> bool:
-        """Delete an item."""
-        if owner_id:
-            db.execute_query(
-                "DELETE FROM items WHERE id = ? AND owner_id = ?",
-                (item_id, owner_id)
-            )
-        else:
-            db.execute_query(
-                "DELETE FROM items WHERE id = ?",
-                (item_id,)
-            )
-        return True
+        """
+        Delete an item (only if owned by owner_id, if given).
+        Returns False if no such item was deleted.
+        """
+        return self.delete_items([item_id], owner_id) > 0
+
+    def delete_items(self, item_ids: list, owner_id: int = None) -> int:
+        """
+        Delete several items in one transaction (only those owned by
+        owner_id, if given). Returns the number of items deleted.
+        """
+        item_ids = list(dict.fromkeys(item_ids))
+        owner_filter = " AND owner_id = ?" if owner_id else ""
+        owner_params = (owner_id,) if owner_id else ()
+        rows = []
+        with db.transaction():
+            # Chunked to stay under SQLite's bound-parameter limit
+            for start in range(0, len(item_ids), DELETE_CHUNK_SIZE):
+                chunk = item_ids[start:start + DELETE_CHUNK_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                rows.extend(db.execute_query(
+                    f"SELECT id, type_id FROM items WHERE id IN ({placeholders}){owner_filter}",
+                    tuple(chunk) + owner_params,
+                    fetch=True
+                ))
+            deleted = 0
+            if rows:
+                deleted = db.execute_many(
+                    "DELETE FROM items WHERE id = ?",
+                    [(row['id'],) for row in rows]
+                )
+
+        for type_id in {row['type_id'] for row in rows}:
+            _listing_cache.invalidate_type(type_id)
+        for row in rows:
+            self.item_removed.emit(row['id'])
+        return deleted
 
     def get_item_by_id(self, item_id: int) -> dict:
         """Get a single item by ID."""
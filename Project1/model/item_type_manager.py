@@ -3,8 +3,68 @@
 """
 Item Type Management: Create, Update, Delete item categories.
 """
+import copy
 import json
+import threading
+import time
 from model.database import db
+from model.item_manager import ItemManager
+
+# Seconds a cached type list is trusted before the stored version is re-checked
+TYPE_CACHE_CHECK_INTERVAL = 2.0
+
+
+class _TypeCache:
+    """
+    Process-wide cache of decoded item types.
+
+    Writes through ItemTypeManager invalidate it immediately. Writes from
+    other app instances bump app_meta.item_types_version (via triggers),
+    which is re-read at most every TYPE_CACHE_CHECK_INTERVAL seconds.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._types = None
+        self._version = None
+        self._checked_at = 0.0
+
+    def get(self) -> list:
+        """Cached types, or None if they must be reloaded."""
+        with self._lock:
+            if self._types is None:
+                return None
+            if time.monotonic() - self._checked_at < TYPE_CACHE_CHECK_INTERVAL:
+                return self._types
+        version = _read_version()
+        with self._lock:
+            if self._types is None or version != self._version:
+                self._types = None
+                return None
+            self._checked_at = time.monotonic()
+            return self._types
+
+    def store(self, types: list, version: int):
+        with self._lock:
+            self._types = types
+            self._version = version
+            self._checked_at = time.monotonic()
+
+    def invalidate(self):
+        with self._lock:
+            self._types = None
+
+
+def _read_version() -> int:
+    row = db.execute_query(
+        "SELECT value FROM app_meta WHERE key = 'item_types_version'",
+        fetchone=True
+    )
+    return row['value'] if row else 0
+
+
+_type_cache = _TypeCache()
+
 
 class ItemTypeManager:
     """Handles item type (category) database operations."""
@@ -21,46 +81,65 @@ class ItemTypeManager:
             if 'UNIQUE constraint' in str(e):
                 return None
             raise
+        finally:
+            _type_cache.invalidate()
 
     def update_type(self, type_id: int, name: str, custom_attributes: list) -> bool:
         """Update an existing item type."""
-        db.execute_query(
-            "UPDATE item_types SET name = ?, custom_attributes = ? WHERE id = ?",
-            (name, json.dumps(custom_attributes), type_id)
-        )
+        try:
+            db.execute_query(
+                "UPDATE item_types SET name = ?, custom_attributes = ? WHERE id = ?",
+                (name, json.dumps(custom_attributes), type_id)
+            )
+        finally:
+            _type_cache.invalidate()
+            # Listings carry the type name
+            ItemManager.clear_cache()
         return True
 
     def delete_type(self, type_id: int) -> bool:
-        """Delete an item type."""
-        db.execute_query(
-            "DELETE FROM item_types WHERE id = ?",
-            (type_id,)
-        )
+        """Delete an item type and all of its items in one transaction."""
+        try:
+            with db.transaction():
+                db.execute_query(
+                    "DELETE FROM items WHERE type_id = ?",
+                    (type_id,)
+                )
+                db.execute_query(
+                    "DELETE FROM item_types WHERE id = ?",
+                    (type_id,)
+                )
+        finally:
+            _type_cache.invalidate()
+            ItemManager.clear_cache()
         return True
 
     def get_all_types(self) -> list:
-        """Get all item types."""
-        types = db.execute_query(
-            "SELECT * FROM item_types ORDER BY name",
-            fetch=True
-        )
-        for t in types:
-            if isinstance(t['custom_attributes'], str):
-                t['custom_attributes'] = json.loads(t['custom_attributes'])
-            elif t['custom_attributes'] is None:
-                t['custom_attributes'] = []
-        return types
+        """Get all item types (served from the type cache when current)."""
+        types = _type_cache.get()
+        if types is None:
+            # Read the version first: a write in between only causes a reload
+            version = _read_version()
+            types = db.execute_query(
+                "SELECT * FROM item_types ORDER BY name",
+                fetch=True
+            )
+            for t in types:
+                if isinstance(t['custom_attributes'], str):
+                    t['custom_attributes'] = json.loads(t['custom_attributes'])
+                elif t['custom_attributes'] is None:
+                    t['custom_attributes'] = []
+            _type_cache.store(types, version)
+        # Callers may modify what they get back
+        return copy.deepcopy(types)
 
     def get_type_by_id(self, type_id: int) -> dict:
         """Get a single item type by ID."""
-        item_type = db.execute_query(
-            "SELECT * FROM item_types WHERE id = ?",
-            (type_id,),
-            fetchone=True
-        )
-        if item_type:
-            if isinstance(item_type['custom_attributes'], str):
-                item_type['custom_attributes'] = json.loads(item_type['custom_attributes'])
-            elif item_type['custom_attributes'] is None:
-                item_type['custom_attributes'] = []
-        return item_type
+        for item_type in self.get_all_types():
+            if item_type['id'] == type_id:
+                return item_type
+        return None
+
+    def invalidate_cache(self):
+        """Force the next get_all_types() to reload from the database."""
+        _type_cache.invalidate()
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+# model/query_plan_check.py
+"""
+Query plan regression check.
+
+Runs every ItemManager/UserManager query through EXPLAIN QUERY PLAN
+(without executing it) and fails if any of them scans a table or an
+index instead of searching it, unless the query is listed in
+INTENDED_SCANS. Run from the project root:
+
+    python -m model.query_plan_check
+
+tests/test_query_plans.py runs the same check under pytest.
+"""
+import contextlib
+import re
+import sys
+from model.database import db
+
+# Every "SCAN <table>" reads all rows: "SCAN items" walks the table and
+# "SCAN i USING [COVERING] INDEX ..." walks a whole index. Only an FTS5
+# MATCH lookup ("SCAN items_fts VIRTUAL TABLE INDEX 0:M...") is a search.
+_SCAN = re.compile(r"^SCAN (\w+)")
+_FTS_MATCH = re.compile(r"^SCAN \w+ VIRTUAL TABLE INDEX \d+:M")
+
+# Queries that read every row by design, with the reason
+INTENDED_SCANS = {
+    "ItemManager.get_all_items": "unpaged listing returns every item (index order, no sort)",
+    "ItemManager.iter_items (type_id=None)": "export streams every item (index order, no sort)",
+}
+
+
+def explain(query: str, params=None) -> list:
+    """Return the EXPLAIN QUERY PLAN detail lines for a query."""
+    query = query.replace('%s', '?')
+    with db.pool.connection() as conn:
+        rows = conn.execute("EXPLAIN QUERY PLAN " + query, params or ()).fetchall()
+    return [row['detail'] for row in rows]
+
+
+def full_scans(plan: list) -> list:
+    """Tables that a plan reads in full (through the table or an index)."""
+    return [m.group(1) for m in map(_SCAN.match, plan)
+            if m and not _FTS_MATCH.match(m.string)]
+
+
+def collect_plans() -> list:
+    """
+    Call each manager method with db.execute_query and db.execute_many
+    replaced by stubs that record the query plan and return an empty
+    result (or the rows in stub_rows), and with db.transaction a no-op,
+    so nothing is read, written or locked. Returns (label, query, plan)
+    tuples.
+    """
+    from model.item_manager import ItemManager, DEFAULT_PAGE_SIZE
+    from model.item_type_manager import ItemTypeManager
+    from model.user_manager import UserManager
+
+    items = ItemManager()
+    types = ItemTypeManager()
+    users = UserManager()
+    cursor = ('2000-01-01 00:00:00', 1)
+    ranked_cursor = (-1.0, 1)
+    calls = [
+        ("ItemManager.add_item", lambda: items.add_item(1, 1, 'n', 'd', 'l', 'p', 'e', {})),
+        ("ItemManager.get_items_by_type", lambda: items.get_items_by_type(1)),
+        ("ItemManager.get_items_by_type (page)",
+         lambda: items.get_items_by_type(1, page_size=DEFAULT_PAGE_SIZE, cursor=cursor)),
+        ("ItemManager.get_all_items", lambda: items.get_all_items()),
+        ("ItemManager.get_all_items (page)",
+         lambda: items.get_all_items(page_size=DEFAULT_PAGE_SIZE, cursor=cursor)),
+        ("ItemManager.search_items", lambda: items.search_items(1, 'keyword')),
+        ("ItemManager.search_items (short)", lambda: items.search_items(1, 'k')),
+        ("ItemManager.search_items (page)",
+         lambda: items.search_items(1, 'keyword', page_size=DEFAULT_PAGE_SIZE,
+                                    cursor=ranked_cursor)),
+        ("ItemManager.search_items (short, page)",
+         lambda: items.search_items(1, 'k', page_size=DEFAULT_PAGE_SIZE, cursor=cursor)),
+        ("ItemManager.delete_item", lambda: items.delete_item(1)),
+        ("ItemManager.delete_item (owner)", lambda: items.delete_item(1, 1)),
+        ("ItemManager.delete_items", lambda: items.delete_items([1, 2])),
+        ("ItemManager.delete_items (owner)", lambda: items.delete_items([1, 2], 1)),
+        ("ItemTypeManager.delete_type", lambda: types.delete_type(1)),
+        ("ItemManager.get_item_by_id", lambda: items.get_item_by_id(1)),
+        ("UserManager.login", lambda: users.login('user', 'password')),
+        ("UserManager.get_pending_users", lambda: users.get_pending_users()),
+        ("UserManager.approve_user", lambda: users.approve_user(1)),
+        ("UserManager.reject_user", lambda: users.reject_user(1)),
+        ("UserManager.approve_users", lambda: users.approve_users([1, 2])),
+        ("UserManager.reject_users", lambda: users.reject_users([1, 2])),
+        ("UserManager.get_user_by_id", lambda: users.get_user_by_id(1)),
+    ]
+
+    # Rows the stub returns for a label's fetch, so that code paths that
+    # only run on a match (the executemany DELETE) are explained too
+    deleted_rows = [{'id': 1, 'type_id': 1}, {'id': 2, 'type_id': 1}]
+    stub_rows = {
+        "ItemManager.delete_item": deleted_rows[:1],
+        "ItemManager.delete_item (owner)": deleted_rows[:1],
+        "ItemManager.delete_items": deleted_rows,
+        "ItemManager.delete_items (owner)": deleted_rows,
+    }
+
+    results = []
+    label = None
+
+    # iter_items() reads through its own cursor instead of execute_query
+    for type_id in (None, 1):
+        query, params = ItemManager._export_query(type_id)
+        results.append((f"ItemManager.iter_items (type_id={type_id})", query,
+                         explain(query, params)))
+
+    def record(query, params=None, fetch=False, fetchone=False):
+        results.append((label, query, explain(query, params)))
+        if fetch:
+            return [dict(row) for row in stub_rows.get(label, [])]
+        if fetchone:
+            return None
+        return 0
+
+    def record_many(query, seq_of_params):
+        seq_of_params = list(seq_of_params)
+        params = seq_of_params[0] if seq_of_params else None
+        results.append((label, query, explain(query, params)))
+        return len(seq_of_params)
+
+    @contextlib.contextmanager
+    def no_transaction():
+        yield
+
+    # Cached listings would skip their queries (and must not keep the
+    # stub's empty results)
+    ItemManager.clear_cache()
+    originals = db.execute_query, db.execute_many, db.transaction
+    db.execute_query, db.execute_many, db.transaction = record, record_many, no_transaction
+    try:
+        for label, call in calls:
+            call()
+    finally:
+        db.execute_query, db.execute_many, db.transaction = originals
+        ItemManager.clear_cache()
+    return results
+
+
+def check() -> list:
+    """Return a list of (label, tables, plan) for unintended full scans."""
+    failures = []
+    for label, query, plan in collect_plans():
+        tables = full_scans(plan)
+        if tables and label not in INTENDED_SCANS:
+            failures.append((label, tables, plan))
+    return failures
+
+
+if __name__ == "__main__":
+    failures = check()
+    for label, tables, plan in failures:
+        print(f"FULL SCAN in {label}: {', '.join(tables)}")
+        for line in plan:
+            print(f"    {line}")
+    if failures:
+        sys.exit(1)
+    print("OK: no unintended full scans")
@@ -3,15 +3,45 @@
 """
 User Management: Registration, Login, Approval.
 """
+import hmac
 import bcrypt
-from model.database import db
+from model.database import db, DEFAULT_ADMIN_PASSWORD, DEFAULT_PASSWORD_MARKER
+
+# bcrypt work factor for new hashes. Raising it upgrades existing
+# passwords transparently at their next successful login.
+BCRYPT_ROUNDS = 12
+
+
+def _hash_password(password: str) -> str:
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode()
+
+
+def _check_password(password: str, password_hash: str) -> bool:
+    if password_hash == DEFAULT_PASSWORD_MARKER:
+        # Default admin account that has not logged in yet
+        # Compare bytes: compare_digest rejects non-ASCII str arguments
+        return hmac.compare_digest(password.encode(), DEFAULT_ADMIN_PASSWORD.encode())
+    return bcrypt.checkpw(password.encode(), password_hash.encode())
+
+
+def _hash_rounds(password_hash: str) -> int:
+    """Work factor stored in a bcrypt hash ('$2b$12$...' -> 12)."""
+    try:
+        return int(password_hash.split('$')[2])
+    except (IndexError, ValueError):
+        return 0
+
 
 class UserManager:
-    """Handles user-related database operations."""
+    """
+    Handles user-related database operations.
+    register() and login() run bcrypt, which takes hundreds of
+    milliseconds; call them from a background worker, not the GUI thread.
+    """
 
     def register(self, username: str, password: str, email: str, phone: str, address: str) -> dict:
         """Register a new user with 'pending' status."""
-        password_hash = bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+        password_hash = _hash_password(password)
         
         try:
             user_id = db.execute_query(
@@ -35,11 +65,25 @@ class UserManager:
             fetchone=True
         )
         
-        if user and bcrypt.checkpw(password.encode(), user['password_hash'].encode()):
+        if user and _check_password(password, user['password_hash']):
+            if _hash_rounds(user['password_hash']) < BCRYPT_ROUNDS:
+                # Best effort: the password is verified, so a failed
+                # upgrade must not fail the login; it is retried next time
+                try:
+                    self._rehash_password(user['id'], password)
+                except Exception as e:
+                    print(f"Error upgrading password hash for user {user['id']}: {e}")
             del user['password_hash']
             return user
         return None
 
+    def _rehash_password(self, user_id: int, password: str):
+        """Re-hash a verified password with the current work factor."""
+        db.execute_query(
+            "UPDATE users SET password_hash = ? WHERE id = ?",
+            (_hash_password(password), user_id)
+        )
+
     def get_pending_users(self) -> list:
         """Get all users with 'pending' status."""
         return db.execute_query(
@@ -63,6 +107,20 @@ class UserManager:
         )
         return True
 
+    def approve_users(self, user_ids: list) -> int:
+        """Approve several pending users in one transaction; returns the count."""
+        return db.execute_many(
+            "UPDATE users SET role = 'user' WHERE id = ? AND role = 'pending'",
+            [(user_id,) for user_id in user_ids]
+        )
+
+    def reject_users(self, user_ids: list) -> int:
+        """Reject several pending users in one transaction; returns the count."""
+        return db.execute_many(
+            "DELETE FROM users WHERE id = ? AND role = 'pending'",
+            [(user_id,) for user_id in user_ids]
+        )
+
     def get_user_by_id(self, user_id: int) -> dict:
         """Get user by ID."""
         user = db.execute_query(
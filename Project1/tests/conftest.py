@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+# tests/conftest.py
+"""
+Shared fixtures. Tests run against a fresh SQLite file per test, never
+the app's data/campus_xianyu.db. Run from the project root:
+
+    python -m pytest -q
+"""
+import pytest
+
+from model import database
+from model.database import db
+from model.item_manager import ItemManager
+from model.item_type_manager import ItemTypeManager
+
+
+def _reset_db(path: str):
+    """Point the global db at path and forget everything tied to the old file."""
+    db.pool.close_all()
+    with db._version_lock:
+        if db._version_conn is not None:
+            db._version_conn.close()
+            db._version_conn = None
+            db._seen_data_version = None
+    database.SQLITE_PATH = path
+    db._schema_ready = False
+    ItemManager.clear_cache()
+    ItemTypeManager().invalidate_cache()
+
+
+@pytest.fixture
+def empty_db(tmp_path):
+    """The global db, pointed at a database file that does not exist yet."""
+    original = database.SQLITE_PATH
+    _reset_db(str(tmp_path / "test.db"))
+    yield db
+    _reset_db(original)
+
+
+@pytest.fixture
+def fresh_db(empty_db):
+    """The global db, migrated into an empty database file."""
+    with db.pool.connection():
+        pass  # Run the migrations
+    return db
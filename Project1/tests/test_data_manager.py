@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+# tests/test_data_manager.py
+import os
+import stat
+
+import pytest
+
+from model import data_manager
+from model.data_manager import CsvDataManager, TOMBSTONE_PREFIX
+
+
+@pytest.fixture
+def csv_path(tmp_path, monkeypatch):
+    path = tmp_path / "items.csv"
+    monkeypatch.setattr(data_manager, "ITEMS_CSV_PATH", str(path))
+    return path
+
+
+def _names(manager):
+    return sorted(item['name'] for item in manager.get_all_items())
+
+
+def test_save_and_reload(csv_path):
+    manager = CsvDataManager()
+    manager.add_item("Lamp", "desk lamp", "123")
+    manager.add_item("Chair", "wooden, \"old\"\nchair", "456")
+    manager.save_data()
+
+    assert _names(CsvDataManager()) == ["Chair", "Lamp"]
+
+
+def _mode(path):
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+def test_rewrites_keep_the_file_mode(csv_path):
+    old = os.umask(0o022)
+    try:
+        manager = CsvDataManager(journal=True)
+        assert _mode(csv_path) == 0o644  # New file: like open() under the umask
+
+        os.chmod(csv_path, 0o640)
+        lamp = manager.add_item("Lamp", "desk lamp", "123")
+        manager.save_data()
+        assert _mode(csv_path) == 0o640
+        manager.delete_item(lamp['id'])
+        manager.compact()
+        assert _mode(csv_path) == 0o640
+    finally:
+        os.umask(old)
+    assert [name for name in os.listdir(csv_path.parent) if name.endswith(".tmp")] == []
+
+
+def test_journal_appends_changes_immediately(csv_path):
+    manager = CsvDataManager(journal=True)
+    lamp = manager.add_item("Lamp", "desk lamp", "123")
+    manager.add_item("Chair", "wooden chair", "456")
+    assert manager.delete_item(lamp['id'])
+
+    # No save_data(): every change is already in the file
+    text = csv_path.read_text(encoding="utf-8")
+    assert TOMBSTONE_PREFIX + lamp['id'] in text
+    assert _names(CsvDataManager()) == ["Chair"]
+    assert [item['name'] for item in manager.iter_items()] == ["Chair"]
+
+
+def test_compact_drops_tombstones_and_deleted_rows(csv_path):
+    manager = CsvDataManager(journal=True)
+    items = [manager.add_item(f"item {i}", "d", "c") for i in range(10)]
+    for item in items[:6]:
+        manager.delete_item(item['id'])
+
+    manager.compact()
+
+    text = csv_path.read_text(encoding="utf-8")
+    assert TOMBSTONE_PREFIX not in text
+    assert _names(CsvDataManager()) == [f"item {i}" for i in range(6, 10)]
+
+
+def test_background_compaction(csv_path, monkeypatch):
+    monkeypatch.setattr(data_manager, "COMPACT_MIN_TOMBSTONES", 3)
+    manager = CsvDataManager(journal=True)
+    items = [manager.add_item(f"item {i}", "d", "c") for i in range(4)]
+    for item in items[:3]:
+        manager.delete_item(item['id'])  # The third one starts the compactor
+    manager._compactor.join(timeout=10)
+
+    assert TOMBSTONE_PREFIX not in csv_path.read_text(encoding="utf-8")
+    assert _names(CsvDataManager()) == ["item 3"]
+
+
+def test_non_utf8_file_is_not_a_header_mismatch(csv_path, capsys):
+    content = "id,name,description,contact_info\r\n1,caf\xe9,d,c\r\n".encode("latin-1")
+    csv_path.write_bytes(content)
+
+    manager = CsvDataManager()
+
+    output = capsys.readouterr().out
+    assert "not valid UTF-8" in output
+    assert "header mismatch" not in output
+    assert manager.get_all_items() == []
+    assert csv_path.read_bytes() == content
+
+
+def test_results_are_mutable_copies(csv_path):
+    manager = CsvDataManager()
+    manager.add_item("Lamp", "desk lamp", "123")
+
+    items = manager.get_all_items()
+    assert type(items[0]) is dict
+    items[0]['name'] = "Changed"
+    found = manager.search_items("lamp")
+    assert type(found[0]) is dict
+    assert found[0]['name'] == "Lamp"
+
+
+def test_delete_by_id(csv_path):
+    manager = CsvDataManager()
+    items = [manager.add_item(f"item {i}", "d", "c") for i in range(200)]
+    for item in items[:150]:
+        assert manager.delete_item(item['id'])
+    assert not manager.delete_item(items[0]['id'])
+    assert not manager.delete_item("no-such-id")
+
+    # Enough holes to repack; later deletes must still find their rows
+    assert manager.delete_item(items[199]['id'])
+    assert _names(manager) == sorted(f"item {i}" for i in range(150, 199))
+
+
+def test_ngram_search_matches_linear_scan(csv_path):
+    import random
+    rng = random.Random(7)
+    words = ["apple", "Banana", "cherry", "苹果手机", "二手自行车", "desk", "lamp"]
+    manager = CsvDataManager()
+    for i in range(300):
+        manager.add_item(" ".join(rng.sample(words, 2)), " ".join(rng.sample(words, 3)), "c")
+    for item in manager.get_all_items()[::7]:
+        manager.delete_item(item['id'])
+    manager.add_item("Fresh apple pie", "", "c")
+
+    items = manager.get_all_items()
+    for keyword in ["app", "APPLE", "ana", "自行车", "手机", "pie", "zzz", "a", "ry ch"]:
+        expected = [
+            item['id'] for item in items
+            if keyword.lower() in item['name'].lower() or keyword.lower() in item['description'].lower()
+        ]
+        assert [item['id'] for item in manager.search_items(keyword)] == expected, keyword
+
+
+def _write_journal(manager_count=40):
+    manager = CsvDataManager(journal=True)
+    items = [
+        manager.add_item(f"物品 {i}", f"line one\nline \"two\", {i}", f"phone {i}")
+        for i in range(manager_count)
+    ]
+    for item in items[::3]:
+        manager.delete_item(item['id'])
+    return items
+
+
+def test_mapped_load_matches_parsed_load(csv_path):
+    _write_journal()
+
+    parsed = CsvDataManager().get_all_items()
+    mapped = CsvDataManager(mapped=True)
+    assert mapped.get_all_items() == parsed
+    assert mapped.search_items("two\", 1") == CsvDataManager().search_items("two\", 1")
+
+
+def test_mapped_rows_are_decoded_once(csv_path, monkeypatch):
+    _write_journal()
+    manager = CsvDataManager(mapped=True)
+    decoded = []
+    original = data_manager._MappedRows.decode_row
+    monkeypatch.setattr(data_manager._MappedRows, "decode_row",
+                        lambda self, position: decoded.append(position) or original(self, position))
+
+    for keyword in ("line", "物品 1", "phone 2", "line"):
+        manager.search_items(keyword)
+
+    assert len(decoded) == len(set(decoded))
+
+
+def test_mapped_save_failure_keeps_rows_usable(csv_path, monkeypatch, capsys):
+    _write_journal()
+    manager = CsvDataManager(mapped=True)
+    manager.add_item("unsaved", "d", "c")
+    expected = manager.get_all_items()
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+    with monkeypatch.context() as patch:
+        patch.setattr(data_manager.os, "replace", failing_replace)
+        manager.save_data()
+
+    assert "disk full" in capsys.readouterr().out
+    assert manager.get_all_items() == expected
+
+    manager.save_data()
+    assert manager.get_all_items() == expected
+    assert CsvDataManager(mapped=True).get_all_items() == expected
+
+
+def test_mapped_scan_handles_trailing_quote(csv_path):
+    csv_path.write_bytes(b"id,name,description,contact_info\n1,a,b,c\n\"")
+    manager = CsvDataManager(mapped=True)
+    assert [item['id'] for item in manager.get_all_items()] == ["1"]
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+# tests/test_database.py
+import sqlite3
+import threading
+
+import pytest
+
+from model import database
+from model.database import ConnectionPool, SCHEMA_VERSIONS
+
+
+def _memory_pool(**kwargs):
+    return ConnectionPool(lambda: sqlite3.connect(":memory:", check_same_thread=False), **kwargs)
+
+
+def _count(db, table):
+    return db.execute_query(f"SELECT COUNT(*) AS n FROM {table}", fetchone=True)['n']
+
+
+def test_pool_reuses_connections():
+    pool = _memory_pool(max_size=2)
+
+    with pool.connection() as outer:
+        with pool.connection() as inner:
+            assert inner is outer
+    with pool.connection() as again:
+        assert again is outer
+
+    stats = pool.stats()
+    assert (stats['misses'], stats['hits'], stats['size'], stats['idle']) == (1, 2, 1, 1)
+
+
+def test_pool_rolls_back_on_release():
+    pool = _memory_pool()
+    with pool.connection() as conn:
+        conn.execute("CREATE TABLE t (x)")
+        conn.execute("BEGIN")
+        conn.execute("INSERT INTO t VALUES (1)")
+    with pool.connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+
+def test_pool_times_out_when_exhausted():
+    pool = _memory_pool(max_size=1, timeout=0.05)
+    errors = []
+
+    def borrow():
+        try:
+            pool.acquire()
+        except TimeoutError as e:
+            errors.append(e)
+
+    with pool.connection():
+        thread = threading.Thread(target=borrow)
+        thread.start()
+        thread.join()
+        with pytest.raises(RuntimeError):
+            pool.release(sqlite3.connect(":memory:"))
+
+    assert len(errors) == 1
+    assert pool.stats()['waits'] == 1
+
+
+def test_get_connection_returns_connection_to_pool(fresh_db):
+    idle = fresh_db.pool_stats()['idle']
+    with fresh_db.get_connection() as conn:
+        assert conn.execute("SELECT 1").fetchone()[0] == 1
+        assert fresh_db.pool_stats()['idle'] == idle - 1
+    assert fresh_db.pool_stats()['idle'] == idle
+
+
+def test_migrations_are_recorded(fresh_db):
+    with fresh_db.get_connection() as conn:
+        assert fresh_db._applied_versions(conn) == set(SCHEMA_VERSIONS)
+    assert fresh_db.fts_enabled
+    assert fresh_db.execute_query("SELECT password_hash FROM users WHERE username = 'admin'",
+                                  fetchone=True)['password_hash'] == database.DEFAULT_PASSWORD_MARKER
+
+
+def test_failed_migration_is_retried(empty_db, monkeypatch):
+    with monkeypatch.context() as patch:
+        patch.setattr(database, "MIGRATIONS",
+                      [(v, (lambda cursor: False) if v == 3 else m) for v, m in database.MIGRATIONS])
+        with empty_db.get_connection() as conn:
+            assert 3 not in empty_db._applied_versions(conn)
+        assert not empty_db.fts_enabled
+
+    # Next start
+    empty_db.pool.close_all()
+    empty_db._schema_ready = False
+    with empty_db.get_connection() as conn:
+        assert empty_db._applied_versions(conn) == set(SCHEMA_VERSIONS)
+    assert empty_db.fts_enabled
+
+
+def test_transaction_commits_once_or_rolls_back(fresh_db, monkeypatch):
+    commits = []
+    commit = fresh_db._commit
+    monkeypatch.setattr(fresh_db, "_commit", lambda conn: (commits.append(conn), commit(conn)))
+
+    with fresh_db.transaction():
+        fresh_db.execute_query("INSERT INTO item_types (name) VALUES ('A')")
+        with fresh_db.transaction():
+            fresh_db.execute_many("INSERT INTO item_types (name) VALUES (?)", [("B",), ("C",)])
+    assert len(commits) == 1
+    assert _count(fresh_db, "item_types") == 3
+
+    with pytest.raises(sqlite3.IntegrityError):
+        with fresh_db.transaction():
+            fresh_db.execute_query("INSERT INTO item_types (name) VALUES ('D')")
+            fresh_db.execute_query("INSERT INTO item_types (name) VALUES ('A')")
+    assert len(commits) == 1
+    assert _count(fresh_db, "item_types") == 3
+    assert not fresh_db._in_transaction()
+
+
+def test_execute_many_returns_rowcount(fresh_db):
+    assert fresh_db.execute_many("INSERT INTO item_types (name) VALUES (?)",
+                                 [(name,) for name in "ABCD"]) == 4
+    assert fresh_db.execute_many("DELETE FROM item_types WHERE name = ?",
+                                 [("A",), ("B",), ("missing",)]) == 2
+
+
+def test_maintenance_errors_do_not_fail_writes(fresh_db, monkeypatch, capsys):
+    def busy(conn=None):
+        raise sqlite3.OperationalError("database is locked")
+    monkeypatch.setattr(database, "CHECKPOINT_EVERY_WRITES", 1)
+    monkeypatch.setattr(fresh_db, "checkpoint", busy)
+
+    type_id = fresh_db.execute_query("INSERT INTO item_types (name) VALUES ('A')")
+
+    assert type_id is not None
+    assert _count(fresh_db, "item_types") == 1
+    assert "database is locked" in capsys.readouterr().out
+
+
+def test_external_commits_are_counted(fresh_db):
+    before = fresh_db.external_changes()
+    fresh_db.execute_query("INSERT INTO item_types (name) VALUES ('Ours')")
+    assert fresh_db.external_changes() == before
+
+    other = sqlite3.connect(database.SQLITE_PATH)
+    other.execute("INSERT INTO item_types (name) VALUES ('Theirs')")
+    other.commit()
+    other.close()
+    assert fresh_db.external_changes() == before + 1
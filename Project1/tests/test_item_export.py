@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+# tests/test_item_export.py
+import json
+import os
+import stat
+
+import pytest
+
+from model.database import db
+from model.item_export import export_items
+from model.item_import import import_items
+from model.item_manager import ItemManager
+from model.item_type_manager import ItemTypeManager
+
+
+@pytest.fixture
+def books(fresh_db):
+    ItemTypeManager().create_type("Books", [{"name": "pages", "type": "number"}])
+    type_id = ItemTypeManager().get_all_types()[0]['id']
+    for i in range(7):
+        ItemManager().add_item(type_id, 1, f"Book {i}", "", "", "", "", {"pages": i * 100})
+    return type_id
+
+
+@pytest.mark.parametrize("fmt", ["csv", "jsonl"])
+def test_export_round_trip(tmp_path, books, fmt):
+    path = str(tmp_path / f"items.{fmt}")
+
+    report = export_items(path, batch_size=3)
+    assert report['rows'] == 7
+
+    db.execute_query("DELETE FROM items")
+    ItemManager.clear_cache()
+    assert import_items(path)['imported'] == 7
+    items = ItemManager().get_items_by_type(books)
+    assert sorted((item["name"], str(item["custom_values"]["pages"])) for item in items) == [
+        (f"Book {i}", str(i * 100)) for i in range(7)
+    ]
+
+
+def test_export_file_follows_umask(tmp_path, books, monkeypatch):
+    path = str(tmp_path / "items.jsonl")
+    old = os.umask(0o022)
+    try:
+        with monkeypatch.context() as patch:
+            # The umask is process-wide; exporting must not touch it
+            patch.setattr(os, "umask", lambda mask: pytest.fail("umask changed"))
+            export_items(path)
+    finally:
+        os.umask(old)
+
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o644
+    assert [json.loads(line)['name'] for line in open(path, encoding="utf-8")][0] == "Book 6"
+    assert [name for name in os.listdir(tmp_path) if name.endswith(".tmp")] == []
+
+
+def test_iter_items_releases_connection(books):
+    idle = db.pool_stats()['idle']
+
+    items = ItemManager().iter_items(batch_size=2)
+    next(items)
+    assert db.pool_stats()['idle'] == idle - 1
+    items.close()
+    assert db.pool_stats()['idle'] == idle
+
+    assert len(list(ItemManager().iter_items(batch_size=2))) == 7
+    assert db.pool_stats()['idle'] == idle
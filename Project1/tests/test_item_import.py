@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+# tests/test_item_import.py
+import json
+import sqlite3
+
+import pytest
+
+from model.database import db
+from model.item_import import ImportInterrupted, ItemImporter, import_items, read_rows
+from model.item_manager import ItemManager
+from model.item_type_manager import ItemTypeManager
+
+
+@pytest.fixture
+def types(fresh_db):
+    manager = ItemTypeManager()
+    manager.create_type("Books", [{"name": "pages", "type": "number"},
+                                  {"name": "published", "type": "date"}])
+    # A type whose name is made of digits must not be taken for an id
+    manager.create_type("2024", [])
+    return {t['name']: t for t in manager.get_all_types()}
+
+
+def _write_jsonl(path, rows):
+    with open(path, "w", encoding="utf-8") as f:
+        for row in rows:
+            f.write(row if isinstance(row, str) else json.dumps(row, ensure_ascii=False))
+            f.write("\n")
+    return str(path)
+
+
+def _schema_objects():
+    rows = db.execute_query("SELECT name FROM sqlite_master WHERE type IN ('index', 'trigger')", fetch=True)
+    return {row['name'] for row in rows}
+
+
+def test_import_validates_rows(tmp_path, types):
+    path = _write_jsonl(tmp_path / "items.jsonl", [
+        {"name": "Dune", "type": "Books", "owner": "admin",
+         "custom_values": {"pages": "412", "published": "1965-08-01"}},
+        {"name": "By id", "type_id": types['Books']['id'], "owner_id": 1},
+        {"name": "Calendar", "type": "2024", "owner": "admin",
+         "created_at": "2024-03-01T10:00:00+08:00"},
+        {"name": "Bad pages", "type": "Books", "owner": "admin", "custom_values": {"pages": "many"}},
+        {"name": "Bad date", "type": "Books", "owner": "admin", "created_at": "yesterday"},
+        {"name": "Bad type id", "type_id": "Books", "owner": "admin"},
+        {"name": "No type", "type": "Music", "owner": "admin"},
+        {"type": "Books", "owner": "admin"},
+        "{not json",
+    ])
+
+    report = import_items(path)
+
+    assert report['imported'] == 3
+    assert report['rejected'] == 6
+    assert [line for line, _ in report['rejects']] == [4, 5, 6, 7, 8, 9]
+    calendar = ItemManager().get_items_by_type(types['2024']['id'])
+    assert [(item['name'], item['created_at']) for item in calendar] == [
+        ("Calendar", "2024-03-01 02:00:00")
+    ]
+    books = ItemManager().get_items_by_type(types['Books']['id'])
+    assert sorted(item['name'] for item in books) == ["By id", "Dune"]
+
+
+def test_import_legacy_csv_with_defaults(tmp_path, types):
+    path = tmp_path / "items.csv"
+    path.write_text("id,name,description,contact_info\n"
+                    "a1,Lamp,desk lamp,123\n"
+                    "a2,Chair,\"wooden\nchair\",456\n", encoding="utf-8")
+
+    report = ItemImporter(default_type="2024", default_owner="admin").run(
+        read_rows(str(path))
+    )
+
+    assert report['imported'] == 2
+    items = ItemManager().get_items_by_type(types['2024']['id'])
+    assert {item['name']: item['contact_phone'] for item in items} == {"Lamp": "123", "Chair": "456"}
+
+
+def test_import_keeps_indexes_and_fts(tmp_path, types):
+    before = _schema_objects()
+    path = _write_jsonl(tmp_path / "items.jsonl", [
+        {"name": f"Paperback {i}", "type": "Books", "owner": "admin"} for i in range(25)
+    ])
+
+    ItemImporter(batch_size=10).run(
+        read_rows(path)
+    )
+
+    assert _schema_objects() == before
+    assert {'idx_items_type_created', 'idx_items_created', 'idx_items_owner', 'items_fts_ai'} <= before
+    found = ItemManager().search_items(types['Books']['id'], "Paperback")
+    assert len(found) == 25
+
+
+def test_failed_batch_keeps_earlier_batches_and_resumes(tmp_path, types, monkeypatch):
+    path = _write_jsonl(tmp_path / "items.jsonl", [
+        {"name": f"Book {i}", "type": "Books", "owner": "admin"} for i in range(1, 6)
+    ])
+    original = db.execute_many
+    calls = []
+
+    def failing_execute_many(query, seq_of_params):
+        calls.append(query)
+        if len(calls) == 2:
+            raise sqlite3.OperationalError("database is locked")
+        return original(query, seq_of_params)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(db, "execute_many", failing_execute_many)
+        with pytest.raises(ImportInterrupted) as failure:
+            ItemImporter(batch_size=2).run(read_rows(path))
+
+    assert failure.value.report['imported'] == 2
+    assert failure.value.resume_line == 3
+    assert _item_names() == ["Book 1", "Book 2"]
+
+    report = import_items(path, start_line=failure.value.resume_line, batch_size=2)
+    assert report['imported'] == 3
+    assert _item_names() == [f"Book {i}" for i in range(1, 6)]
+
+
+def _item_names():
+    return sorted(row['name'] for row in db.execute_query("SELECT name FROM items", fetch=True))
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+# tests/test_item_manager.py
+import sqlite3
+
+import pytest
+
+from model import database, item_manager
+from model.item_manager import ItemManager
+from model.item_type_manager import ItemTypeManager
+
+NAMES = ["Oak bookcase", "Pine bookshelf", "Desk lamp", "Bookcase (white)", "Office chair",
+         "Cookbook", "Bike lock"]
+
+
+@pytest.fixture
+def items(fresh_db):
+    """Two types; NAMES are all added to 'Furniture' by user 1 (admin)."""
+    types = ItemTypeManager()
+    furniture = types.create_type("Furniture", [])['id']
+    other = types.create_type("Other", [])['id']
+    manager = ItemManager()
+    ids = [manager.add_item(furniture, 1, name, f"{name} for sale", "Dorm", "", "", {})['id']
+           for name in NAMES]
+    return {'furniture': furniture, 'other': other, 'ids': ids}
+
+
+def _add_user(name):
+    return database.db.execute_query(
+        "INSERT INTO users (username, password_hash, role) VALUES (?, 'x', 'user')", (name,)
+    )
+
+
+def _names(items):
+    return [item['name'] for item in items]
+
+
+def test_fts_search_follows_writes(items):
+    manager = ItemManager()
+    assert sorted(_names(manager.search_items(items['furniture'], "ookcas"))) == [
+        "Bookcase (white)", "Oak bookcase"
+    ]
+    assert manager.search_items(items['other'], "ookcas") == []
+
+    database.db.execute_query("UPDATE items SET name = 'Walnut cabinet', description = '' "
+                              "WHERE id = ?", (items['ids'][0],))
+    manager.clear_cache()
+    assert _names(manager.search_items(items['furniture'], "ookcas")) == ["Bookcase (white)"]
+    assert _names(manager.search_items(items['furniture'], "walnut")) == ["Walnut cabinet"]
+
+    manager.delete_item(items['ids'][3])
+    assert manager.search_items(items['furniture'], "ookcas") == []
+
+
+def test_search_quotes_fts_syntax(items):
+    assert ItemManager().search_items(items['furniture'], 'lamp" OR "chair') == []
+    assert _names(ItemManager().search_items(items['furniture'], "(white)")) == ["Bookcase (white)"]
+
+
+def test_short_keyword_falls_back_to_like(items):
+    found = ItemManager().search_items(items['furniture'], "ok")
+    assert sorted(_names(found)) == ["Bookcase (white)", "Cookbook", "Oak bookcase",
+                                     "Pine bookshelf"]
+    assert all('search_rank' not in item for item in found)
+
+
+def _pages(load, page_size):
+    pages, cursor = [], None
+    while True:
+        page = load(page_size, cursor)
+        if not page:
+            return pages
+        pages.append(page)
+        cursor = ItemManager.next_cursor(page)
+
+
+def test_keyset_pages_cover_the_listing(items):
+    manager = ItemManager()
+    # Every row shares one created_at second, so the id breaks ties
+    everything = manager.get_items_by_type(items['furniture'])
+    assert [item['id'] for item in everything] == sorted(items['ids'], reverse=True)
+
+    pages = _pages(lambda size, cursor: manager.get_items_by_type(items['furniture'], size, cursor), 3)
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert [item['id'] for page in pages for item in page] == [item['id'] for item in everything]
+
+    pages = _pages(lambda size, cursor: manager.get_all_items(size, cursor), 2)
+    assert [item['id'] for page in pages for item in page] == [
+        item['id'] for item in manager.get_all_items()
+    ]
+
+
+def test_ranked_search_pages_follow_the_full_ranking(items):
+    manager = ItemManager()
+    ranked = manager.search_items(items['furniture'], "boo")
+    scores = [item['search_score'] for item in ranked]
+    assert scores == sorted(scores)
+
+    pages = _pages(lambda size, cursor: manager.search_items(items['furniture'], "boo", size, cursor), 2)
+    assert [item['id'] for page in pages for item in page] == [item['id'] for item in ranked]
+    assert ItemManager.next_cursor(pages[0]) == (pages[0][-1]['search_score'], pages[0][-1]['id'])
+
+
+def test_ranked_pages_do_not_shift_after_a_delete(items):
+    manager = ItemManager()
+    ranked = [item['id'] for item in manager.search_items(items['furniture'], "boo")]
+    first = manager.search_items(items['furniture'], "boo", 2)
+
+    # With OFFSET paging the next page would now skip ranked[2]
+    manager.delete_item(first[0]['id'])
+    second = manager.search_items(items['furniture'], "boo", 2, ItemManager.next_cursor(first))
+    assert [item['id'] for item in second] == ranked[2:4]
+
+
+def test_cached_pages_are_copies(items):
+    manager = ItemManager()
+    first = manager.get_items_by_type(items['furniture'])
+    first[0]['name'] = "changed"
+    first[0]['custom_values']['x'] = 1
+    first.clear()
+
+    again = manager.get_items_by_type(items['furniture'])
+    assert again[0]['name'] == NAMES[-1]
+    assert again[0]['custom_values'] == {}
+    assert ItemManager.cache_stats()['hits'] >= 1
+
+
+def test_cache_is_scoped_to_the_written_type(items):
+    manager = ItemManager()
+    manager.get_items_by_type(items['furniture'])
+    hits = ItemManager.cache_stats()['hits']
+
+    manager.add_item(items['other'], 1, "Umbrella", "", "", "", "", {})
+    manager.get_items_by_type(items['furniture'])
+    assert ItemManager.cache_stats()['hits'] == hits + 1
+
+    manager.add_item(items['furniture'], 1, "Stool", "", "", "", "", {})
+    assert _names(manager.get_items_by_type(items['furniture']))[0] == "Stool"
+
+
+def test_cache_drops_pages_after_external_commits(items):
+    manager = ItemManager()
+    assert len(manager.get_items_by_type(items['furniture'])) == len(NAMES)
+
+    other = sqlite3.connect(database.SQLITE_PATH)
+    other.execute("INSERT INTO items (type_id, owner_id, name) VALUES (?, 1, 'Rug')",
+                  (items['furniture'],))
+    other.commit()
+    other.close()
+
+    assert _names(manager.get_items_by_type(items['furniture']))[0] == "Rug"
+
+
+def test_type_changes_clear_the_cache(items):
+    manager = ItemManager()
+    assert manager.get_items_by_type(items['furniture'])[0]['type_name'] == "Furniture"
+
+    ItemTypeManager().update_type(items['furniture'], "Home", [])
+    assert manager.get_items_by_type(items['furniture'])[0]['type_name'] == "Home"
+
+    assert ItemTypeManager().delete_type(items['furniture'])
+    assert manager.get_items_by_type(items['furniture']) == []
+    assert manager.get_all_items() == []
+
+
+def test_delete_item_reports_whether_anything_was_deleted(items):
+    manager = ItemManager()
+    removed = []
+    manager.item_removed.connect(removed.append)
+    try:
+        stranger = _add_user("stranger")
+        assert manager.delete_item(items['ids'][0], stranger) is False
+        assert manager.delete_item(items['ids'][0], 1) is True
+        assert manager.delete_item(items['ids'][0], 1) is False
+    finally:
+        manager.item_removed.disconnect(removed.append)
+
+    assert removed == [items['ids'][0]]
+    assert manager.get_item_by_id(items['ids'][0]) is None
+
+
+def test_delete_items_in_chunks(items, monkeypatch):
+    monkeypatch.setattr(item_manager, "DELETE_CHUNK_SIZE", 2)
+    manager = ItemManager()
+    stranger = _add_user("stranger")
+    theirs = manager.add_item(items['furniture'], stranger, "Theirs", "", "", "", "", {})['id']
+
+    ids = items['ids'][:5]
+    assert manager.delete_items(ids + [ids[0], theirs, 9999], owner_id=1) == 5
+    remaining = manager.get_items_by_type(items['furniture'])
+    assert sorted(item['id'] for item in remaining) == sorted(items['ids'][5:] + [theirs])
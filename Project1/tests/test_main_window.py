@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+# tests/test_main_window.py
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+
+from views.main_window import MainWindow
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def window(app):
+    window = MainWindow()
+    window.resize(1000, 750)
+    window.show()
+    yield window
+    window.close()
+    window.deleteLater()
+    app.processEvents()
+
+
+def _items(ids):
+    return [{'id': i, 'name': f"Item {i}", 'description': "", 'custom_values': {}} for i in ids]
+
+
+def _settle(app):
+    for _ in range(5):
+        app.processEvents()
+
+
+def _layout(window):
+    """(item id, card position) in layout order."""
+    layout = window.flow_layout
+    cards = [layout.itemAt(i).widget() for i in range(layout.count())]
+    return [(card.item_id_int, (card.x(), card.y())) for card in cards]
+
+
+def _assert_reflowed(before, after, removed):
+    """Remaining cards keep their order and fill the first slots."""
+    assert [item_id for item_id, _ in after] == [i for i, _ in before if i not in removed]
+    assert [pos for _, pos in after] == [pos for _, pos in before][:len(after)]
+
+
+def test_remove_item_reflows_cards(app, window):
+    window.update_view(_items(range(10, 0, -1)))
+    _settle(app)
+    before = _layout(window)
+    assert len({pos for _, pos in before}) == 10
+
+    window.remove_item(7)
+    _settle(app)
+
+    _assert_reflowed(before, _layout(window), {7})
+
+
+def test_update_view_reflows_after_dropping_cards(app, window):
+    window.update_view(_items(range(10, 0, -1)))
+    _settle(app)
+    before = _layout(window)
+
+    window.update_view(_items([10, 9, 8, 6, 5, 4, 3, 1]))
+    _settle(app)
+
+    _assert_reflowed(before, _layout(window), {7, 2})
+
+
+def test_append_items_skips_items_already_shown(app, window):
+    window.update_view(_items(range(12, 6, -1)), has_more=True)
+    window.append_items(_items(range(7, 0, -1)))  # Overlaps the first page by one
+    _settle(app)
+
+    ids = [item_id for item_id, _ in _layout(window)]
+    assert ids == list(range(12, 0, -1))
+    assert len(window._cards) == 12
+
+    window.remove_item(7)
+    _settle(app)
+    assert 7 not in [item_id for item_id, _ in _layout(window)]
+
+
+def test_failed_page_allows_another_request(app, window):
+    requests = []
+    window.load_more_requested.connect(lambda: requests.append(True))
+    window.update_view(_items([1]), has_more=True)
+    _settle(app)
+    assert requests == [True]
+
+    window._maybe_load_more()
+    assert requests == [True]  # Still waiting for the page
+    window.load_more_failed()
+    window._maybe_load_more()
+    assert requests == [True, True]
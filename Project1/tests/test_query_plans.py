@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+# tests/test_query_plans.py
+from model.query_plan_check import check, collect_plans, full_scans
+
+
+def test_no_unintended_full_scans(fresh_db):
+    failures = check()
+    assert failures == [], "\n".join(
+        f"{label}: {', '.join(tables)} | {' / '.join(plan)}" for label, tables, plan in failures
+    )
+
+
+def test_batch_deletes_are_explained_without_writing(fresh_db, monkeypatch):
+    commits = []
+    monkeypatch.setattr(fresh_db, "_commit", commits.append)
+    plans = collect_plans()
+
+    deletes = [(label, query) for label, query, _ in plans
+               if query.startswith("DELETE FROM items WHERE id")]
+    assert [label for label, _ in deletes] == [
+        "ItemManager.delete_item", "ItemManager.delete_item (owner)",
+        "ItemManager.delete_items", "ItemManager.delete_items (owner)",
+    ]
+    assert any(label == "ItemTypeManager.delete_type" for label, _, _ in plans)
+    assert commits == []
+
+
+def test_index_scans_are_full_scans():
+    assert full_scans(["SCAN items"]) == ["items"]
+    assert full_scans(["SCAN i USING INDEX idx_items_created"]) == ["i"]
+    assert full_scans(["SCAN i USING COVERING INDEX idx_items_owner"]) == ["i"]
+
+
+def test_searches_and_fts_matches_are_not_scans():
+    assert full_scans([
+        "SEARCH i USING INDEX idx_items_type_created (type_id=?)",
+        "SEARCH u USING INTEGER PRIMARY KEY (rowid=?)",
+        "SCAN items_fts VIRTUAL TABLE INDEX 0:M2",
+        "USE TEMP B-TREE FOR ORDER BY",
+    ]) == []
+    assert full_scans(["SCAN items_fts VIRTUAL TABLE INDEX 0:"]) == ["items_fts"]
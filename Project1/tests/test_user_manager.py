@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+# tests/test_user_manager.py
+import pytest
+
+from model import user_manager
+from model.database import db, DEFAULT_ADMIN_PASSWORD, DEFAULT_PASSWORD_MARKER
+from model.user_manager import UserManager
+
+
+@pytest.fixture
+def users(fresh_db, monkeypatch):
+    # Cheapest bcrypt work factor, so the tests do not spend seconds hashing
+    monkeypatch.setattr(user_manager, "BCRYPT_ROUNDS", 4)
+    return UserManager()
+
+
+def _password_hash(username):
+    return db.execute_query("SELECT password_hash FROM users WHERE username = ?",
+                            (username,), fetchone=True)['password_hash']
+
+
+def test_default_admin_is_hashed_at_first_login(users):
+    assert users.login("admin", "wrong") is None
+    assert users.login("admin", "пароль") is None
+    assert _password_hash("admin") == DEFAULT_PASSWORD_MARKER
+
+    admin = users.login("admin", DEFAULT_ADMIN_PASSWORD)
+    assert admin['role'] == 'admin'
+    assert 'password_hash' not in admin
+    assert _password_hash("admin").startswith("$2b$04$")
+    assert users.login("admin", DEFAULT_ADMIN_PASSWORD)['username'] == "admin"
+
+
+def test_login_upgrades_weak_hashes(users, monkeypatch):
+    users.register("alice", "sécret", "a@campus.edu", "", "")
+    assert users.login("alice", "sécret")['role'] == 'pending'
+
+    monkeypatch.setattr(user_manager, "BCRYPT_ROUNDS", 5)
+    assert users.login("alice", "sécret") is not None
+    assert _password_hash("alice").startswith("$2b$05$")
+
+
+def test_failed_rehash_does_not_fail_login(users, monkeypatch, capsys):
+    users.register("alice", "secret", "", "", "")
+    monkeypatch.setattr(user_manager, "BCRYPT_ROUNDS", 5)
+
+    def locked(user_id, password):
+        raise RuntimeError("database is locked")
+    monkeypatch.setattr(users, "_rehash_password", locked)
+
+    assert users.login("alice", "secret")['username'] == "alice"
+    assert "database is locked" in capsys.readouterr().out
+    assert _password_hash("alice").startswith("$2b$04$")
+
+
+def test_register_rejects_duplicate_usernames(users):
+    assert users.register("alice", "secret", "", "", "")['role'] == 'pending'
+    assert users.register("alice", "other", "", "", "") is None
+
+
+def test_batch_approve_and_reject(users):
+    ids = [users.register(name, "secret", "", "", "")['id'] for name in ("a", "b", "c", "d")]
+
+    assert users.approve_users(ids[:2] + [9999]) == 2
+    assert users.approve_users(ids[:2]) == 0
+    assert users.reject_users(ids) == 2
+
+    assert [users.get_user_by_id(i)['role'] for i in ids[:2]] == ['user', 'user']
+    assert users.get_user_by_id(ids[2]) is None
+    assert users.get_pending_users() == []
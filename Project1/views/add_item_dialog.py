@@ -14,6 +14,8 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QDate
 from PyQt6.QtGui import QPixmap
 
+from views.components.thumbnails import create_thumbnail
+
 class AddItemDialog(QDialog):
     """Dialog for adding a new item."""
     
@@ -263,7 +265,10 @@ class AddItemDialog(QDialog):
         self.clear_image_btn.setEnabled(False)
 
     def copy_image_to_uploads(self) -> str:
-        """Copy selected image to uploads folder and return new path."""
+        """
+        Copy selected image to uploads folder and return new path.
+        The card thumbnail is generated here, once per upload.
+        """
         if not self._selected_image_path:
             return None
         
@@ -274,10 +279,14 @@ class AddItemDialog(QDialog):
         
         try:
             shutil.copy2(self._selected_image_path, new_path)
-            return new_path
         except Exception as e:
             print(f"Error copying image: {e}")
             return None
+        
+        if not create_thumbnail(new_path):
+            # Not fatal: ThumbnailLoader retries when the card is shown
+            print(f"Error creating thumbnail for {new_path}")
+        return new_path
 
     def get_data(self) -> dict:
         # Safety check: ensure step 2 form was built
@@ -21,6 +21,8 @@ class AdminPanel(QWidget):
     type_deleted = pyqtSignal(int)
     user_approved = pyqtSignal(int)
     user_rejected = pyqtSignal(int)
+    users_approved = pyqtSignal(list)
+    users_rejected = pyqtSignal(list)
     back_requested = pyqtSignal()
     
     def __init__(self, parent=None):
@@ -106,9 +108,25 @@ class AdminPanel(QWidget):
         self.users_table.setColumnWidth(5, 150)
         self.users_table.verticalHeader().setVisible(False)
         self.users_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.users_table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.users_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         layout.addWidget(self.users_table)
 
+        bulk_layout = QHBoxLayout()
+        bulk_layout.addStretch()
+
+        approve_selected_btn = QPushButton("Approve Selected")
+        approve_selected_btn.setStyleSheet("padding: 6px 12px; background-color: #27AE60; color: white; border: none;")
+        approve_selected_btn.clicked.connect(self.on_approve_selected)
+
+        reject_selected_btn = QPushButton("Reject Selected")
+        reject_selected_btn.setStyleSheet("padding: 6px 12px; color: #E74C3C;")
+        reject_selected_btn.clicked.connect(self.on_reject_selected)
+
+        bulk_layout.addWidget(approve_selected_btn)
+        bulk_layout.addWidget(reject_selected_btn)
+        layout.addLayout(bulk_layout)
+
     def update_types(self, types: list):
         """Refresh item types table."""
         self._types = types
@@ -199,6 +217,29 @@ class AdminPanel(QWidget):
     def on_approve_user(self, user_id: int):
         self.user_approved.emit(user_id)
 
+    def selected_user_ids(self) -> list:
+        """Ids of the selected rows in the pending users table."""
+        rows = sorted({index.row() for index in self.users_table.selectionModel().selectedRows()})
+        return [int(self.users_table.item(row, 0).text()) for row in rows]
+
+    def on_approve_selected(self):
+        user_ids = self.selected_user_ids()
+        if user_ids:
+            self.users_approved.emit(user_ids)
+
+    def on_reject_selected(self):
+        user_ids = self.selected_user_ids()
+        if not user_ids:
+            return
+        reply = QMessageBox.warning(
+            self, "Confirm Reject",
+            f"Rejecting will delete {len(user_ids)} registration(s). Continue?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No
+        )
+        if reply == QMessageBox.StandardButton.Yes:
+            self.users_rejected.emit(user_ids)
+
     def on_reject_user(self, user_id: int):
         reply = QMessageBox.warning(
             self, "Confirm Reject",
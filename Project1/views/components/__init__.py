@@ -1,3 +1,6 @@
 # views/components/__init__.py
 from views.components.flow_layout import FlowLayout
 from views.components.item_card import ItemCard
+from views.components.item_grid_view import ItemGridView
+from views.components.thumbnails import ThumbnailLoader
+from views.components.pixmap_cache import pixmap_cache
@@ -1,24 +1,69 @@
 # -*- coding: utf-8 -*-
 # views/components/flow_layout.py
-from PyQt6.QtWidgets import QLayout, QSizePolicy
+from contextlib import contextmanager
+from PyQt6.QtWidgets import QLayout, QSizePolicy, QWidgetItem
 from PyQt6.QtCore import Qt, QRect, QSize, QPoint
 
 class FlowLayout(QLayout):
-    """Standard FlowLayout implementation for PyQt6."""
+    """
+    FlowLayout for PyQt6 with cached geometry.
+
+    Size hints and the flow state before every item are cached, so adding
+    or removing an item only lays out the items from that index on, and a
+    resize only redoes the row arithmetic (items whose rect is unchanged
+    are not touched). Use batch() or add_widgets() to add many widgets
+    with a single layout pass at the end.
+    """
     def __init__(self, parent=None, margin=0, h_spacing=10, v_spacing=10):
         super().__init__(parent)
-        self.setContentsMargins(margin, margin, margin, margin)
         self.h_spacing = h_spacing
         self.v_spacing = v_spacing
         self.item_list = []
+        self._hints = []            # Cached sizeHint() per item
+        self._hints_stale = False   # invalidate() was called; re-check hints
+        self._states = []           # (x, y, line_height) before each item
+        self._positions = []        # Top-left of each item
+        self._geometries = []       # Last rect applied to each item
+        self._layout_rect = None    # Rect the cached states belong to
+        self._valid = 0             # _states[:_valid] are up to date
+        self._end_state = None      # Flow state after the last item
+        self._heights = {}          # width -> heightForWidth
+        self._min_size = None
+        self._batch_depth = 0
+        self._pending_rect = None   # setGeometry deferred by batch()
+        self.setContentsMargins(margin, margin, margin, margin)
 
     def __del__(self):
-        item = self.takeAt(0)
+        item = self._take(0)
         while item:
-            item = self.takeAt(0)
+            item = self._take(0)
+
+    def _mark_dirty(self, index):
+        """Drop cached layout from index on."""
+        self._valid = min(self._valid, index)
+        self._heights.clear()
+        self._min_size = None
 
     def addItem(self, item):
         self.item_list.append(item)
+        self._hints.append(item.sizeHint())
+        self._states.append(None)
+        self._positions.append(None)
+        self._geometries.append(None)
+        self._mark_dirty(len(self.item_list) - 1)
+
+    def insertWidget(self, index, widget):
+        """Insert widget before position index (appends if out of range)."""
+        index = max(0, min(index, len(self.item_list)))
+        self.addChildWidget(widget)
+        item = QWidgetItem(widget)
+        self.item_list.insert(index, item)
+        self._hints.insert(index, item.sizeHint())
+        self._states.insert(index, None)
+        self._positions.insert(index, None)
+        self._geometries.insert(index, None)
+        self._mark_dirty(index)
+        self.invalidate()
 
     def count(self):
         return len(self.item_list)
@@ -29,10 +74,48 @@ class FlowLayout(QLayout):
         return None
 
     def takeAt(self, index):
+        item = self._take(index)
+        if item is not None:
+            # Ask for a layout pass so the items after it move up
+            self.invalidate()
+        return item
+
+    def _take(self, index):
+        """Remove an item and its cached state without requesting a relayout."""
         if 0 <= index < len(self.item_list):
+            del self._hints[index]
+            del self._states[index]
+            del self._positions[index]
+            del self._geometries[index]
+            self._mark_dirty(index)
             return self.item_list.pop(index)
         return None
 
+    def invalidate(self):
+        # Called by Qt when a child's size hint may have changed
+        self._hints_stale = True
+        self._heights.clear()
+        self._min_size = None
+        super().invalidate()
+
+    @contextmanager
+    def batch(self):
+        """Defer layout passes until the block exits, then lay out once."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._pending_rect is not None:
+                rect, self._pending_rect = self._pending_rect, None
+                self._do_layout(rect, False)
+
+    def add_widgets(self, widgets):
+        """Add several widgets with one layout pass."""
+        with self.batch():
+            for widget in widgets:
+                self.addWidget(widget)
+
     def expandingDirections(self):
         return Qt.Orientation(0)
 
@@ -40,48 +123,100 @@ class FlowLayout(QLayout):
         return True
 
     def heightForWidth(self, width):
-        height = self._do_layout(QRect(0, 0, width, 0), True)
+        height = self._heights.get(width)
+        if height is None:
+            height = self._do_layout(QRect(0, 0, width, 0), True)
         return height
 
     def setGeometry(self, rect):
         super().setGeometry(rect)
+        if self._batch_depth:
+            self._pending_rect = QRect(rect)
+            return
         self._do_layout(rect, False)
 
     def sizeHint(self):
         return self.minimumSize()
 
     def minimumSize(self):
+        if self._min_size is not None:
+            return self._min_size
         size = QSize()
         for item in self.item_list:
             size = size.expandedTo(item.minimumSize())
-        
+
         margin_left, margin_top, margin_right, margin_bottom = self.getContentsMargins()
         size += QSize(2 * margin_left, 2 * margin_top)
+        self._min_size = size
         return size
 
-    def _do_layout(self, rect, test_only):
-        x = rect.x()
-        y = rect.y()
-        line_height = 0
+    def _refresh_hints(self):
+        """After invalidate(), re-read hints and relayout from the first change."""
+        if not self._hints_stale:
+            return
+        self._hints_stale = False
+        for index, item in enumerate(self.item_list):
+            hint = item.sizeHint()
+            if hint != self._hints[index]:
+                self._hints[index] = hint
+                self._mark_dirty(index)
+
+    def _flow(self, rect, start, state, record):
+        """Advance the flow state from item start; optionally cache per-item states."""
+        x, y, line_height = state
+        left = rect.x()
+        right = rect.right()
         spacing_h = self.h_spacing
         spacing_v = self.v_spacing
-
-        for item in self.item_list:
-            wid = item.widget()
-            space_x = spacing_h
-            space_y = spacing_v
-            
-            next_x = x + item.sizeHint().width() + space_x
-            if next_x - space_x > rect.right() and line_height > 0:
-                x = rect.x()
-                y = y + line_height + space_y
-                next_x = x + item.sizeHint().width() + space_x
+        hints = self._hints
+
+        for index in range(start, len(hints)):
+            if record:
+                self._states[index] = (x, y, line_height)
+            width = hints[index].width()
+            next_x = x + width + spacing_h
+            if next_x - spacing_h > right and line_height > 0:
+                x = left
+                y = y + line_height + spacing_v
+                next_x = x + width + spacing_h
                 line_height = 0
-
-            if not test_only:
-                item.setGeometry(QRect(QPoint(x, y), item.sizeHint()))
-
+            if record:
+                self._positions[index] = (x, y)
             x = next_x
-            line_height = max(line_height, item.sizeHint().height())
+            line_height = max(line_height, hints[index].height())
 
-        return y + line_height - rect.y()
+        return x, y, line_height
+
+    def _do_layout(self, rect, test_only):
+        self._refresh_hints()
+
+        if test_only:
+            _, y, line_height = self._flow(rect, 0, (rect.x(), rect.y(), 0), False)
+            height = y + line_height - rect.y()
+            self._heights[rect.width()] = height
+            return height
+
+        if rect != self._layout_rect:
+            self._layout_rect = QRect(rect)
+            self._valid = 0
+
+        # The state before item i depends only on the items before it, so
+        # resume one item before the first change (which also refreshes
+        # the end state after an item was removed from the end)
+        count = len(self.item_list)
+        resume = max(min(self._valid, count) - 1, 0)
+        state = self._states[resume] if resume else (rect.x(), rect.y(), 0)
+        self._end_state = self._flow(rect, resume, state, True)
+        self._valid = count
+
+        # Only move items whose rect actually changed
+        for index in range(resume, count):
+            geometry = QRect(QPoint(*self._positions[index]), self._hints[index])
+            if geometry != self._geometries[index]:
+                self.item_list[index].setGeometry(geometry)
+                self._geometries[index] = geometry
+
+        _, y, line_height = self._end_state
+        height = y + line_height - rect.y()
+        self._heights[rect.width()] = height
+        return height
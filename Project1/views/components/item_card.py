@@ -5,6 +5,24 @@ from PyQt6.QtWidgets import QFrame, QVBoxLayout, QLabel, QSizePolicy
 from PyQt6.QtCore import pyqtSignal, Qt
 from PyQt6.QtGui import QColor, QFontMetrics, QPixmap
 
+from views.components.pixmap_cache import pixmap_cache
+from views.components.thumbnails import ThumbnailLoader, THUMB_WIDTH, THUMB_HEIGHT
+
+
+def card_texts(item: dict) -> tuple:
+    """Build the (description, contact) lines shown on an item card."""
+    custom_text = ""
+    custom_values = item.get('custom_values', {})
+    if custom_values:
+        custom_text = " | ".join([f"{k}: {v}" for k, v in custom_values.items()])
+    
+    description = item.get('description', '')
+    if custom_text:
+        description = f"{description}\n\n{custom_text}"
+    
+    contact = f"{item.get('contact_phone', '')} | {item.get('location', '')}"
+    return description, contact
+
 class ItemCard(QFrame):
     clicked = pyqtSignal(str) # item_id
 
@@ -17,17 +35,8 @@ class ItemCard(QFrame):
         self.setFixedWidth(250)  # Wider to fit Chinese text
         self.setMinimumHeight(300)
         
-        # Style
-        self.setStyleSheet("""
-            #ItemCard {
-                background-color: white;
-                border: 1px solid #E0E0E0;
-                border-radius: 10px;
-            }
-            #ItemCard:hover {
-                border: 2px solid #3498DB;
-            }
-        """)
+        # Styled by the QFrame#ItemCard rules in assets/styles.qss
+        self.setProperty("selected", False)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(12, 12, 12, 12)
@@ -36,25 +45,28 @@ class ItemCard(QFrame):
         # Image setup
         self.image_label = QLabel()
         self.image_label.setFixedHeight(140)
-        self.image_label.setStyleSheet("background-color: #ECF0F1; border-radius: 5px;")
+        self.image_label.setObjectName("CardImage")
         self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
-        # Load image if path provided
-        if image_path and os.path.exists(image_path):
-            pixmap = QPixmap(image_path)
-            scaled = pixmap.scaled(
-                226, 140,  # card width - margins
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            self.image_label.setPixmap(scaled)
+        # Thumbnail is decoded on a worker thread; show a placeholder until then
+        self._image_path = image_path
+        cached = pixmap_cache.get(image_path, (THUMB_WIDTH, THUMB_HEIGHT)) if image_path else None
+        if cached is not None:
+            self.image_label.setPixmap(cached)
+        elif image_path and os.path.exists(image_path):
+            self.image_label.setText("Loading...")
+            loader = ThumbnailLoader.instance()
+            receiver = self._on_thumbnail_ready
+            loader.request(image_path, receiver)
+            # A card removed before its thumbnail arrives must not get it
+            self.destroyed.connect(lambda: loader.cancel(image_path, receiver))
         else:
             self.image_label.setText("No Image")
         layout.addWidget(self.image_label)
         
         # Title - Allow enough space
         self.lbl_name = QLabel(name)
-        self.lbl_name.setStyleSheet("font-weight: bold; font-size: 14px; color: #2C3E50;")
+        self.lbl_name.setObjectName("CardTitle")
         self.lbl_name.setWordWrap(True)
         self.lbl_name.setMinimumHeight(20)
         layout.addWidget(self.lbl_name)
@@ -62,7 +74,7 @@ class ItemCard(QFrame):
         # Description - truncate if too long
         desc_text = description[:80] + "..." if len(description) > 80 else description
         self.lbl_desc = QLabel(desc_text)
-        self.lbl_desc.setStyleSheet("color: #7F8C8D; font-size: 12px;")
+        self.lbl_desc.setObjectName("CardDescription")
         self.lbl_desc.setWordWrap(True)
         self.lbl_desc.setMinimumHeight(36)
         self.lbl_desc.setMaximumHeight(50)
@@ -71,7 +83,7 @@ class ItemCard(QFrame):
         # Contact info - truncate if too long
         contact_text = contact[:40] + "..." if len(contact) > 40 else contact
         self.lbl_contact = QLabel(contact_text)
-        self.lbl_contact.setStyleSheet("color: #95A5A6; font-size: 11px;")
+        self.lbl_contact.setObjectName("CardContact")
         self.lbl_contact.setWordWrap(True)
         layout.addWidget(self.lbl_contact)
         
@@ -79,31 +91,24 @@ class ItemCard(QFrame):
 
         self._selected = False
 
+    def _on_thumbnail_ready(self, image_path: str, pixmap: QPixmap):
+        if pixmap.isNull():
+            self.image_label.setText("No Image")
+        else:
+            self.image_label.setPixmap(pixmap)
+
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
             self.clicked.emit(self.item_id)
         super().mousePressEvent(event)
 
     def set_selected(self, selected: bool):
+        if selected == self._selected:
+            return
         self._selected = selected
-        if selected:
-            self.setStyleSheet("""
-                #ItemCard {
-                    background-color: #EBF5FB;
-                    border: 2px solid #3498DB;
-                    border-radius: 10px;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                #ItemCard {
-                    background-color: white;
-                    border: 1px solid #E0E0E0;
-                    border-radius: 10px;
-                }
-                #ItemCard:hover {
-                    border: 2px solid #3498DB;
-                }
-            """)
-
-
+        # Re-polish so the [selected="true"] rule is re-evaluated; the
+        # shared stylesheet itself is not parsed again
+        self.setProperty("selected", selected)
+        self.style().unpolish(self)
+        self.style().polish(self)
+        self.update()
@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+# views/components/item_grid_view.py
+"""
+Virtualized item grid: a QListView in IconMode whose delegate paints
+card-like cells, so only the rows inside the viewport are ever drawn.
+"""
+from typing import List, Dict
+from PyQt6.QtWidgets import QListView, QStyledItemDelegate, QStyle, QAbstractItemView
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QRect, QRectF, QSize, pyqtSignal
+from PyQt6.QtGui import QColor, QPainter, QPainterPath, QPen, QPixmap, QFont
+
+from views.components.item_card import card_texts
+from views.components.pixmap_cache import pixmap_cache
+from views.components.thumbnails import ThumbnailLoader, THUMB_WIDTH, THUMB_HEIGHT
+
+# Same geometry as ItemCard
+CARD_WIDTH = 250
+CARD_HEIGHT = 300
+CARD_MARGIN = 12
+IMAGE_HEIGHT = 140
+GRID_SPACING = 20
+
+
+class ItemListModel(QAbstractListModel):
+    """List model over item dicts, as returned by ItemManager."""
+
+    ItemIdRole = Qt.ItemDataRole.UserRole + 1
+    ItemRole = Qt.ItemDataRole.UserRole + 2
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._items: List[Dict] = []
+        self._rows: Dict[int, int] = {}  # item id -> row
+        self._waiting: Dict[str, List[int]] = {}  # image_path -> item ids
+        self._keys: Dict[str, tuple] = {}  # image_path -> pixmap_cache key (None: missing)
+        self._unreadable = set()  # image paths that failed to load
+        ThumbnailLoader.instance().thumbnail_ready.connect(self._on_thumbnail_ready)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._items)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        item = self._items[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return item['name']
+        if role == Qt.ItemDataRole.DecorationRole:
+            return self._pixmap_for(item)
+        if role == self.ItemIdRole:
+            return item['id']
+        if role == self.ItemRole:
+            return item
+        return None
+
+    def _pixmap_for(self, item: Dict):
+        """
+        Thumbnail of an item, requested the first time its row is painted.
+        Returns None while the thumbnail is still loading.
+        Called from paint(), so the cache key (which stats the file) is
+        resolved once per image until the next model reset.
+        """
+        image_path = item.get('image_path')
+        if not image_path or image_path in self._unreadable:
+            return None
+        waiting = self._waiting.get(image_path)
+        if waiting is not None:
+            # Still loading; _on_thumbnail_ready repaints the row
+            if item['id'] not in waiting:
+                waiting.append(item['id'])
+            return None
+        if image_path not in self._keys:
+            self._keys[image_path] = pixmap_cache.key(image_path, (THUMB_WIDTH, THUMB_HEIGHT))
+        key = self._keys[image_path]
+        if key is None:
+            return None  # File is missing
+        pixmap = pixmap_cache.get_by_key(key)
+        if pixmap is None:
+            self._waiting[image_path] = [item['id']]
+            ThumbnailLoader.instance().request(image_path)
+        return pixmap
+
+    def _on_thumbnail_ready(self, image_path: str, pixmap: QPixmap):
+        item_ids = self._waiting.pop(image_path, [])
+        if pixmap.isNull():
+            self._unreadable.add(image_path)
+        for item_id in item_ids:
+            row = self.row_of(item_id)
+            if row < 0:
+                continue
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+
+    def set_items(self, items: List[Dict]):
+        self.beginResetModel()
+        self._items = list(items)
+        self._waiting.clear()
+        self._keys.clear()
+        self._reindex()
+        self.endResetModel()
+
+    def append_items(self, items: List[Dict]):
+        if not items:
+            return
+        first = len(self._items)
+        self.beginInsertRows(QModelIndex(), first, first + len(items) - 1)
+        self._items.extend(items)
+        self._reindex(first)
+        self.endInsertRows()
+
+    def insert_item(self, row: int, item: Dict):
+        row = max(0, min(row, len(self._items)))
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._items.insert(row, item)
+        self._reindex(row)
+        self.endInsertRows()
+
+    def remove_item(self, item_id: int):
+        row = self.row_of(item_id)
+        if row < 0:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._items[row]
+        del self._rows[item_id]
+        self._reindex(row)
+        self.endRemoveRows()
+
+    def row_of(self, item_id: int) -> int:
+        return self._rows.get(item_id, -1)
+
+    def _reindex(self, start: int = 0):
+        if start == 0:
+            self._rows.clear()
+        for row in range(start, len(self._items)):
+            self._rows[self._items[row]['id']] = row
+
+
+class ItemCardDelegate(QStyledItemDelegate):
+    """Paints an item row the way ItemCard looks, without creating widgets."""
+
+    def sizeHint(self, option, index):
+        return QSize(CARD_WIDTH, CARD_HEIGHT)
+
+    def paint(self, painter: QPainter, option, index):
+        item = index.data(ItemListModel.ItemRole)
+        if item is None:
+            return
+        description, contact = card_texts(item)
+        selected = bool(option.state & QStyle.StateFlag.State_Selected)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # Card frame
+        rect = QRectF(option.rect).adjusted(1, 1, -1, -1)
+        path = QPainterPath()
+        path.addRoundedRect(rect, 10, 10)
+        painter.fillPath(path, QColor("#EBF5FB") if selected else QColor("white"))
+        border = QColor("#3498DB") if (selected or hovered) else QColor("#E0E0E0")
+        painter.setPen(QPen(border, 2 if (selected or hovered) else 1))
+        painter.drawPath(path)
+
+        content = option.rect.adjusted(CARD_MARGIN, CARD_MARGIN, -CARD_MARGIN, -CARD_MARGIN)
+
+        # Image
+        image_rect = QRect(content.x(), content.y(), content.width(), IMAGE_HEIGHT)
+        image_path = QPainterPath()
+        image_path.addRoundedRect(QRectF(image_rect), 5, 5)
+        painter.fillPath(image_path, QColor("#ECF0F1"))
+        pixmap = index.data(Qt.ItemDataRole.DecorationRole)
+        if pixmap is not None and not pixmap.isNull():
+            x = image_rect.x() + (image_rect.width() - pixmap.width()) // 2
+            y = image_rect.y() + (image_rect.height() - pixmap.height()) // 2
+            painter.drawPixmap(x, y, pixmap)
+        else:
+            painter.setPen(QColor("#7F8C8D"))
+            painter.drawText(image_rect, Qt.AlignmentFlag.AlignCenter, "No Image")
+
+        y = image_rect.bottom() + 8
+        flags = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop | Qt.TextFlag.TextWordWrap
+
+        # Title
+        font = QFont(option.font)
+        font.setBold(True)
+        font.setPixelSize(14)
+        painter.setFont(font)
+        painter.setPen(QColor("#2C3E50"))
+        name_rect = QRect(content.x(), y, content.width(), 40)
+        bounds = painter.boundingRect(name_rect, flags, item['name'])
+        painter.drawText(name_rect, flags, item['name'])
+        y += min(bounds.height(), 40) + 8
+
+        # Description
+        font.setBold(False)
+        font.setPixelSize(12)
+        painter.setFont(font)
+        painter.setPen(QColor("#7F8C8D"))
+        desc_text = description[:80] + "..." if len(description) > 80 else description
+        painter.drawText(QRect(content.x(), y, content.width(), 50), flags, desc_text)
+        y += 50 + 8
+
+        # Contact
+        font.setPixelSize(11)
+        painter.setFont(font)
+        painter.setPen(QColor("#95A5A6"))
+        contact_text = contact[:40] + "..." if len(contact) > 40 else contact
+        painter.drawText(QRect(content.x(), y, content.width(), content.bottom() - y), flags, contact_text)
+
+        painter.restore()
+
+
+class ItemGridView(QListView):
+    """Grid of items that only paints the rows in the viewport."""
+
+    item_clicked = pyqtSignal(int)  # item_id
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.item_model = ItemListModel(self)
+        self.setModel(self.item_model)
+        self.setItemDelegate(ItemCardDelegate(self))
+
+        self.setViewMode(QListView.ViewMode.IconMode)
+        self.setFlow(QListView.Flow.LeftToRight)
+        self.setWrapping(True)
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+        self.setMovement(QListView.Movement.Static)
+        self.setUniformItemSizes(True)
+        self.setGridSize(QSize(CARD_WIDTH + GRID_SPACING, CARD_HEIGHT + GRID_SPACING))
+        self.setSpacing(0)
+        self.setLayoutMode(QListView.LayoutMode.Batched)
+        self.setBatchSize(200)
+        self.setMouseTracking(True)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setCursor(Qt.CursorShape.PointingHandCursor)
+
+        self.clicked.connect(self._on_index_clicked)
+
+    def _on_index_clicked(self, index: QModelIndex):
+        item_id = index.data(ItemListModel.ItemIdRole)
+        if item_id is not None:
+            self.item_clicked.emit(item_id)
+
+    def select_item(self, item_id: int):
+        """Select the row of item_id (or clear selection if absent)."""
+        row = self.item_model.row_of(item_id)
+        if row < 0:
+            self.clearSelection()
+            return
+        self.setCurrentIndex(self.item_model.index(row))
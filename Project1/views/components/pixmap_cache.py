@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+# views/components/pixmap_cache.py
+"""
+Shared in-memory LRU cache of scaled pixmaps, keyed by
+(image path, file mtime, target size) and bounded by a byte budget.
+"""
+import os
+from collections import OrderedDict
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QPixmap
+
+# Default memory budget for cached pixmaps
+PIXMAP_CACHE_BYTES = 64 * 1024 * 1024
+
+
+class PixmapCache:
+    """LRU pixmap cache. Must only be used from the GUI thread."""
+
+    def __init__(self, max_bytes: int = PIXMAP_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (pixmap, cost)
+        self._bytes = 0
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    @staticmethod
+    def key(image_path: str, size: tuple):
+        """
+        Cache key for image_path at size (stats the file), or None if the
+        file is missing. Callers that look up the same image repeatedly can
+        resolve it once and use get_by_key().
+        """
+        try:
+            mtime = os.path.getmtime(image_path)
+        except OSError:
+            return None
+        return (image_path, mtime, tuple(size))
+
+    @staticmethod
+    def _cost(pixmap: QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+    def get(self, image_path: str, size: tuple) -> QPixmap:
+        """Cached pixmap for image_path scaled to size, or None."""
+        return self.get_by_key(self.key(image_path, size))
+
+    def get_by_key(self, key) -> QPixmap:
+        """Cached pixmap for a key from key(), or None."""
+        entry = self._entries.get(key) if key else None
+        if entry is None:
+            self._stats['misses'] += 1
+            return None
+        self._entries.move_to_end(key)
+        self._stats['hits'] += 1
+        return entry[0]
+
+    def put(self, image_path: str, size: tuple, pixmap: QPixmap):
+        """Store a pixmap, evicting least recently used entries over budget."""
+        key = self.key(image_path, size)
+        if key is None or pixmap.isNull():
+            return
+        cost = self._cost(pixmap)
+        if cost > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old[1]
+        self._entries[key] = (pixmap, cost)
+        self._bytes += cost
+        self._evict()
+
+    def load(self, image_path: str, size: tuple) -> QPixmap:
+        """
+        Get a pixmap from the cache, or decode and scale it from disk
+        (keeping aspect ratio) and cache it. Returns None if unreadable.
+        """
+        pixmap = self.get(image_path, size)
+        if pixmap is not None:
+            return pixmap
+        source = QPixmap(image_path)
+        if source.isNull():
+            return None
+        pixmap = source.scaled(
+            size[0], size[1],
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+        self.put(image_path, size, pixmap)
+        return pixmap
+
+    def set_budget(self, max_bytes: int):
+        """Change the memory budget, evicting as needed."""
+        self.max_bytes = max_bytes
+        self._evict()
+
+    def _evict(self):
+        while self._bytes > self.max_bytes and self._entries:
+            _, (_, cost) = self._entries.popitem(last=False)
+            self._bytes -= cost
+            self._stats['evictions'] += 1
+
+    def clear(self):
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict:
+        """Hit/miss/eviction counters plus current usage."""
+        stats = dict(self._stats)
+        lookups = stats['hits'] + stats['misses']
+        stats.update(
+            entries=len(self._entries),
+            bytes=self._bytes,
+            max_bytes=self.max_bytes,
+            hit_rate=stats['hits'] / lookups if lookups else 0.0
+        )
+        return stats
+
+
+# Global pixmap cache instance
+pixmap_cache = PixmapCache()
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+# views/components/thumbnails.py
+"""
+Thumbnail service: fixed-size thumbnails stored next to the uploads and
+decoded on a QThreadPool worker so the GUI thread never blocks on images.
+"""
+import os
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, Qt, pyqtSignal
+from PyQt6.QtGui import QImage, QPixmap
+
+from views.components.pixmap_cache import pixmap_cache
+
+# Card image area (card width - margins, image label height)
+THUMB_WIDTH = 226
+THUMB_HEIGHT = 140
+THUMB_DIR_NAME = "thumbs"
+
+
+def thumbnail_path(image_path: str) -> str:
+    """Path of the thumbnail for an upload: <uploads>/thumbs/<name>.png."""
+    directory, filename = os.path.split(image_path)
+    name = os.path.splitext(filename)[0]
+    return os.path.join(directory, THUMB_DIR_NAME, f"{name}.png")
+
+
+def create_thumbnail(image_path: str) -> str:
+    """
+    Scale an upload down to THUMB_WIDTH x THUMB_HEIGHT and save it.
+    Uses QImage, so it is safe to call from a worker thread.
+    Returns the thumbnail path, or None if the image cannot be read.
+    """
+    image = QImage(image_path)
+    if image.isNull():
+        return None
+    thumb = image.scaled(
+        THUMB_WIDTH, THUMB_HEIGHT,
+        Qt.AspectRatioMode.KeepAspectRatio,
+        Qt.TransformationMode.SmoothTransformation
+    )
+    path = thumbnail_path(image_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if not thumb.save(path, "PNG"):
+        return None
+    return path
+
+
+class _ThumbnailSignals(QObject):
+    finished = pyqtSignal(str, QImage)  # image_path, thumbnail (null on failure)
+
+
+class _ThumbnailTask(QRunnable):
+    """Loads (and if needed, generates) one thumbnail off the GUI thread."""
+
+    def __init__(self, image_path: str):
+        super().__init__()
+        self.image_path = image_path
+        self.signals = _ThumbnailSignals()
+
+    def run(self):
+        image = QImage()
+        path = thumbnail_path(self.image_path)
+        if os.path.exists(path):
+            image = QImage(path)
+        if image.isNull() and os.path.exists(self.image_path):
+            # Uploads made before thumbnails existed get one generated now
+            path = create_thumbnail(self.image_path)
+            if path:
+                image = QImage(path)
+        self.signals.finished.emit(self.image_path, image)
+
+
+class ThumbnailLoader(QObject):
+    """
+    Process-wide asynchronous thumbnail loader.
+    Call request(); the receiver passed with it is called on the GUI
+    thread once that path is decoded. thumbnail_ready fires for every
+    path, for listeners that track many paths themselves (one receiver
+    per card would otherwise see every other card's thumbnail).
+    Decoded thumbnails are kept in pixmap_cache, so check it first.
+    """
+
+    thumbnail_ready = pyqtSignal(str, QPixmap)  # image_path, thumbnail
+
+    _instance = None
+
+    @classmethod
+    def instance(cls) -> "ThumbnailLoader":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        super().__init__()
+        self._pool = QThreadPool.globalInstance()
+        self._pending = {}    # image_path -> in-flight task
+        self._receivers = {}  # image_path -> [receiver(image_path, pixmap)]
+
+    def request(self, image_path: str, receiver=None):
+        """
+        Queue loading of image_path's thumbnail (deduplicated).
+        receiver(image_path, pixmap) is called once it is ready.
+        """
+        if receiver is not None:
+            self._receivers.setdefault(image_path, []).append(receiver)
+        if image_path in self._pending:
+            return
+        task = _ThumbnailTask(image_path)
+        task.signals.finished.connect(self._on_finished)
+        self._pending[image_path] = task
+        self._pool.start(task)
+
+    def cancel(self, image_path: str, receiver):
+        """Stop delivering image_path to receiver (e.g. its widget is gone)."""
+        receivers = self._receivers.get(image_path)
+        if receivers and receiver in receivers:
+            receivers.remove(receiver)
+            if not receivers:
+                del self._receivers[image_path]
+
+    def _on_finished(self, image_path: str, image: QImage):
+        self._pending.pop(image_path, None)
+        # QPixmap must be created on the GUI thread; a null pixmap means
+        # the image could not be read
+        pixmap = QPixmap() if image.isNull() else QPixmap.fromImage(image)
+        pixmap_cache.put(image_path, (THUMB_WIDTH, THUMB_HEIGHT), pixmap)
+        for receiver in self._receivers.pop(image_path, []):
+            receiver(image_path, pixmap)
+        self.thumbnail_ready.emit(image_path, pixmap)
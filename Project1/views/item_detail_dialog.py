@@ -9,7 +9,9 @@ from PyQt6.QtWidgets import (
     QScrollArea, QWidget, QFrame
 )
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont, QPixmap
+from PyQt6.QtGui import QFont
+
+from views.components.pixmap_cache import pixmap_cache
 
 
 class ItemDetailDialog(QDialog):
@@ -63,14 +65,11 @@ class ItemDetailDialog(QDialog):
         
         # Load image if path provided
         image_path = self.item_data.get('image_path')
+        pixmap = None
         if image_path and os.path.exists(image_path):
-            pixmap = QPixmap(image_path)
-            scaled = pixmap.scaled(
-                450, 250,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            image_label.setPixmap(scaled)
+            pixmap = pixmap_cache.load(image_path, (450, 250))
+        if pixmap is not None:
+            image_label.setPixmap(pixmap)
         else:
             image_label.setText("No Image")
         content_layout.addWidget(image_label)
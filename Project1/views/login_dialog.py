@@ -172,6 +172,11 @@ class LoginDialog(QDialog):
         password = self.password_input.text()
         self.login_requested.emit(username, password)
 
+    def set_busy(self, busy: bool):
+        """Disable the form while credentials are being checked."""
+        self.login_btn.setEnabled(not busy)
+        self.login_btn.setText("Signing in..." if busy else "Login")
+
     def show_error(self, message: str):
         QMessageBox.warning(self, "Login Failed", message)
 
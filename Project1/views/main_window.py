@@ -6,12 +6,13 @@ Main Window: User dashboard with category filtering and item display.
 from typing import List, Dict, Optional
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit,
-    QScrollArea, QLabel, QFrame, QComboBox
+    QScrollArea, QLabel, QFrame, QComboBox, QStackedWidget
 )
-from PyQt6.QtCore import pyqtSignal, Qt, QFile, QTextStream
+from PyQt6.QtCore import pyqtSignal, Qt, QTimer
 
 from views.components.flow_layout import FlowLayout
-from views.components.item_card import ItemCard
+from views.components.item_card import ItemCard, card_texts
+from views.components.item_grid_view import ItemGridView
 
 class MainWindow(QWidget):
     """Main user dashboard with category-based browsing."""
@@ -24,28 +25,47 @@ class MainWindow(QWidget):
     logout_requested = pyqtSignal()
     admin_panel_requested = pyqtSignal()
     item_detail_requested = pyqtSignal(int)  # item_id
+    load_more_requested = pyqtSignal()  # Scrolled near the end of the loaded page
+    
+    # Distance (px) from the bottom at which the next page is requested
+    LOAD_MORE_THRESHOLD = 300
+    # Above this many loaded items the grid switches from ItemCard widgets
+    # to the virtualized ItemGridView, which only paints visible rows
+    VIRTUALIZE_THRESHOLD = 200
+    # Quiet period after the last keystroke before a live search runs
+    SEARCH_DEBOUNCE_MS = 250
+    # New cards created per event-loop tick during a refresh
+    CARD_BATCH_SIZE = 20
     
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Campus Xianyu - Item Revival System")
         self.setGeometry(200, 200, 1000, 750)
         
-        self._load_styles()
-        
         self._selected_item_id: Optional[int] = None
         self._cards: Dict[int, ItemCard] = {}
         self._current_user = None
         self._item_types = []
         self._items_data: Dict[int, Dict] = {}  # Store item data for detail view
+        self._has_more = False       # More pages available from the controller
+        self._loading_more = False   # A next-page request is in flight
+        self._virtualized = False    # Showing ItemGridView instead of cards
+        self._last_search = None     # (type_id, keyword) last emitted
+        self._card_order: List[int] = []   # Item ids in display order (incl. pending)
+        self._pending_cards: List[Dict] = []  # Items whose cards are not built yet
+        
+        self._card_timer = QTimer(self)
+        self._card_timer.setSingleShot(True)
+        self._card_timer.setInterval(0)
+        self._card_timer.timeout.connect(self._build_pending_cards)
+        
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._on_search_debounced)
 
         self.setup_ui()
 
-    def _load_styles(self):
-        file = QFile("assets/styles.qss")
-        if file.open(QFile.OpenModeFlag.ReadOnly | QFile.OpenModeFlag.Text):
-            stream = QTextStream(file)
-            self.setStyleSheet(stream.readAll())
-
     def setup_ui(self):
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(20, 20, 20, 20)
@@ -93,6 +113,11 @@ class MainWindow(QWidget):
 
         filter_bar.addStretch()
 
+        self.loading_label = QLabel("Loading...")
+        self.loading_label.setStyleSheet("color: #7F8C8D;")
+        self.loading_label.setVisible(False)
+        filter_bar.addWidget(self.loading_label)
+
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search by name or description...")
         self.search_input.setFixedWidth(250)
@@ -113,15 +138,25 @@ class MainWindow(QWidget):
         main_layout.addLayout(filter_bar)
 
         # Content Area
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
+        self.scroll_area = QScrollArea()
+        self.scroll_area.setWidgetResizable(True)
         
         self.scroll_content = QWidget()
         self.scroll_content.setObjectName("ScrollContents")
         self.flow_layout = FlowLayout(self.scroll_content, margin=10, h_spacing=20, v_spacing=20)
         
-        scroll_area.setWidget(self.scroll_content)
-        main_layout.addWidget(scroll_area)
+        self.scroll_area.setWidget(self.scroll_content)
+        
+        self.grid_view = ItemGridView()
+        self.grid_view.item_clicked.connect(self.on_card_clicked)
+        
+        self.view_stack = QStackedWidget()
+        self.view_stack.addWidget(self.scroll_area)
+        self.view_stack.addWidget(self.grid_view)
+        for view in (self.scroll_area, self.grid_view):
+            view.verticalScrollBar().valueChanged.connect(self._maybe_load_more)
+            view.verticalScrollBar().rangeChanged.connect(self._maybe_load_more)
+        main_layout.addWidget(self.view_stack)
 
         # Bottom Bar
         action_layout = QHBoxLayout()
@@ -146,6 +181,7 @@ class MainWindow(QWidget):
         self.add_button.clicked.connect(self.add_item_requested.emit)
         self.search_button.clicked.connect(self.on_search_clicked)
         self.search_input.returnPressed.connect(self.on_search_clicked)
+        self.search_input.textChanged.connect(self._search_timer.start)
         self.clear_search_button.clicked.connect(self.on_clear_search_clicked)
         self.delete_button.clicked.connect(self.on_delete_clicked)
 
@@ -177,6 +213,10 @@ class MainWindow(QWidget):
         if types:
             self.category_changed.emit(types[0]['id'])
 
+    def set_loading(self, loading: bool):
+        """Show or hide the loading indicator while items are fetched."""
+        self.loading_label.setVisible(loading)
+
     def get_selected_type_id(self) -> int:
         return self.category_combo.currentData() or 0
 
@@ -190,7 +230,9 @@ class MainWindow(QWidget):
             self._cards[self._selected_item_id].set_selected(False)
         
         self._selected_item_id = item_id
-        if item_id in self._cards:
+        if self._virtualized:
+            self.grid_view.select_item(item_id)
+        elif item_id in self._cards:
             self._cards[item_id].set_selected(True)
             
         self.delete_button.setEnabled(True)
@@ -199,65 +241,233 @@ class MainWindow(QWidget):
         self.item_detail_requested.emit(item_id)
 
     def on_search_clicked(self):
+        self._search_timer.stop()
+        type_id = self.get_selected_type_id()
+        keyword = self.search_input.text().strip()
+        self._last_search = (type_id, keyword)
+        self.search_requested.emit(type_id, keyword)
+
+    def _on_search_debounced(self):
+        """Live search once typing pauses; skips unchanged keywords."""
         type_id = self.get_selected_type_id()
         keyword = self.search_input.text().strip()
+        if (type_id, keyword) == self._last_search:
+            return
+        self._last_search = (type_id, keyword)
         self.search_requested.emit(type_id, keyword)
         
     def on_clear_search_clicked(self):
         self.search_input.clear()
+        self._search_timer.stop()
+        self._last_search = None
         self.on_category_changed()
 
     def on_delete_clicked(self):
         if self._selected_item_id:
             self.delete_item_requested.emit(self._selected_item_id)
 
-    def update_view(self, items: List[Dict]):
-        """Refresh the grid of cards."""
-        while self.flow_layout.count():
-            item = self.flow_layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
+    def update_view(self, items: List[Dict], has_more: bool = False):
+        """
+        Refresh the grid with the first page of items.
+        Cards whose item is unchanged are kept; only the difference is
+        removed or built, and new cards are built in batches.
+        """
+        if len(items) > self.VIRTUALIZE_THRESHOLD:
+            self._reset_view()
+            self.append_items(items, has_more)
+            return
+
+        if self._virtualized:
+            self._virtualized = False
+            self.grid_view.item_model.set_items([])
+            self.view_stack.setCurrentWidget(self.scroll_area)
+
+        new_data = {item['id']: item for item in items}
+        self.scroll_content.setUpdatesEnabled(False)
+        try:
+            with self.flow_layout.batch():
+                kept = self._diff_cards(items, new_data)
+        finally:
+            self.scroll_content.setUpdatesEnabled(True)
+
+        self._items_data = new_data
+        if self._selected_item_id not in new_data:
+            self._selected_item_id = None
+            self.delete_button.setEnabled(False)
+        if not kept:
+            self.scroll_area.verticalScrollBar().setValue(0)
+
+        self._finish_page(has_more)
+
+    def _diff_cards(self, items: List[Dict], new_data: Dict[int, Dict]) -> int:
+        """Drop stale cards, reorder kept ones and queue the rest. Returns kept count."""
+        self._pending_cards = []
+        for item_id in list(self._cards):
+            if new_data.get(item_id) != self._items_data.get(item_id):
+                self._remove_card(item_id)
+
+        order = [item['id'] for item in items]
+        kept = [item_id for item_id in order if item_id in self._cards]
+        current = [self.flow_layout.itemAt(i).widget().item_id_int
+                   for i in range(self.flow_layout.count())]
+        if current != kept:
+            # Rare (listings are ordered newest first); re-add in the new order
+            while self.flow_layout.count():
+                self.flow_layout.takeAt(0)
+            for item_id in kept:
+                self.flow_layout.addWidget(self._cards[item_id])
+
+        self._card_order = order
+        self._pending_cards = [item for item in items if item['id'] not in self._cards]
+        if self._pending_cards:
+            self._card_timer.start()
+        return len(kept)
+
+    def append_items(self, items: List[Dict], has_more: bool = False):
+        """Append the next page of items to the grid, skipping items already shown."""
+        items = [item for item in items if item['id'] not in self._items_data]
+        if not self._virtualized and len(self._items_data) + len(items) > self.VIRTUALIZE_THRESHOLD:
+            self._switch_to_virtual_grid()
         
-        self._cards.clear()
+        for item in items:
+            self._items_data[item['id']] = item
+        if self._virtualized:
+            self.grid_view.item_model.append_items(items)
+        else:
+            self._card_order.extend(item['id'] for item in items)
+            self._pending_cards.extend(items)
+            self._card_timer.start()
+        
+        self._finish_page(has_more)
+
+    def insert_item(self, item: Dict):
+        """Show a newly added item first in the grid without reloading it."""
+        if item['id'] in self._items_data:
+            return
+        self._items_data = {item['id']: item, **self._items_data}
+        if self._virtualized:
+            self.grid_view.item_model.insert_item(0, item)
+            return
+        # Nothing comes before it, so it never has to wait for queued cards
+        self._card_order.insert(0, item['id'])
+        self.flow_layout.insertWidget(0, self._create_card(item))
+
+    def remove_item(self, item_id: int):
+        """Drop a deleted item from the grid without reloading it."""
+        if self._items_data.pop(item_id, None) is None:
+            return
+        if self._selected_item_id == item_id:
+            self._selected_item_id = None
+            self.delete_button.setEnabled(False)
+        if self._virtualized:
+            self.grid_view.item_model.remove_item(item_id)
+            return
+        self._card_order.remove(item_id)
+        if item_id in self._cards:
+            self._remove_card(item_id)
+        else:
+            self._pending_cards = [i for i in self._pending_cards if i['id'] != item_id]
+
+    def load_more_failed(self):
+        """The requested next page will not arrive; allow another request."""
+        self._loading_more = False
+
+    def _finish_page(self, has_more: bool):
+        self._has_more = has_more
+        self._loading_more = False
+        # The new page may not fill the viewport; check once layout settles
+        QTimer.singleShot(0, self._maybe_load_more)
+
+    def _reset_view(self):
+        """Forget all loaded items and return to an empty card grid."""
+        self._clear_cards()
         self._items_data.clear()
         self._selected_item_id = None
         self.delete_button.setEnabled(False)
+        self.scroll_area.verticalScrollBar().setValue(0)
+        self._virtualized = False
+        self.grid_view.item_model.set_items([])
+        self.view_stack.setCurrentWidget(self.scroll_area)
 
-        for item in items:
-            # Store item data for detail view
-            self._items_data[item['id']] = item
-            
-            custom_text = ""
-            custom_values = item.get('custom_values', {})
-            if custom_values:
-                custom_text = " | ".join([f"{k}: {v}" for k, v in custom_values.items()])
-            
-            description = item.get('description', '')
-            if custom_text:
-                description = f"{description}\n\n{custom_text}"
-            
-            card = ItemCard(
-                item_id=str(item['id']),
-                name=item['name'],
-                description=description,
-                contact=f"{item.get('contact_phone', '')} | {item.get('location', '')}",
-                image_path=item.get('image_path')
-            )
-            # Disconnect existing clicked connection if any
-            try:
-                card.clicked.disconnect()
-            except TypeError:
-                pass  # No connections to disconnect
-            card.item_id_int = item['id']
-            card.clicked.connect(lambda id_str, iid=item['id']: self.on_card_clicked(iid))
-            
-            self.flow_layout.addWidget(card)
-            self._cards[item['id']] = card
+    def _switch_to_virtual_grid(self):
+        """Move the loaded items from card widgets into the virtualized view."""
+        self._clear_cards()
+        self._virtualized = True
+        self.grid_view.item_model.set_items(list(self._items_data.values()))
+        if self._selected_item_id:
+            self.grid_view.select_item(self._selected_item_id)
+        self.view_stack.setCurrentWidget(self.grid_view)
+
+    def _clear_cards(self):
+        self._card_timer.stop()
+        self._pending_cards = []
+        self._card_order = []
+        self.scroll_content.setUpdatesEnabled(False)
+        with self.flow_layout.batch():
+            while self.flow_layout.count():
+                item = self.flow_layout.takeAt(0)
+                widget = item.widget()
+                if widget:
+                    widget.deleteLater()
+        self.scroll_content.setUpdatesEnabled(True)
+        self._cards.clear()
+
+    def _remove_card(self, item_id: int):
+        card = self._cards.pop(item_id)
+        index = self.flow_layout.indexOf(card)
+        if index >= 0:
+            self.flow_layout.takeAt(index)
+        card.deleteLater()
+
+    def _build_pending_cards(self):
+        """Build the next batch of queued cards, then yield to the event loop."""
+        batch = self._pending_cards[:self.CARD_BATCH_SIZE]
+        del self._pending_cards[:self.CARD_BATCH_SIZE]
+        positions = {item_id: i for i, item_id in enumerate(self._card_order)}
+
+        self.scroll_content.setUpdatesEnabled(False)
+        with self.flow_layout.batch():
+            for item in batch:
+                # Queued items are in display order, so every card before
+                # this position is already in the layout
+                self.flow_layout.insertWidget(positions[item['id']], self._create_card(item))
+        self.scroll_content.setUpdatesEnabled(True)
+
+        if self._pending_cards:
+            self._card_timer.start()
+
+    def _create_card(self, item: Dict) -> ItemCard:
+        description, contact = card_texts(item)
+        card = ItemCard(
+            item_id=str(item['id']),
+            name=item['name'],
+            description=description,
+            contact=contact,
+            image_path=item.get('image_path')
+        )
+        card.item_id_int = item['id']
+        card.clicked.connect(self._on_card_widget_clicked)
+        if item['id'] == self._selected_item_id:
+            card.set_selected(True)
+        self._cards[item['id']] = card
+        return card
+
+    def _on_card_widget_clicked(self, item_id: str):
+        """Shared click handler for all cards."""
+        self.on_card_clicked(int(item_id))
+
+    def _maybe_load_more(self, *args):
+        """Request the next page when the scroll position nears the bottom."""
+        if not self._has_more or self._loading_more:
+            return
+        scroll_bar = self.view_stack.currentWidget().verticalScrollBar()
+        if scroll_bar.maximum() - scroll_bar.value() <= self.LOAD_MORE_THRESHOLD:
+            self._loading_more = True
+            self.load_more_requested.emit()
 
     def get_selected_item_name(self) -> Optional[str]:
-        if self._selected_item_id and self._selected_item_id in self._cards:
-            return self._cards[self._selected_item_id].lbl_name.text()
+        if self._selected_item_id and self._selected_item_id in self._items_data:
+            return self._items_data[self._selected_item_id]['name']
         return None
 
     def get_item_data(self, item_id: int) -> Optional[Dict]:
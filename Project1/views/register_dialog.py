@@ -107,6 +107,11 @@ class RegisterDialog(QDialog):
             self.address_input.text().strip()
         )
 
+    def set_busy(self, busy: bool):
+        """Disable the form while the registration is being submitted."""
+        self.register_btn.setEnabled(not busy)
+        self.register_btn.setText("Submitting..." if busy else "Submit Registration")
+
     def show_error(self, message: str):
         QMessageBox.warning(self, "Registration Failed", message)
 